@@ -0,0 +1,39 @@
+
+# Checkpoint files of long runs (see Model_Basic.Save_Checkpoint) : a pickled dictionary, written
+# aside and renamed so that a crash during the write leaves the previous checkpoint intact.
+
+import os
+import pickle
+
+def Save(File_Name, State):
+	Temporary_Name = File_Name + ".%d.tmp"%os.getpid()
+	with open(Temporary_Name, 'wb') as Checkpoint_File:
+		pickle.dump(State, Checkpoint_File, protocol = pickle.HIGHEST_PROTOCOL)
+		Checkpoint_File.flush()
+		os.fsync(Checkpoint_File.fileno())
+	os.replace(Temporary_Name, File_Name)
+
+def Load(File_Name):
+	with open(File_Name, 'rb') as Checkpoint_File:
+		return pickle.load(Checkpoint_File)
+
+def Read_Files(File_Names):
+	Contents = {}
+	for File_Name in File_Names:
+		with open(File_Name, 'rb') as Saved_File:
+			Contents[File_Name] = Saved_File.read()
+	return Contents
+
+def Write_Files(Contents):
+	for File_Name in Contents:
+		with open(File_Name, 'wb') as Saved_File:
+			Saved_File.write(Contents[File_Name])
+
+# Files only appended to (e.g. the ensemble snapshots) are restored by cutting the rows written after the checkpoint.
+def File_Sizes(File_Names):
+	return {File_Name:os.path.getsize(File_Name) for File_Name in File_Names}
+
+def Truncate_Files(Sizes):
+	for File_Name in Sizes:
+		if os.path.exists(File_Name) and os.path.getsize(File_Name) > Sizes[File_Name]:
+			os.truncate(File_Name, Sizes[File_Name])
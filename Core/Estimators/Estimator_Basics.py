@@ -1,34 +1,67 @@
-
-
-# Empirical Data for Estimation : Histogram or Ensemble Data
-class Source():
-	def __init__(self):
-		self.Analysis = ""
-		self.Type = ""
-		self.Variable_Names = []
-		
-	def Init_Source_Realtime(self, Simulation_Nodes):
-		pass
-		
-	def Update_Source_Realtime(self, State_Space, Update_Buffer):
-		pass
-		
-	def Init_Source_Post_Analysis(self, Nodes, Ensemble_Data_File):
-		pass
-
-class Estimator():
-	def __init__(self):
-		self.Name = ""
-		self.Source = Source()
-		
-	def Entropy(self, For = []):
-		raise NotImplementedError("Need to override this function")
-		
-	def Conditional_Entropy(self, For = [], Known = []):
-		raise NotImplementedError("Need to override this function")
-		
-	def Mutual_Information(self, For = [], Known = []):
-		raise NotImplementedError("Need to override this function")
-		
-	def Multiple_Mutual_Information(self, For = [], Known = []):
-		pass
+
+
+import copy
+import itertools
+
+# Empirical Data for Estimation : Histogram or Ensemble Data
+class Source():
+	def __init__(self):
+		self.Analysis = ""
+		self.Type = ""
+		self.Variable_Names = []
+		
+	def Init_Source_Realtime(self, Simulation_Nodes):
+		pass
+		
+	def Update_Source_Realtime(self, State_Space, Update_Buffer):
+		pass
+		
+	# Many members at once : State_Space and Update_Buffer map each node to an array over the members.
+	def Update_Source_Realtime_Batch(self, State_Space, Update_Buffer):
+		pass
+		
+	def Init_Source_Post_Analysis(self, Nodes, Ensemble_Data_File):
+		pass
+
+class Estimator():
+	def __init__(self):
+		self.Name = ""
+		self.Source = Source()
+		
+	def Entropy(self, For = []):
+		raise NotImplementedError("Need to override this function")
+		
+	def Conditional_Entropy(self, For = [], Known = []):
+		raise NotImplementedError("Need to override this function")
+		
+	def Mutual_Information(self, For = [], Known = []):
+		raise NotImplementedError("Need to override this function")
+		
+	# Co-information I(X_1;...;X_n|Z) (McGill), by inclusion-exclusion over the subsets S of For :
+	# sum_S (-1)^(|S|+1) H(S,Z) - H(Z). Each joint entropy is requested once, from Subset_Entropy.
+	def Multiple_Mutual_Information(self, For = [], Known = []):
+		Value = -self.Subset_Entropy(Known)
+		for Size in range(1, len(For)+1):
+			for Subset in itertools.combinations(For, Size):
+				Value = Value + (-1)**(Size+1) * self.Subset_Entropy(list(Subset)+list(Known))
+		return Value
+		
+	# Total correlation (multi-information) sum_i H(X_i|Z) - H(X_1,...,X_n|Z)
+	# = sum_i H(X_i,Z) - H(X_1,...,X_n,Z) - (n-1) H(Z).
+	def Total_Correlation(self, For = [], Known = []):
+		Value = -(len(For)-1)*self.Subset_Entropy(Known) - self.Subset_Entropy(list(For)+list(Known))
+		for X in For:
+			Value = Value + self.Subset_Entropy([X]+list(Known))
+		return Value
+		
+	# Joint entropy of Names (0 for no variable); estimators holding all the subset entropies of their
+	# source at once serve them from there.
+	def Subset_Entropy(self, Names):
+		Names = list(dict.fromkeys(Names))
+		if len(Names) == 0:
+			return 0
+		return self.Entropy(For = Names)
+		
+	# An independent copy that can run concurrently with this estimator.
+	def Clone(self, Seed = None):
+		return copy.deepcopy(self)
@@ -0,0 +1,158 @@
+"""
+Gaussian.py
+
+Closed-form (linear-Gaussian) estimator of entropies and (conditional)
+mutual informations from covariance matrices.
+
+Main Idea
+---------
+If the ensemble is treated as jointly Gaussian, every quantity of the
+framework follows from log-determinants of covariance sub-matrices :
+
+    H(S) = 1/2 [ |S| log(2 pi e) + log det C_S ]
+    I(X;Y|Z) = H(X,Z) + H(Y,Z) - H(X,Y,Z) - H(Z)
+
+One covariance matrix per data set costs O(N d^2), against the
+neighbour searches of KSG. The sub-matrices are evaluated in batches :
+
+- for a small number of variables (up to `Max_Batch_Variables`), the
+  log-determinants of all the subsets are computed at once, stacked by
+  size into one `numpy.linalg.slogdet` call, when the first quantity is
+  requested;
+- a Source can hold several data sets (e.g. all the snapshots of a run,
+  `Source.Init_Source_Snapshots`), in which case every quantity is an
+  array with one value per data set, as for the replicate estimators of
+  Simple_Binning.
+
+This makes it a fast screening estimator before a KSG post-analysis
+(see `Model_Basic.Gaussian_Screening`).
+
+Core References
+---------------
+Cover, T. M., & Thomas, J. A. (2006).
+Elements of Information Theory. (Chapter 8, differential entropy of
+the multivariate normal distribution.)
+
+Barnett, L., Barrett, A. B., & Seth, A. K. (2009).
+Granger causality and transfer entropy are equivalent for Gaussian
+variables.
+Physical Review Letters, 103, 238701.
+
+Notes
+-----
+- The values are exact for Gaussian data and, in general, capture the
+  linear dependencies only (a lower bound of the MI for a given
+  covariance). Entropies are differential entropies in nats.
+- A relative ridge `Ridge` is added to the diagonal so that constant or
+  collinear columns give large finite values instead of infinities.
+"""
+
+import copy
+import itertools
+import math
+
+import numpy
+
+from Core.Estimators import Estimator_Basics
+from Core.Estimators import KSG
+
+# Log-determinants of the sub-matrices of Covariances (..., d, d) over each subset of column indices,
+# one slogdet call per subset size : {subset : array (...)}.
+def Log_Determinants(Covariances, Subsets):
+	Covariances = numpy.asarray(Covariances)
+	By_Size = {}
+	for Subset in Subsets:
+		By_Size.setdefault(len(Subset), []).append(tuple(Subset))
+	Values = {}
+	for Size, Group in By_Size.items():
+		Index = numpy.array(Group) # (subsets, Size)
+		Blocks = Covariances[..., Index[:, :, None], Index[:, None, :]] # (..., subsets, Size, Size)
+		Sign, Log_Det = numpy.linalg.slogdet(Blocks)
+		Log_Det = numpy.where(Sign > 0, Log_Det, -numpy.inf)
+		for i, Subset in enumerate(Group):
+			Values[Subset] = Log_Det[..., i]
+	return Values
+
+class Source(KSG.Source):
+	def __init__(self, Ensemble_Size):
+		super().__init__(Ensemble_Size)
+		self.Ridge = 1e-10
+
+	# (data sets, d, d) covariance matrices of the variables, computed once per data set.
+	@property
+	def Covariances(self):
+		if "Covariances" not in self.Cache:
+			self.Cache["Covariances"] = self._Covariance(self.Data)[None, :, :]
+		return self.Cache["Covariances"]
+
+	def _Covariance(self, Data):
+		Covariance = numpy.atleast_2d(numpy.cov(Data, rowvar = False))
+		Diagonal = numpy.diag(Covariance)
+		return Covariance + numpy.diag(self.Ridge * Diagonal + 1e-300)
+
+	# Several snapshots (each a file, or a list of files pooled into one ensemble) held at once :
+	# the estimator then returns one value per snapshot.
+	def Init_Source_Snapshots(self, Nodes, Ensemble_Data_Files):
+		Covariances = []
+		for Ensemble_Data_File in Ensemble_Data_Files:
+			self.Init_Source_Post_Analysis(Nodes, Ensemble_Data_File)
+			Covariances.append(self._Covariance(self.Data))
+		self.Ensemble = []
+		self.Cache["Covariances"] = numpy.array(Covariances)
+
+class Estimator(Estimator_Basics.Estimator):
+	def __init__(self, Ensemble_Size):
+		self.Name = "Gaussian_estimator"
+
+		self.Max_Batch_Variables = 12
+
+		self.Source = Source(Ensemble_Size)
+
+	def Entropy(self, For = []):
+		Subset = tuple(sorted(self.Source.Column_Index[Name] for Name in For))
+		Log_Det = self._Log_Determinant(Subset)
+		return self._Value(0.5*(len(Subset)*math.log(2*math.pi*math.e) + Log_Det))
+
+	def Conditional_Entropy(self, For = [], Known = []):
+		if len(Known) == 0 :
+			Value = self.Entropy(For)
+		else:
+			Value = self.Entropy(For+Known) - self.Entropy(Known)
+		return Value
+
+	def Mutual_Information(self, For = [], Known = []):
+		X = [For[0]]
+		Y = [For[1]]
+		Z = list(Known)
+		Value = self.Entropy(X+Z) + self.Entropy(Y+Z) - self.Entropy(X+Y+Z)
+		if len(Z) != 0:
+			Value = Value - self.Entropy(Z)
+		return Value
+
+	def Clone(self, Seed = None):
+		The_Clone = copy.copy(self)
+		The_Clone.Source = copy.copy(self.Source)
+		The_Clone.Source.Variable_Names = []
+		The_Clone.Source.Ensemble = []
+		return The_Clone
+
+	# The log-determinants of every subset are computed together when the data set is first used
+	# (or, with many variables, each subset on request), then served from the source cache.
+	def _Log_Determinant(self, Subset):
+		Key = ("Log_Det", Subset)
+		if Key not in self.Source.Cache:
+			d = len(self.Source.Variable_Names)
+			if d <= self.Max_Batch_Variables and ("Log_Det", "all") not in self.Source.Cache:
+				Subsets = [S for Size in range(1, d+1) for S in itertools.combinations(range(d), Size)]
+				Values = Log_Determinants(self.Source.Covariances, Subsets)
+				self.Source.Cache[("Log_Det", "all")] = True
+			else:
+				Values = Log_Determinants(self.Source.Covariances, [Subset])
+			for S in Values:
+				self.Source.Cache[("Log_Det", S)] = Values[S]
+		return self.Source.Cache[Key]
+
+	def _Value(self, Values):
+		if Values.shape == (1,):
+			return float(Values[0])
+		return Values
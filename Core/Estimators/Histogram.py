@@ -0,0 +1,40 @@
+"""
+Histogram.py
+
+Plug-in (histogram) entropy helpers shared by the estimators that reduce
+a joint space to a table of counts.
+
+Samples are given as (N, d) arrays whose rows are joint states; any
+values may be used as long as equal states have equal rows. Entropies
+are in nats, matching the other estimators.
+"""
+
+import numpy
+
+def Joint_Codes(Columns):
+	Columns = numpy.asarray(Columns)
+	if Columns.ndim == 1:
+		Columns = Columns.reshape(-1,1)
+	_, Codes = numpy.unique(Columns, axis = 0, return_inverse = True)
+	return Codes.reshape(-1)
+
+def Counts_of_(Columns):
+	Columns = numpy.asarray(Columns)
+	if Columns.ndim == 1:
+		Columns = Columns.reshape(-1,1)
+	_, Counts = numpy.unique(Columns, axis = 0, return_counts = True)
+	return Counts
+
+# Counts can hold several tables at once; the entropy is taken along `axis`.
+def Entropy_from_Counts(Counts, axis = -1):
+	Counts = numpy.asarray(Counts, dtype = float)
+	Total = numpy.sum(Counts, axis = axis, keepdims = True)
+	if numpy.any(Total == 0):
+		raise ValueError("ERROR : ZERO STAT")
+	P = Counts / Total
+	with numpy.errstate(divide = "ignore", invalid = "ignore"):
+		Terms = numpy.where(P > 0, P * numpy.log(P), 0.0)
+	return -numpy.sum(Terms, axis = axis)
+
+def Plugin_Entropy(Columns):
+	return float(Entropy_from_Counts(Counts_of_(Columns)))
@@ -1,165 +1,269 @@
-
-import numpy
-from scipy.special import digamma
-from sklearn.neighbors import NearestNeighbors
-
-from Core.Estimators import Estimator_Basics
-
-class Source(Estimator_Basics.Source):
-	def __init__(self, Ensemble_Size):
-		self.Analysis = "Post_Analysis"
-		self.Type = "Pairwise"
-		self.Ensemble_Size = Ensemble_Size
-		
-		self.Variable_Names = []
-		self.Ensemble = []
-		
-	def Init_Source_Realtime(self, Simulation_Nodes):
-		if self.Analysis != "Realtime":
-			return
-		self.Variable_Names = []
-		for X in Simulation_Nodes:
-			self.Variable_Names.append(X)
-			self.Variable_Names.append(X+"'")
-		self.Ensemble = []
-		
-	def Update_Source_Realtime(self, State_Space, Update_Buffer):
-		if self.Analysis != "Realtime":
-			return
-		state_value_list = []
-		for Name in self.Variable_Names:
-			if Name[-1] == "'":
-				state_value_list.append(Update_Buffer[Name[:-1]])
-			else:
-				state_value_list.append(State_Space[Name])
-		self.Ensemble.append(state_value_list)
-		
-	def Init_Source_Post_Analysis(self, Nodes, Ensemble_Data_File):
-		self.Variable_Names = []
-		for X in Nodes:
-			self.Variable_Names.append(X)
-			self.Variable_Names.append(X+"'")
-			
-		self.Ensemble = []
-		Data_File = open(Ensemble_Data_File, 'r')
-		for f in range(self.Ensemble_Size):
-			data_line = Data_File.readline()
-			data_list = []
-			for d in data_line.split("|"):
-				data_list.append(float(d))
-			self.Ensemble.append(data_list)
-		self.Ensemble = numpy.asarray(self.Ensemble)
-		Data_File.close()
-		if self.Ensemble.shape[1] != len(self.Variable_Names):
-			raise ValueError("Check ensemble shape :" + str(self.Ensemble.shape))
-			
-class Estimator(Estimator_Basics.Estimator):
-	def __init__(self, Ensemble_Size):
-		self.Name = "KSG_estimator"
-		
-		self.k = 10
-		self.jitter = 1e-10
-		
-		self.RNG = numpy.random.default_rng(0)
-		
-		self.Source = Source(Ensemble_Size)
-		
-	def Entropy(self, For = []):
-		self.Source.Ensemble = self._as_2D(self.Source.Ensemble)
-		Variables = []
-		for Name in For:
-			Var = self.Source.Ensemble[:,self.Source.Variable_Names.index(Name)]
-			Var = self._Add_Jitter(self._Standardize(self._as_2D(Var)))
-			Variables.append(Var)
-			
-		N = Variables[0].shape[0]
-		d = len(Variables)
-		epsilon = self._Calculate_kNN_Epsilon(Variables, k = self.k)
-		H = digamma(N) - digamma(self.k) + d* numpy.log(2.0) + (d/N) * numpy.sum(numpy.log(epsilon + 1e-300))
-		return float(H)
-		
-	def Conditional_Entropy(self, For = [], Known = []):
-		self.Source.Ensemble = self._as_2D(self.Source.Ensemble)
-		if len(Known) == 0 :
-			Value = self.Entropy(For)
-		else:
-			Value = self.Entropy(For+Known) - self.Entropy(Known)
-		return Value
-		
-	def Mutual_Information(self, For = [], Known = []):
-		self.Source.Ensemble = self._as_2D(self.Source.Ensemble)
-		X = self.Source.Ensemble[:,self.Source.Variable_Names.index(For[0])]
-		Y = self.Source.Ensemble[:,self.Source.Variable_Names.index(For[1])]
-		
-		X = self._Add_Jitter(self._Standardize(self._as_2D(X)))
-		Y = self._Add_Jitter(self._Standardize(self._as_2D(Y)))		
-		
-		if len(Known) != 0:
-			known_list = []
-			for k in Known:
-				Buf_array = self.Source.Ensemble[:,self.Source.Variable_Names.index(k)]
-				known_list.append(self._as_2D(Buf_array))
-
-			Z = numpy.concatenate(known_list, axis = 1)
-			Z = self._Add_Jitter(self._Standardize(self._as_2D(Z)))
-			
-			epsilon = self._Calculate_kNN_Epsilon([X,Y,Z], k = self.k)
-			nxz = self._Count_within_Epsilon([X,Z], epsilon)
-			nyz = self._Count_within_Epsilon([Y,Z], epsilon)
-			nz = self._Count_within_Epsilon([Z], epsilon)
-			
-			MI = digamma(self.k) - numpy.mean(digamma(nxz + 1) + digamma(nyz + 1) - digamma(nz + 1))
-			
-		else:
-			epsilon = self._Calculate_kNN_Epsilon([X,Y], k = self.k)
-			nx = self._Count_within_Epsilon([X], epsilon)
-			ny = self._Count_within_Epsilon([Y], epsilon)
-			n = X.shape[0]
-			
-			MI = digamma(self.k) + digamma(n) - numpy.mean(digamma(nx + 1) + digamma(ny + 1))
-		return float(MI)
-	
-	
-	def Multiple_Mutual_Information(self, For = [], Known = []):
-		pass
-		
-	
-	def _as_2D(self, array_A):
-		buf_A = numpy.asarray(array_A)
-		if buf_A.ndim == 1:
-			return buf_A.reshape(-1,1)	
-		if buf_A.ndim != 2:
-			raise ValueError("Check the array.ndim")
-		return buf_A
-		
-	def _Standardize(self, array_A):
-		Avg = numpy.mean(array_A, axis = 0, keepdims = True)
-		Std = numpy.std(array_A, axis = 0, keepdims = True)
-		return (array_A - Avg) / (Std + 1e-12)
-	
-	def _Add_Jitter(self, array_A):
-		scale = self.jitter * (numpy.std(array_A,axis=0,keepdims=True) + 1e-12)
-		return array_A + self.RNG.normal(0.0,1.0, size=array_A.shape) * scale
-	
-	def _Calculate_kNN_Epsilon(self, Variables, k):
-		array_A = numpy.concatenate(Variables, axis = 1)
-		
-		n = array_A.shape[0]
-		NN = NearestNeighbors(metric = "chebyshev", algorithm = "auto")
-		NN.fit(array_A)
-		dists, _ = NN.kneighbors(array_A, n_neighbors = k + 1)
-		epsilon = dists[:,-1]
-		return epsilon
-	
-	def _Count_within_Epsilon(self, Variables, epsilon):
-		array_A = numpy.concatenate(Variables, axis = 1)
-		
-		NN = NearestNeighbors(metric = "chebyshev", algorithm = "auto")
-		NN.fit(array_A)
-		counts = numpy.empty(array_A.shape[0], dtype = int)
-		for i, e in enumerate(epsilon):
-			r = numpy.nextafter(e, -numpy.inf)
-			neighbors = NN.radius_neighbors(array_A[i:i+1], radius=r, return_distance = False)[0]
-			counts[i] = max(len(neighbors) - 1 , 0)
-		return counts
+
+import copy
+
+import numpy
+
+from Core import Lazy_Import
+from Core.Estimators import Estimator_Basics
+
+special = Lazy_Import.Lazy_Module("scipy.special")
+spatial = Lazy_Import.Lazy_Module("scipy.spatial")
+
+class Source(Estimator_Basics.Source):
+	def __init__(self, Ensemble_Size):
+		self.Analysis = "Post_Analysis"
+		self.Type = "Pairwise"
+		self.Ensemble_Size = Ensemble_Size
+		
+		self.Rows = None
+		self.Members = 0
+		self.Variable_Names = []
+		self.Ensemble = []
+		
+	# Setting Ensemble or Variable_Names drops every cached array of the previous data.
+	# Realtime members are written in place into Rows, a preallocated float buffer whose first Members
+	# rows are the ensemble.
+	@property
+	def Ensemble(self):
+		if self.Rows is not None:
+			return self.Rows[:self.Members]
+		return self._Ensemble
+		
+	@Ensemble.setter
+	def Ensemble(self, Ensemble):
+		self._Ensemble = Ensemble
+		self.Rows = None
+		self.Members = 0
+		self.Clear_Cache()
+		
+	@property
+	def Variable_Names(self):
+		return self._Variable_Names
+		
+	@Variable_Names.setter
+	def Variable_Names(self, Names):
+		self._Variable_Names = Names
+		self.Column_Index = {}
+		for i, Name in enumerate(Names):
+			self.Column_Index[Name] = i
+		self.Clear_Cache()
+		
+	def Clear_Cache(self):
+		self._Data = None
+		self.Cache = {}
+		
+	# The ensemble as one contiguous (members x variables) float array, converted once per data set.
+	@property
+	def Data(self):
+		if self._Data is None and self.Rows is not None:
+			self._Data = self.Rows[:self.Members]
+		if self._Data is None:
+			self._Data = numpy.ascontiguousarray(self._Ensemble, dtype = float)
+			if self._Data.ndim == 1:
+				self._Data = self._Data.reshape(-1,1)
+		return self._Data
+		
+	# A zero-copy (members x 1) view of one variable.
+	def Column(self, Name):
+		i = self.Column_Index[Name]
+		return self.Data[:,i:i+1]
+		
+	# The stacked columns of several variables, built once and reused.
+	def Columns(self, Names):
+		if len(Names) == 1:
+			return self.Column(Names[0])
+		Key = ("Columns",) + tuple(Names)
+		if Key not in self.Cache:
+			Index_list = [self.Column_Index[Name] for Name in Names]
+			self.Cache[Key] = numpy.take(self.Data, Index_list, axis = 1)
+		return self.Cache[Key]
+		
+	def Init_Source_Realtime(self, Simulation_Nodes):
+		if self.Analysis != "Realtime":
+			return
+		Names = []
+		for X in Simulation_Nodes:
+			Names.append(X)
+			Names.append(X+"'")
+		self.Variable_Names = Names
+		self.Ensemble = []
+		self.Rows = numpy.empty((max(self.Ensemble_Size, 1), len(Names)))
+		
+	def Update_Source_Realtime(self, State_Space, Update_Buffer):
+		if self.Analysis != "Realtime":
+			return
+		if self.Members == len(self.Rows):
+			self._Grow(self.Members + 1)
+		Row = self.Rows[self.Members]
+		for i, Name in enumerate(self.Variable_Names):
+			if Name[-1] == "'":
+				Row[i] = Update_Buffer[Name[:-1]]
+			else:
+				Row[i] = State_Space[Name]
+		self.Members += 1
+		if self._Data is not None:
+			self.Clear_Cache()
+			
+	# Many members at once, for vectorized models : State_Space and Update_Buffer map each node to an
+	# array with one value per member.
+	def Update_Source_Realtime_Batch(self, State_Space, Update_Buffer):
+		if self.Analysis != "Realtime":
+			return
+		Columns = []
+		for Name in self.Variable_Names:
+			if Name[-1] == "'":
+				Columns.append(Update_Buffer[Name[:-1]])
+			else:
+				Columns.append(State_Space[Name])
+		Block = numpy.column_stack(Columns)
+		if self.Members + len(Block) > len(self.Rows):
+			self._Grow(self.Members + len(Block))
+		self.Rows[self.Members:self.Members+len(Block)] = Block
+		self.Members += len(Block)
+		if self._Data is not None:
+			self.Clear_Cache()
+			
+	# More members than Ensemble_Size (e.g. transitions pooled over several time steps) : the buffer doubles.
+	def _Grow(self, Size):
+		Rows = numpy.empty((max(Size, 2*len(self.Rows)), self.Rows.shape[1]))
+		Rows[:self.Members] = self.Rows[:self.Members]
+		self.Rows = Rows
+		
+	# Ensemble_Data_File can also be a list of snapshot files, whose members are pooled into one ensemble.
+	def Init_Source_Post_Analysis(self, Nodes, Ensemble_Data_File):
+		Names = []
+		for X in Nodes:
+			Names.append(X)
+			Names.append(X+"'")
+		self.Variable_Names = Names
+		
+		if isinstance(Ensemble_Data_File, (list, tuple)):
+			self.Ensemble = numpy.concatenate([self._Read_Ensemble_File(f) for f in Ensemble_Data_File], axis = 0)
+		else:
+			self.Ensemble = self._Read_Ensemble_File(Ensemble_Data_File)
+		if self.Ensemble.shape[1] != len(self.Variable_Names):
+			raise ValueError("Check ensemble shape :" + str(self.Ensemble.shape))
+			
+	def _Read_Ensemble_File(self, Ensemble_Data_File):
+		Ensemble = []
+		Data_File = open(Ensemble_Data_File, 'r')
+		for f in range(self.Ensemble_Size):
+			data_line = Data_File.readline()
+			data_list = []
+			for d in data_line.split("|"):
+				data_list.append(float(d))
+			Ensemble.append(data_list)
+		Data_File.close()
+		return numpy.asarray(Ensemble)
+			
+class Estimator(Estimator_Basics.Estimator):
+	def __init__(self, Ensemble_Size):
+		self.Name = "KSG_estimator"
+		
+		self.k = 10
+		self.jitter = 1e-10
+		self.Workers = 1 # Threads for the neighbour queries; -1 uses all cores.
+		
+		self.RNG = numpy.random.default_rng(0)
+		
+		self.Source = Source(Ensemble_Size)
+		
+	def Entropy(self, For = []):
+		Joint = self._Prepared(For)
+		N = Joint.shape[0]
+		d = len(For)
+		epsilon = self._Calculate_kNN_Epsilon([Joint], k = self.k)
+		H = special.digamma(N) - special.digamma(self.k) + d* numpy.log(2.0) + (d/N) * numpy.sum(numpy.log(epsilon + 1e-300))
+		return float(H)
+		
+	def Conditional_Entropy(self, For = [], Known = []):
+		if len(Known) == 0 :
+			Value = self.Entropy(For)
+		else:
+			Value = self.Entropy(For+Known) - self.Entropy(Known)
+		return Value
+		
+	def Mutual_Information(self, For = [], Known = []):
+		X = [For[0]]
+		Y = [For[1]]
+		
+		if len(Known) != 0:
+			Z = list(Known)
+			epsilon = self._Calculate_kNN_Epsilon([self._Prepared(X+Y+Z)], k = self.k)
+			nxz = self._Count_within_Epsilon([self._Prepared(X+Z)], epsilon)
+			nyz = self._Count_within_Epsilon([self._Prepared(Y+Z)], epsilon)
+			nz = self._Count_within_Epsilon([self._Prepared(Z)], epsilon)
+			
+			MI = special.digamma(self.k) - numpy.mean(special.digamma(nxz + 1) + special.digamma(nyz + 1) - special.digamma(nz + 1))
+			
+		else:
+			epsilon = self._Calculate_kNN_Epsilon([self._Prepared(X+Y)], k = self.k)
+			nx = self._Count_within_Epsilon([self._Prepared(X)], epsilon)
+			ny = self._Count_within_Epsilon([self._Prepared(Y)], epsilon)
+			n = epsilon.shape[0]
+			
+			MI = special.digamma(self.k) + special.digamma(n) - numpy.mean(special.digamma(nx + 1) + special.digamma(ny + 1))
+		return float(MI)
+		
+	# An independent estimator (own Source and RNG) for concurrent use.
+	def Clone(self, Seed = None):
+		The_Clone = copy.copy(self)
+		The_Clone.Source = copy.copy(self.Source)
+		The_Clone.Source.Variable_Names = []
+		The_Clone.Source.Ensemble = []
+		The_Clone.RNG = numpy.random.default_rng(Seed)
+		return The_Clone
+		
+	
+	# Standardized and jittered columns of the given variables. Each variable is prepared once
+	# per data set and the joint spaces are stacked once, then served from the source cache.
+	def _Prepared(self, Names):
+		Key = ("Prepared",) + tuple(Names)
+		if Key not in self.Source.Cache:
+			if len(Names) == 1:
+				Prepared = self._Add_Jitter(self._Standardize(self.Source.Column(Names[0])))
+			else:
+				Prepared = numpy.concatenate([self._Prepared([Name]) for Name in Names], axis = 1)
+			self.Source.Cache[Key] = Prepared
+		return self.Source.Cache[Key]
+		
+	def _as_2D(self, array_A):
+		buf_A = numpy.asarray(array_A)
+		if buf_A.ndim == 1:
+			return buf_A.reshape(-1,1)	
+		if buf_A.ndim != 2:
+			raise ValueError("Check the array.ndim")
+		return buf_A
+		
+	def _Standardize(self, array_A):
+		Avg = numpy.mean(array_A, axis = 0, keepdims = True)
+		Std = numpy.std(array_A, axis = 0, keepdims = True)
+		return (array_A - Avg) / (Std + 1e-12)
+	
+	def _Add_Jitter(self, array_A):
+		scale = self.jitter * (numpy.std(array_A,axis=0,keepdims=True) + 1e-12)
+		return array_A + self.RNG.normal(0.0,1.0, size=array_A.shape) * scale
+	
+	def _Joined(self, Variables):
+		if len(Variables) == 1:
+			return Variables[0]
+		return numpy.concatenate(Variables, axis = 1)
+		
+	# The tree queries release the GIL, so the query points are split across self.Workers threads.
+	def _Calculate_kNN_Epsilon(self, Variables, k):
+		array_A = self._Joined(Variables)
+		
+		Tree = spatial.cKDTree(array_A)
+		dists, _ = Tree.query(array_A, k = k + 1, p = numpy.inf, workers = self.Workers)
+		epsilon = dists[:,-1]
+		return epsilon
+	
+	def _Count_within_Epsilon(self, Variables, epsilon):
+		array_A = self._Joined(Variables)
+		
+		Tree = spatial.cKDTree(array_A)
+		r = numpy.nextafter(epsilon, -numpy.inf)
+		counts = Tree.query_ball_point(array_A, r, p = numpy.inf, return_length = True, workers = self.Workers)
+		counts = numpy.maximum(numpy.asarray(counts, dtype = int) - 1, 0)
+		return counts
 	
\ No newline at end of file
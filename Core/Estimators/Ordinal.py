@@ -0,0 +1,127 @@
+"""
+Ordinal.py
+
+Ordinal-pattern (permutation) estimator of entropies, mutual
+informations and transfer entropies.
+
+Main Idea
+---------
+Each variable is replaced by the ordinal pattern of its recent values:
+the permutation that sorts the window (x_{t-(m-1)d}, ..., x_{t-d}, x_t),
+m being the `Order` and d the `Delay`. The symbols depend only on the
+ranks within a window, so they are insensitive to monotone distortions
+and robust to noise, and all quantities are plug-in entropies of symbol
+counts (the histogram machinery of Adaptive_Binning, including its bias
+report). Encoding is one argsort per window, O(N m log m), vectorized
+over members and variables.
+
+In a Post_Analysis, member i is row i of every ensemble snapshot, so the
+window of X at step t is read from m snapshots, Delay apart, ending at t
+(`Model_Basic.Source_Data_for_`); X' uses the same window shifted by one
+snapshot. With time pooling, the windows ending at each pooled snapshot
+are pooled, which makes long single trajectories (Size_of_Ensemble = 1,
+a large Pooling_Window) usable as well. `Ordinal_Patterns` encodes time
+series given as arrays directly.
+
+Core References
+---------------
+Bandt, C., & Pompe, B. (2002).
+Permutation entropy: a natural complexity measure for time series.
+Physical Review Letters, 88(17), 174102.
+
+Staniek, M., & Lehnertz, K. (2008).
+Symbolic transfer entropy.
+Physical Review Letters, 100(15), 158101.
+
+Notes
+-----
+- Ties within a window are ranked by time (stable sort).
+- Steps with fewer than (Order-1)*Delay earlier snapshots have no full
+  window; their values are NaN.
+- Entropies are those of the symbols (at most log m! nats per variable).
+"""
+
+import math
+
+import numpy
+
+from Core.Estimators import Adaptive_Binning
+
+# Symbols of windows laid along axis 0 : the order of the values, read as a base-m number.
+def Pattern_Codes(Windows):
+	Windows = numpy.asarray(Windows)
+	Order = len(Windows)
+	Ranks = numpy.argsort(Windows, axis = 0, kind = "stable")
+	Codes = numpy.zeros(Windows.shape[1:], dtype = numpy.int64)
+	for j in range(Order):
+		Codes = Codes*Order + Ranks[j]
+	return Codes
+
+# Ordinal patterns of a (T,) or (T, variables) series : one symbol per window ending at t = (Order-1)*Delay, ..., T-1.
+def Ordinal_Patterns(Series, Order = 3, Delay = 1):
+	Series = numpy.asarray(Series)
+	Windows = numpy.lib.stride_tricks.sliding_window_view(Series, (Order-1)*Delay+1, axis = 0)[..., ::Delay]
+	return Pattern_Codes(numpy.moveaxis(Windows, -1, 0))
+
+class Source(Adaptive_Binning.Source):
+	def __init__(self, Ensemble_Size, Order = 3, Delay = 1):
+		super().__init__(Ensemble_Size)
+
+		self.Order = Order
+		self.Delay = Delay
+
+	# Number of snapshots in a window and their spacing, read by Model_Basic.Source_Data_for_.
+	@property
+	def Snapshot_Window(self):
+		return (self.Order, self.Delay)
+
+	# Ensemble_Data_Files : for each pooled snapshot, the Order snapshot files of its window (oldest first).
+	def Init_Source_Post_Analysis(self, Nodes, Ensemble_Data_Files):
+		Names = []
+		for X in Nodes:
+			Names.append(X)
+			Names.append(X+"'")
+		self.Variable_Names = Names
+
+		Patterns = [numpy.empty((0, len(Names)), dtype = numpy.int64)]
+		for Window in Ensemble_Data_Files:
+			Stack = numpy.array([self._Read_Ensemble_File(f) for f in Window]) # (Order, members, variables)
+			if Stack.shape[2] != len(self.Variable_Names):
+				raise ValueError("Check ensemble shape :" + str(Stack.shape[1:]))
+			Patterns.append(Pattern_Codes(Stack))
+		self.Ensemble = numpy.concatenate(Patterns, axis = 0)
+
+	# The symbols of each column, renumbered over the patterns that occur.
+	@property
+	def Binned(self):
+		if "Binned" not in self.Cache:
+			Binned = numpy.empty(self.Data.shape, dtype = numpy.int64)
+			Sizes = []
+			for i in range(self.Data.shape[1]):
+				Symbols, Binned[:, i] = numpy.unique(self.Data[:, i], return_inverse = True)
+				Sizes.append(max(len(Symbols), 1))
+			self.Cache["Binned"] = (Binned, Sizes)
+		return self.Cache["Binned"]
+
+class Estimator(Adaptive_Binning.Estimator):
+	def __init__(self, Ensemble_Size, Order = 3, Delay = 1):
+		self.Name = "Ordinal_Pattern_Method"
+
+		self.Bias_Correction = None
+		self.Report_Bias = False
+
+		self.Source = Source(Ensemble_Size, Order, Delay)
+
+	def Entropy(self, For = []):
+		if len(self.Source.Data) == 0:
+			return math.nan
+		return super().Entropy(For)
+
+	def Bias_Report(self):
+		return Bias_Estimator(self)
+
+class Bias_Estimator(Adaptive_Binning.Bias_Estimator):
+	def Entropy(self, For = []):
+		if len(self.Source.Data) == 0:
+			return math.nan
+		return super().Entropy(For)
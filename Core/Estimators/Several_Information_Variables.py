@@ -1,166 +1,232 @@
-"""
-Several_Information_Variables.py
-
-Composite (multi-variable) information measures built on top of the
-base estimator interface. This module defines convenience classes for
-computing and storing higher-order information quantities that are
-frequently required in information-dynamical decompositions.
-
-Main Idea
----------
-Many network information terms (e.g., transfer-entropy–like quantities,
-partial information terms, or multi-variable corrections) can be
-expressed as combinations of entropies and (conditional) mutual
-informations over joint variables.
-
-This module provides a pattern:
-
-1) Define a new "additional information variable" class.
-2) Specify which variables are needed (e.g., X, Y, X', Y').
-3) Update the underlying estimator's data source (realtime or post-analysis).
-4) Compute the target quantity using entropy/MI/CMI identities.
-5) Store the resulting time series into `Temporal_Results/`.
-
-Core References
----------------
-Cover, T. M., & Thomas, J. A. (2006).
-Elements of Information Theory.
-
-McGill, W. J. (1954).
-Multivariate information transmission.
-Psychometrika, 19, 97–116.
-(For interaction information / multi-variable MI concepts.)
-
-Schreiber, T. (2000).
-Measuring information transfer.
-Physical Review Letters, 85, 461–464.
-(For transfer entropy as conditional mutual information.)
-
-Notes on Outputs
-----------------
-Classes in this module are designed to produce:
-
-- A scalar information value at each time step (or analysis step)
-- Saved as a time series, typically in:
-      <Model>/Temporal_Results/
-
-Depending on the model workflow:
-- Realtime mode writes values during simulation.
-- Post-analysis mode computes values from stored ensemble snapshots.
-
-Numerical / Practical Notes
----------------------------
-1) Dimensionality growth
-   Many composite quantities require joint spaces such as (X, Y, Z, ...).
-   For continuous estimators (KSG), variance increases rapidly with the
-   total joint dimension. For discrete/binning estimators, memory scales
-   as Q^dimension.
-
-2) Conditioning complexity
-   Conditional terms like I(X;Y|Z) require neighbor counts (KSG) or
-   joint histograms (binning). High-dimensional Z can make the estimate
-   unreliable without dimensionality reduction or parent-set truncation.
-
-3) Negative estimates
-   kNN-based MI/CMI estimates can be slightly negative due to finite-sample
-   bias. This is a known numerical artifact; consider reporting confidence
-   intervals, using bias correction, or truncating small negatives to zero
-   depending on your reporting policy.
-
-Limitations
------------
-- This module does not implement new estimators; it composes existing
-  estimator calls to build derived quantities.
-- Reliability depends on the estimator and the effective dimension of
-  the joint/conditioning spaces.
-- For large networks, full multi-variable quantities may be infeasible;
-  consider sparse/parent-set approximations.
-"""
-
-from Core.Estimators import Estimator_Basics 
-from Core.Estimators import Simple_Binning
-#from Core.Estimators import KSG
-
-class An_Additional_Information_Variable_BIN(Simple_Binning.Estimator):
-	def __init__(self, Q, Dimension):
-		super().__init__(Q, Dimension)
-		self.Source.Analysis = ""
-		
-		self.Name = ""
-		self.Value = {}
-		
-	def Estimate_the_Variable(self):
-		pass
-		
-	def Create_Header(self,Save_Directory):
-		if self.Name == "":
-			return
-		save_file = open(Save_Directory + self.Name + ".txt",'w')
-		for val in self.Value:
-			save_file.write("%s|"%(val))
-		save_file.write("\n")
-		save_file.close()
-		
-	def Save_the_Variable(self, Save_Directory, Simulation_Time):
-		if self.Source.Analysis != "Realtime":
-			return
-		if self.Name == "":
-			return
-		save_file = open(Save_Directory + self.Name + ".txt",'a')
-		save_file.write("%03d: "%(Simulation_Time-1))
-		for val in self.Value:
-			save_file.write("%0.3f|"%(self.Value[val][Simulation_Time-2]))
-		save_file.write("\n")
-		save_file.close()
-
-class H_XYZ(An_Additional_Information_Variable_BIN):
-	def __init__(self, Q, Index_Tuple):
-		super().__init__(Q, 3)
-		self.Source.Analysis = "Realtime"
-		self.Source.Type = "not_Pairwise"
-		
-		self.Name = "H_%s%s%s"%Index_Tuple
-		self.Source.Variable_Names = Index_Tuple
-		
-	def Estimate_the_Variable(self):	
-		self.Value["H"] = self.Conditional_Entropy(For = self.Source.Variable_Names)
-		return
-		
-		
-class H_XYZW(An_Additional_Information_Variable_BIN):
-	def __init__(self, Q, Index_Tuple):
-		super().__init__(Q, 4)
-		self.Source.Analysis = "Realtime"
-		self.Source.Type = "not_Pairwise"
-		
-		self.Name = "H_%s%s%s%s"%Index_Tuple
-		self.Source.Variable_Names = Index_Tuple
-		
-	def Estimate_the_Variable(self):	
-		self.Value["H"] = self.Conditional_Entropy(For = self.Source.Variable_Names)
-		return
-		
-class T2(An_Additional_Information_Variable_BIN):
-	def __init__(self, Q, Index_Tuple): # Index_Tuple = (X, Y, Ext)
-		super().__init__(Q, 5)
-		self.Source.Analysis = "Realtime"
-		self.Source.Type = "not_Pairwise"
-		
-		self.Name = "Multiple_Transfer_Entropy_%s_%s_%s"%Index_Tuple
-		self.Source.Variable_Names = list(Index_Tuple) + [Index_Tuple[0]+"'"] + [Index_Tuple[1]+"'"]
-		
-	def Estimate_the_Variable(self):	
-		X_t1 = self.Source.Variable_Names[0]
-		Y_t1 = self.Source.Variable_Names[1]
-		Ext_t1 = self.Source.Variable_Names[2]
-		X_t2 = self.Source.Variable_Names[3]
-		Y_t2 = self.Source.Variable_Names[4]
-		# T^2_{%s %s -> %s}
-		self.Value["T^2_v1"] = self.Multiple_Mutual_Information(For = [Ext_t1,X_t1,Y_t2],  Known = [Y_t1])
-		self.Value["T^2_v2"] = self.Multiple_Mutual_Information(For = [Ext_t1,X_t2,Y_t2],  Known = [X_t1,Y_t1])
-		self.Value["T^2_v3"] = self.Multiple_Mutual_Information(For = [Ext_t1,Y_t1,X_t2],  Known = [X_t1])
-		return
-		
-
-		
-
+"""
+Several_Information_Variables.py
+
+Composite (multi-variable) information measures built on top of the
+base estimator interface. This module defines convenience classes for
+computing and storing higher-order information quantities that are
+frequently required in information-dynamical decompositions.
+
+Main Idea
+---------
+Many network information terms (e.g., transfer-entropy–like quantities,
+partial information terms, or multi-variable corrections) can be
+expressed as combinations of entropies and (conditional) mutual
+informations over joint variables.
+
+This module provides a pattern:
+
+1) Define a new "additional information variable" class.
+2) Specify which variables are needed (e.g., X, Y, X', Y').
+3) Update the underlying estimator's data source (realtime or post-analysis).
+4) Compute the target quantity using entropy/MI/CMI identities.
+5) Store the resulting time series into `Temporal_Results/`.
+
+The variables are registered in `An_Observer_Registry` (the model's
+`Additional_InfoVar`). In realtime runs it records every sample once,
+into one count table over the union of the registered variable sets, and
+hands each variable its marginal before it is estimated. With nothing
+registered, the model skips it entirely.
+
+Core References
+---------------
+Cover, T. M., & Thomas, J. A. (2006).
+Elements of Information Theory.
+
+McGill, W. J. (1954).
+Multivariate information transmission.
+Psychometrika, 19, 97–116.
+(For interaction information / multi-variable MI concepts.)
+
+Schreiber, T. (2000).
+Measuring information transfer.
+Physical Review Letters, 85, 461–464.
+(For transfer entropy as conditional mutual information.)
+
+Notes on Outputs
+----------------
+Classes in this module are designed to produce:
+
+- A scalar information value at each time step (or analysis step)
+- Saved as a time series, typically in:
+      <Model>/Temporal_Results/
+
+Depending on the model workflow:
+- Realtime mode writes values during simulation.
+- Post-analysis mode computes values from stored ensemble snapshots.
+
+Numerical / Practical Notes
+---------------------------
+1) Dimensionality growth
+   Many composite quantities require joint spaces such as (X, Y, Z, ...).
+   For continuous estimators (KSG), variance increases rapidly with the
+   total joint dimension. For discrete/binning estimators, memory scales
+   as Q^dimension.
+
+2) Conditioning complexity
+   Conditional terms like I(X;Y|Z) require neighbor counts (KSG) or
+   joint histograms (binning). High-dimensional Z can make the estimate
+   unreliable without dimensionality reduction or parent-set truncation.
+
+3) Negative estimates
+   kNN-based MI/CMI estimates can be slightly negative due to finite-sample
+   bias. This is a known numerical artifact; consider reporting confidence
+   intervals, using bias correction, or truncating small negatives to zero
+   depending on your reporting policy.
+
+4) Higher-order terms
+   `Multiple_Mutual_Information` (co-information) and `Total_Correlation`
+   are inclusion-exclusion sums over joint entropies. Binning estimators
+   compute the entropies of all 2^Dimension variable subsets of their
+   source at once (`Simple_Binning.Source.Subset_Entropies`), so every
+   variant evaluated on the same source reuses them.
+
+Limitations
+-----------
+- This module does not implement new estimators; it composes existing
+  estimator calls to build derived quantities.
+- Reliability depends on the estimator and the effective dimension of
+  the joint/conditioning spaces.
+- For large networks, full multi-variable quantities may be infeasible;
+  consider sparse/parent-set approximations.
+"""
+
+import numpy
+
+from Core.Estimators import Estimator_Basics 
+from Core.Estimators import Simple_Binning
+#from Core.Estimators import KSG
+
+class An_Additional_Information_Variable_BIN(Simple_Binning.Estimator):
+	def __init__(self, Q, Dimension):
+		super().__init__(Q, Dimension)
+		self.Source.Analysis = ""
+		
+		self.Name = ""
+		self.Value = {}
+		
+	def Estimate_the_Variable(self):
+		pass
+		
+	def Create_Header(self,Save_Directory):
+		if self.Name == "":
+			return
+		save_file = open(Save_Directory + self.Name + ".txt",'w')
+		for val in self.Value:
+			save_file.write("%s|"%(val))
+		save_file.write("\n")
+		save_file.close()
+		
+	def Save_the_Variable(self, Save_Directory, Simulation_Time):
+		if self.Source.Analysis != "Realtime":
+			return
+		if self.Name == "":
+			return
+		save_file = open(Save_Directory + self.Name + ".txt",'a')
+		save_file.write("%03d: "%(Simulation_Time-1))
+		for val in self.Value:
+			save_file.write("%0.3f|"%(self.Value[val][Simulation_Time-2]))
+		save_file.write("\n")
+		save_file.close()
+
+# Registered information variables sharing one joint count table : each sample of a realtime ensemble is
+# recorded once over the union of their variables (primed names are the next values), and the statistics
+# of every realtime variable are the marginal of this table over its own variables. Their variables do not
+# depend on the simulated link or node, so only the observed unit (Observed = True) records samples.
+class An_Observer_Registry(list):
+	def __init__(self, Observers = ()):
+		super().__init__(Observers)
+		self.Shared = None
+		
+	def Register(self, Observer):
+		self.append(Observer)
+		return Observer
+		
+	def Realtime_Observers(self):
+		return [Observer for Observer in self if Observer.Source.Analysis == "Realtime"]
+		
+	def Init_Source_Realtime(self, Simulation_Nodes, Observed = True):
+		Observers = self.Realtime_Observers()
+		if len(Observers) == 0 or not Observed:
+			self.Shared = None
+			return
+		Names = list(dict.fromkeys(Name for Observer in Observers for Name in Observer.Source.Variable_Names))
+		self.Shared = Simple_Binning.Source(max(Observer.Source.Q for Observer in Observers), len(Names))
+		self.Shared.Variable_Names = Names
+		
+	def Update_Source_Realtime(self, State_Space, Update_Buffer):
+		if self.Shared is None:
+			return
+		a_Case = tuple(Update_Buffer[Name[:-1]] if Name[-1] == "'" else State_Space[Name] for Name in self.Shared.Variable_Names)
+		self.Shared.Statistics[a_Case] = self.Shared.Statistics.get(a_Case, 0) + 1
+		
+	def Update_Source_Realtime_Batch(self, State_Space, Update_Buffer):
+		if self.Shared is None:
+			return
+		Columns = [Update_Buffer[Name[:-1]] if Name[-1] == "'" else State_Space[Name] for Name in self.Shared.Variable_Names]
+		Cases, Counts = numpy.unique(numpy.column_stack(Columns), axis = 0, return_counts = True)
+		for a_Case, Count in zip(Cases.tolist(), Counts.tolist()):
+			self.Shared.Statistics[tuple(a_Case)] = self.Shared.Statistics.get(tuple(a_Case), 0) + Count
+		
+	def Estimate_the_Variables(self):
+		if self.Shared is not None:
+			self.Shared.Meshed_Cache = {}
+			for Observer in self.Realtime_Observers():
+				Observer.Source.Statistics = self.Shared.Meshed_for_(list(Observer.Source.Variable_Names))
+				Observer.Source.Meshed_Cache = {}
+		for Observer in self:
+			Observer.Estimate_the_Variable()
+
+class H_XYZ(An_Additional_Information_Variable_BIN):
+	def __init__(self, Q, Index_Tuple):
+		super().__init__(Q, 3)
+		self.Source.Analysis = "Realtime"
+		self.Source.Type = "not_Pairwise"
+		
+		self.Name = "H_%s%s%s"%Index_Tuple
+		self.Source.Variable_Names = Index_Tuple
+		self.Value = {"H":[]}
+		
+	def Estimate_the_Variable(self):	
+		self.Value["H"].append(self.Conditional_Entropy(For = list(self.Source.Variable_Names)))
+		return
+		
+		
+class H_XYZW(An_Additional_Information_Variable_BIN):
+	def __init__(self, Q, Index_Tuple):
+		super().__init__(Q, 4)
+		self.Source.Analysis = "Realtime"
+		self.Source.Type = "not_Pairwise"
+		
+		self.Name = "H_%s%s%s%s"%Index_Tuple
+		self.Source.Variable_Names = Index_Tuple
+		self.Value = {"H":[]}
+		
+	def Estimate_the_Variable(self):	
+		self.Value["H"].append(self.Conditional_Entropy(For = list(self.Source.Variable_Names)))
+		return
+		
+class T2(An_Additional_Information_Variable_BIN):
+	def __init__(self, Q, Index_Tuple): # Index_Tuple = (X, Y, Ext)
+		super().__init__(Q, 5)
+		self.Source.Analysis = "Realtime"
+		self.Source.Type = "not_Pairwise"
+		
+		self.Name = "Multiple_Transfer_Entropy_%s_%s_%s"%Index_Tuple
+		self.Source.Variable_Names = list(Index_Tuple) + [Index_Tuple[0]+"'"] + [Index_Tuple[1]+"'"]
+		self.Value = {"T^2_v1":[], "T^2_v2":[], "T^2_v3":[]}
+		
+	def Estimate_the_Variable(self):	
+		X_t1 = self.Source.Variable_Names[0]
+		Y_t1 = self.Source.Variable_Names[1]
+		Ext_t1 = self.Source.Variable_Names[2]
+		X_t2 = self.Source.Variable_Names[3]
+		Y_t2 = self.Source.Variable_Names[4]
+		# T^2_{%s %s -> %s}
+		self.Value["T^2_v1"].append(self.Multiple_Mutual_Information(For = [Ext_t1,X_t1,Y_t2],  Known = [Y_t1]))
+		self.Value["T^2_v2"].append(self.Multiple_Mutual_Information(For = [Ext_t1,X_t2,Y_t2],  Known = [X_t1,Y_t1]))
+		self.Value["T^2_v3"].append(self.Multiple_Mutual_Information(For = [Ext_t1,Y_t1,X_t2],  Known = [X_t1]))
+		return
+		
+
+		
+
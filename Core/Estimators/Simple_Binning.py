@@ -1,6 +1,11 @@
 import math
 
+import numpy
+
 from Core.Estimators import Estimator_Basics
+from Core.Estimators import Histogram
+
+Max_Subset_Table = 2**20
 
 class Source(Estimator_Basics.Source):
 	def __init__(self, Q, Dimension):
@@ -10,6 +15,21 @@ class Source(Estimator_Basics.Source):
 		self.Q = Q
 		self.Dimension = Dimension
 		self.Statistics = {}	
+		self.Meshed_Cache = {}
+		self.Variable_Names = []
+		
+	# Variable_Names keeps a name -> position map in step, so lookups avoid list.index scans.
+	@property
+	def Variable_Names(self):
+		return self._Variable_Names
+		
+	@Variable_Names.setter
+	def Variable_Names(self, Names):
+		self._Variable_Names = Names
+		self.Variable_Index = {}
+		for i, Name in enumerate(Names):
+			self.Variable_Index[Name] = i
+		self.Meshed_Cache = {}
 			
 	def Init_Source_Realtime(self, Simulation_Nodes):
 		if self.Analysis != "Realtime":
@@ -17,14 +37,16 @@ class Source(Estimator_Basics.Source):
 		if self.Type == "Pairwise":
 			self.Variable_Names = [Simulation_Nodes[0],Simulation_Nodes[1],Simulation_Nodes[0]+"'",Simulation_Nodes[1]+"'"]
 		elif self.Type == "Point":
-			self.Variable_Names = []
+			Names = []
 			for a_node in Simulation_Nodes:
-				self.Variable_Names.append(a_node)
-				self.Variable_Names.append(a_node+"'")
+				Names.append(a_node)
+				Names.append(a_node+"'")
+			self.Variable_Names = Names
 			
 		if len(self.Variable_Names) != self.Dimension:
 			self.Dimension = len(self.Variable_Names)
 		self.Statistics = {}	
+		self.Meshed_Cache = {}
 		self._recursive_Init_Statistics(1, [])
 			
 	def _recursive_Init_Statistics(self, D, Index_List):
@@ -44,15 +66,37 @@ class Source(Estimator_Basics.Source):
 			else:
 				Index_list.append(State_Space[Name])
 		self.Statistics[tuple(Index_list)] += 1
+		if self.Meshed_Cache:
+			self.Meshed_Cache = {}
+			
+	# Many members at once, for vectorized models : each distinct row of states is counted once.
+	def Update_Source_Realtime_Batch(self, State_Space, Update_Buffer):
+		if self.Analysis != "Realtime":
+			return
+		Columns = []
+		for Name in self.Variable_Names:
+			if Name[-1] == "'":
+				Columns.append(Update_Buffer[Name[:-1]])
+			else:
+				Columns.append(State_Space[Name])
+		Cases, Counts = numpy.unique(numpy.column_stack(Columns), axis = 0, return_counts = True)
+		for a_Case, Count in zip(Cases.tolist(), Counts.tolist()):
+			self.Statistics[tuple(a_Case)] += Count
+		self.Meshed_Cache = {}
 		
 	# P(List_of_Mesh_Variables, Other_Variables) -> P(List_of_Mesh_Variables)
+	# The marginal tables are kept until the statistics change.
 	def Meshed_for_(self, List_of_Mesh_Variables):
 		if List_of_Mesh_Variables == []:
 			return self.Statistics
+			
+		Mesh_Key = tuple(List_of_Mesh_Variables)
+		if Mesh_Key in self.Meshed_Cache:
+			return self.Meshed_Cache[Mesh_Key]
 
 		Mesh_Index = []
 		for Mesh_Var in List_of_Mesh_Variables:
-			Mesh_Index.append(self.Variable_Names.index(Mesh_Var))
+			Mesh_Index.append(self.Variable_Index[Mesh_Var])
 
 		Meshed_Statistics = {}
 		for a_Case in self.Statistics:
@@ -61,6 +105,7 @@ class Source(Estimator_Basics.Source):
 				Meshed_Statistics[mesh_case] += self.Statistics[a_Case]
 			else:
 				Meshed_Statistics[mesh_case] = self.Statistics[a_Case]
+		self.Meshed_Cache[Mesh_Key] = Meshed_Statistics
 		return Meshed_Statistics
 
 	def Mesh_Tuple(self, Raw_Tuple, Mesh_Index):
@@ -79,6 +124,39 @@ class Source(Estimator_Basics.Source):
 	def Generate_Desired_PDF(self, List_of_Mesh_Variables):
 		return self.Generate_Probability_Distribution_Function(self.Meshed_for_(List_of_Mesh_Variables))
 
+	# Entropies of every subset of the variables, indexed by bit masks over Variable_Names (bit i : the i-th
+	# variable), kept until the statistics change. The marginal of each subset is summed from its parent with
+	# one more variable (a zeta transform over the subset lattice), depth first so that only the marginals
+	# along one path are held at a time. All the marginals together have (Q+1)^Dimension cells (and there
+	# are 2^Dimension masks) : None when this exceeds Max_Subset_Table.
+	def Subset_Entropies(self):
+		if "Subset_Entropies" in self.Meshed_Cache:
+			return self.Meshed_Cache["Subset_Entropies"]
+		Dimension = len(self.Variable_Names)
+		if (self.Q+1)**Dimension > Max_Subset_Table:
+			return None
+		Joint = numpy.zeros((self.Q,)*Dimension)
+		for a_Case in self.Statistics:
+			Joint[a_Case] = self.Statistics[a_Case]
+		if Joint.sum() == 0:
+			raise ValueError("ERROR : ZERO STAT")
+			
+		Full = (1 << Dimension) - 1
+		Entropies = {Full:float(Histogram.Entropy_from_Counts(Joint.ravel()))}
+		self._recursive_Subset_Entropies(Full, Joint, Entropies)
+		self.Meshed_Cache["Subset_Entropies"] = Entropies
+		return Entropies
+		
+	# The children of Parent drop one of the variables below its lowest missing one, all of which are in
+	# Parent, so that variable j is axis j of its marginal and every subset has exactly one parent.
+	def _recursive_Subset_Entropies(self, Parent, Marginal, Entropies):
+		Lowest_Missing = (~Parent & (Parent + 1)).bit_length() - 1
+		for j in range(Lowest_Missing):
+			Mask = Parent & ~(1 << j)
+			Child = Marginal.sum(axis = j)
+			Entropies[Mask] = float(Histogram.Entropy_from_Counts(Child.reshape(-1)))
+			self._recursive_Subset_Entropies(Mask, Child, Entropies)
+		
 	def Calculate_Total_Occurance(self, Statistics):
 		Total = 0
 		for a_Case in Statistics:
@@ -118,20 +196,105 @@ class Estimator(Estimator_Basics.Estimator):
 		Value = H_x + H_y - H_xy
 		return Value
 		
-	def Multiple_Mutual_Information(self, For = [], Known = []):
-		Order = len(For) - 1
-		Value = self._Recursive_Calculation(Order, For = For, Known = Known)
-		return Value
+	# From the table of all the subset entropies of the source when it is small enough, by marginals otherwise.
+	def Subset_Entropy(self, Names):
+		Entropies = self.Source.Subset_Entropies()
+		if Entropies is None:
+			return super().Subset_Entropy(Names)
+		Mask = 0
+		for Name in Names:
+			Mask |= 1 << self.Source.Variable_Index[Name]
+		return Entropies[Mask]
 		
-	def _Recursive_Calculation(self, Order, For = [], Known = []):
-		if Order == 2:
-			return self.Mutual_Information(For = For[:-1], Known = Known) - self.Mutual_Information(For = For[:-1], Known = Known + [For[-1]])
-		else:
-			return self._Recursive_Calculation(Order-1, For = For[:-1], Known = Known) - self._Recursive_Calculation(Order-1, For = For[:-1], Known = Known + [For[-1]])
-			
+# Evaluates many count tables over the same variables at once : Counts holds one row per replicate
+# (over the states in Cells), and every quantity is returned as an array with one value per replicate.
+class Replicate_Estimator(Estimator):
+	def __init__(self, Q, Dimension, Replicates = 200, Seed = None):
+		super().__init__(Q, Dimension)
+		self.Name = "Simple_Binning_Replicates"
 		
+		self.Replicates = Replicates
+		self.RNG = numpy.random.default_rng(Seed)
+		self.Cells = None
+		self.Counts = None
+		self.Marginal_Cache = {}
 		
+	def Entropy(self, For = []):
+		return Histogram.Entropy_from_Counts(self.Marginal_Counts(For))
 		
+	def Subset_Entropy(self, Names):
+		return Estimator_Basics.Estimator.Subset_Entropy(self, Names)
 		
+	# (Replicates, States of For) counts, summed over the other variables in one bincount.
+	def Marginal_Counts(self, For = []):
+		if For == []:
+			return self.Counts
+		Mesh_Key = tuple(For)
+		if Mesh_Key not in self.Marginal_Cache:
+			Mesh_Index = [self.Source.Variable_Index[Mesh_Var] for Mesh_Var in For]
+			Codes = Histogram.Joint_Codes(self.Cells[:, Mesh_Index])
+			Size = int(Codes.max()) + 1
+			Flat = Codes + Size * numpy.arange(self.Replicates).reshape(-1,1)
+			Counts = numpy.bincount(Flat.ravel(), weights = self.Counts.ravel(), minlength = self.Replicates * Size)
+			self.Marginal_Cache[Mesh_Key] = Counts.reshape(self.Replicates, Size)
+		return self.Marginal_Cache[Mesh_Key]
 		
-
+# Multinomial bootstrap : the replicates are resamples of the joint count table of a Source.
+class Bootstrap_Estimator(Replicate_Estimator):
+	def __init__(self, Q, Dimension, Replicates = 200, Seed = None):
+		super().__init__(Q, Dimension, Replicates, Seed)
+		self.Name = "Simple_Binning_Bootstrap"
+		
+	# Draws new replicates from the current statistics of Source (by default its own).
+	def Resample(self, Source = None):
+		if Source is not None:
+			self.Source = Source
+		Statistics = self.Source.Statistics
+		Total = self.Source.Calculate_Total_Occurance(Statistics)
+		self.Cells = numpy.array(list(Statistics.keys()))
+		P = numpy.array(list(Statistics.values()), dtype = float) / Total
+		self.Counts = self.RNG.multinomial(Total, P, size = self.Replicates)
+		self.Marginal_Cache = {}
+		
+# Permutation surrogates : in every replicate one variable is shuffled across the samples of a Source,
+# which keeps its marginal and destroys its dependence on the others.
+# A shuffled table is drawn directly instead of shuffling samples : the counts of the variable's values
+# within each state of the other variables follow a chain of hypergeometric draws, vectorized over the
+# replicates, so the cost does not grow with the number of samples.
+class Surrogate_Estimator(Replicate_Estimator):
+	def __init__(self, Q, Dimension, Replicates = 200, Seed = None):
+		super().__init__(Q, Dimension, Replicates, Seed)
+		self.Name = "Simple_Binning_Surrogate"
+		
+	def Permute(self, Variable, Source = None):
+		if Source is not None:
+			self.Source = Source
+		Statistics = self.Source.Statistics
+		self.Source.Calculate_Total_Occurance(Statistics)
+		Shape = (self.Source.Q,) * len(self.Source.Variable_Names)
+		Column = self.Source.Variable_Index[Variable]
+		
+		Dense = numpy.zeros(Shape, dtype = numpy.int64)
+		for a_Case in Statistics:
+			Dense[a_Case] = Statistics[a_Case]
+		# (States of the other variables, Values of the shuffled one)
+		Table = numpy.moveaxis(Dense, Column, -1).reshape(-1, self.Source.Q)
+		
+		Remaining = numpy.tile(Table.sum(axis = 0), (self.Replicates, 1))
+		Shuffled = numpy.zeros((self.Replicates,) + Table.shape, dtype = numpy.int64)
+		for g in numpy.flatnonzero(Table.sum(axis = 1)):
+			Left = numpy.full(self.Replicates, Table[g].sum())
+			for v in range(self.Source.Q - 1):
+				Others = Remaining[:, v+1:].sum(axis = 1)
+				Drawn = self.RNG.hypergeometric(Remaining[:, v], Others, Left)
+				Shuffled[:, g, v] = Drawn
+				Remaining[:, v] -= Drawn
+				Left -= Drawn
+			Shuffled[:, g, -1] = Left
+			Remaining[:, -1] -= Left
+			
+		Other_Shape = numpy.moveaxis(Dense, Column, -1).shape
+		Counts = numpy.moveaxis(Shuffled.reshape((self.Replicates,) + Other_Shape), -1, Column + 1)
+		self.Counts = Counts.reshape(self.Replicates, -1).astype(float)
+		self.Cells = numpy.array(numpy.unravel_index(numpy.arange(Dense.size), Shape)).T
+		self.Marginal_Cache = {}
@@ -0,0 +1,171 @@
+
+# Exact realtime estimates for small discrete models (see Model_Basic.Exact_Propagation) : instead of
+# simulating Size_of_Ensemble members, the joint probability vector over all Q^n network states is
+# pushed forward by the model's Markov transition matrix, and the joint distributions of the variables
+# of each Source are computed from it. There is no sampling noise, and a time step is one
+# vector-matrix product.
+# The model gives the distribution of the initial state and of the next value of every node given the
+# current state (Initial_Probabilities, Transition_Probabilities); the nodes are drawn independently of
+# each other given the current state, as in Dynamics_of_States. Transition matrices are built once per
+# Transition_Epoch of the model (e.g. before and after an interaction starts).
+# Deterministic dynamics (every next value certain, e.g. Boolean networks) need no matrix : each state
+# has one successor, the distribution moves along this map (a functional graph) in O(states) per step,
+# and the enumeration may then cover up to Max_Enumerated_States states.
+
+import itertools
+
+import numpy
+
+Max_Enumerated_States = 2**20
+
+class An_Exact_Propagator():
+	def __init__(self, Model, Max_States = 4096):
+		self.Model = Model
+		self.Q = Model.Q
+		self.Nodes = list(Model.Info_Network.Nodes)
+		self.Node_Index = {Name:i for i, Name in enumerate(self.Nodes)}
+		self.Max_States = Max_States
+
+		Size = self.Q**len(self.Nodes)
+		if Size > Max_Enumerated_States:
+			raise ValueError("Exact propagation over %d states (Q = %d, %d nodes) exceeds %d states"%(Size, self.Q, len(self.Nodes), Max_Enumerated_States))
+		# Row s holds the values of the nodes in state s (row-major : the last node varies fastest).
+		self.States = numpy.array(list(itertools.product(range(self.Q), repeat = len(self.Nodes))), dtype = numpy.int64).reshape(Size, len(self.Nodes))
+
+		self.Kernels = {} # epoch -> (states, nodes, Q) : P(next value of the node | state)
+		self.Matrices = {} # epoch -> (states, states) transition matrix
+		self.Successors = {} # epoch -> (states,) next state, None for stochastic transitions
+		self.Distributions = [] # P(state at time t), t = 0, 1, ...
+
+	def Set_State_Space(self, s):
+		for i, Name in enumerate(self.Nodes):
+			self.Model.State_Space[Name] = int(self.States[s, i])
+
+	def As_Array(self, Probabilities):
+		Table = numpy.zeros((len(self.Nodes), self.Q))
+		for Name in Probabilities:
+			Table[self.Node_Index[Name]] = Probabilities[Name]
+		if not numpy.allclose(Table.sum(axis = 1), 1):
+			raise ValueError("The probabilities of every node must sum to 1")
+		return Table
+
+	def Kernel(self, t):
+		Epoch = self.Model.Transition_Epoch(t)
+		if Epoch not in self.Kernels:
+			Saved_States = dict(self.Model.State_Space)
+			Saved_Buffer = dict(self.Model.Update_Buffer)
+			Kernel = numpy.empty((len(self.States), len(self.Nodes), self.Q))
+			for s in range(len(self.States)):
+				self.Set_State_Space(s)
+				Kernel[s] = self.As_Array(self.Model.Transition_Probabilities(t))
+			self.Model.State_Space.update(Saved_States)
+			self.Model.Update_Buffer.update(Saved_Buffer)
+			self.Kernels[Epoch] = Kernel
+		return self.Kernels[Epoch]
+
+	# T[s, s'] = prod_i P(node i takes its value in s' | s)
+	def Transition_Matrix(self, t):
+		Epoch = self.Model.Transition_Epoch(t)
+		if Epoch not in self.Matrices:
+			if len(self.States) > self.Max_States:
+				raise ValueError("A transition matrix over %d states (Q = %d, %d nodes) exceeds Max_States = %d"%(len(self.States), self.Q, len(self.Nodes), self.Max_States))
+			Kernel = self.Kernel(t)
+			Matrix = numpy.ones((len(self.States), 1))
+			for i in range(len(self.Nodes)):
+				Matrix = (Matrix[:, :, None] * Kernel[:, i, None, :]).reshape(len(self.States), -1)
+			self.Matrices[Epoch] = Matrix
+		return self.Matrices[Epoch]
+
+	def Successor(self, t):
+		Epoch = self.Model.Transition_Epoch(t)
+		if Epoch not in self.Successors:
+			Kernel = self.Kernel(t)
+			self.Successors[Epoch] = None
+			if numpy.all((Kernel == 0) | (Kernel == 1)):
+				self.Successors[Epoch] = self.Codes(Kernel.argmax(axis = 2))
+		return self.Successors[Epoch]
+		
+	# Index of the state of each row of Values (node values in the order of Nodes).
+	def Codes(self, Values):
+		return Values @ self.Q**numpy.arange(len(self.Nodes)-1, -1, -1)
+
+	def Initial_Distribution(self):
+		Marginals = self.As_Array(self.Model.Initial_Probabilities())
+		Distribution = numpy.ones(1)
+		for i in range(len(self.Nodes)):
+			Distribution = numpy.outer(Distribution, Marginals[i]).ravel()
+		return Distribution
+
+	# The state distributions at t = 0, ..., Simulation_Time.
+	def Propagate(self, Simulation_Time):
+		self.Distributions = [self.Initial_Distribution()]
+		for t in range(Simulation_Time):
+			Successor = self.Successor(t)
+			if Successor is not None:
+				self.Distributions.append(numpy.bincount(Successor, weights = self.Distributions[-1], minlength = len(self.States)))
+			else:
+				self.Distributions.append(self.Distributions[-1] @ self.Transition_Matrix(t))
+		return self.Distributions
+		
+	# Cycles of the deterministic map at time t, with the probability of the initial states that end on
+	# each of them : [(states of the cycle, weight), ...], by decreasing weight.
+	def Attractors(self, t = 0):
+		Successor = self.Successor(t)
+		if Successor is None:
+			raise ValueError("Attractors are defined for deterministic dynamics only")
+		Cycle_of = numpy.full(len(self.States), -1)
+		Cycles = []
+		for s in range(len(self.States)):
+			Path = []
+			On_Path = {}
+			while Cycle_of[s] < 0 and s not in On_Path:
+				On_Path[s] = len(Path)
+				Path.append(s)
+				s = int(Successor[s])
+			if Cycle_of[s] < 0: # a new cycle, from s around to itself
+				Cycle_of[Path[On_Path[s]:]] = len(Cycles)
+				Cycles.append(Path[On_Path[s]:])
+			Cycle_of[Path] = Cycle_of[s]
+		Weights = numpy.bincount(Cycle_of, weights = self.Initial_Distribution(), minlength = len(Cycles))
+		Order = numpy.argsort(-Weights, kind = "stable")
+		return [(Cycles[i], float(Weights[i])) for i in Order]
+
+	# Joint distribution of the transition t -> t+1 over Variable_Names (a primed name is the next value
+	# of its node), as a (Q,)*len(Variable_Names) array.
+	def Transition_Joint(self, t, Variable_Names):
+		Kernel = self.Kernel(t)
+		Present = [self.Node_Index[Name] for Name in Variable_Names if Name[-1] != "'"]
+		Future = [self.Node_Index[Name[:-1]] for Name in Variable_Names if Name[-1] == "'"]
+
+		# P(s, next values of the Future nodes), the other nodes being summed out (their kernels sum to 1)
+		Joint = self.Distributions[t][:, None]
+		for i in Future:
+			Joint = (Joint[:, :, None] * Kernel[:, i, None, :]).reshape(len(self.States), -1)
+		Present_Code = numpy.zeros(len(self.States), dtype = numpy.int64)
+		for i in Present:
+			Present_Code = Present_Code*self.Q + self.States[:, i]
+		Codes = Present_Code[:, None]*self.Q**len(Future) + numpy.arange(self.Q**len(Future))
+		Table = numpy.bincount(Codes.ravel(), weights = Joint.ravel(), minlength = self.Q**(len(Present)+len(Future)))
+
+		# Axes (present in order, future in order) -> Variable_Names order
+		Order = [Name for Name in Variable_Names if Name[-1] != "'"] + [Name for Name in Variable_Names if Name[-1] == "'"]
+		Table = Table.reshape((self.Q,)*len(Variable_Names))
+		return numpy.transpose(Table, [Order.index(Name) for Name in Variable_Names])
+
+	# Replaces the statistics of Source with the exact probabilities of its variables over the transitions
+	# pooled into the estimate at Simulation_Time (the transitions Simulation_Time-1 -> Simulation_Time, ...).
+	# A variable listed twice (e.g. a node that is a neighbor through two links) takes the same value in both places.
+	# Only the cases of nonzero probability are kept, so that the marginals of the estimator skip the others.
+	def Fill_Source(self, Source, Simulation_Time):
+		Variable_Names = list(dict.fromkeys(Source.Variable_Names))
+		Table = numpy.zeros((self.Q,)*len(Variable_Names))
+		for t in range(Simulation_Time):
+			if self.Model.Is_Pooled_Time(t, Simulation_Time):
+				Table += self.Transition_Joint(t, Variable_Names)
+		Table /= Table.sum()
+		
+		Position = [Variable_Names.index(Name) for Name in Source.Variable_Names]
+		Source.Statistics = {}
+		for a_Case in zip(*numpy.nonzero(Table)):
+			Source.Statistics[tuple(int(a_Case[i]) for i in Position)] = float(Table[a_Case])
+		Source.Meshed_Cache = {}
@@ -0,0 +1,21 @@
+
+# Heavy optional dependencies (scipy, matplotlib) are imported on first use rather than with the
+# modules using them, so that importing Core, the estimators or a model (e.g. for a short sweep job)
+# does not pay for libraries the run never calls.
+#	special = Lazy_Import.Lazy_Module("scipy.special")
+#	special.digamma(x)	# scipy.special is imported here
+
+import importlib
+
+class Lazy_Module():
+	def __init__(self, Name):
+		self.__dict__["_Name"] = Name
+		self.__dict__["_Module"] = None
+
+	def __getattr__(self, Attribute):
+		if self._Module is None:
+			self.__dict__["_Module"] = importlib.import_module(self._Name)
+		return getattr(self._Module, Attribute)
+
+	def __repr__(self):
+		return "<lazy module %s%s>"%(self._Name, "" if self._Module is None else " (loaded)")
@@ -1,296 +1,1021 @@
-
-import random
-import time
-import re
-
-from Core import Information_Network
-from Core.Estimators import Several_Information_Variables
-
-class Custom_FIFO():
-	def __init__(self):
-		self.Properties = {}
-		self.Simulation_Nodes = ""	
-		self.Info_Network = ""
-		self.Estimator = ""
-		self.Additional_InfoVar = ""
-		self.Save_Directory = ""
-		
-	def Register_Properties(self):
-		pass
-		
-	def Register_Topology(self):
-		self.Properties["Nodes"] = ""
-		self.Properties["Links"] = ""
-		for ind_node in self.Info_Network.Nodes:
-			self.Properties["Nodes"] = self.Properties["Nodes"] + ind_node + "|"
-		for ind_link in self.Info_Network.Links:
-			self.Properties["Links"] = self.Properties["Links"] + "%s,%s|"%(ind_link) + " "
-			
-	def Save_Properties(self):
-		Save_File = open(self.Save_Directory+"Simulation_Properties.txt",'w')
-		for key in self.Properties:
-			Save_File.write(key + " : " + self.Properties[key] + "\n")
-		Save_File.close()
-		
-	def Create_File_Header(self):
-		for ind_node in self.Info_Network.Nodes:
-			Save_File = open(self.Save_Directory+"Node_%s.txt"%ind_node,'w')
-			for key in self.Info_Network.Nodes[ind_node].Var_:
-				Save_File.write(key+"|")
-			for key in self.Info_Network.Nodes[ind_node].Alpha_:
-				Save_File.write(key+"|")
-			Save_File.write("\n")
-			Save_File.close()
-			
-		for ind_link in self.Info_Network.Links:
-			Save_File = open(self.Save_Directory+"Link_%s_%s.txt"%ind_link,'w')
-			for key in self.Info_Network.Links[ind_link].Var_:
-				Save_File.write(key+"|")
-			for key in self.Info_Network.Links[ind_link].Alpha_:
-				Save_File.write(key+"|")
-			Save_File.write("\n")
-			Save_File.close()
-		
-		for add_var in self.Additional_InfoVar:
-			add_var.Create_Header(self.Save_Directory)
-		
-	def Save_Info_Vars(self, Simulation_Time):
-		if Simulation_Time == 1:
-			return
-			
-		if self.Estimator.Source.Type == "Pairwise":
-			File_Name = "Link_%s_%s.txt"%self.Simulation_Nodes
-			Save_Object = self.Info_Network.Links[self.Simulation_Nodes]
-		elif self.Estimator.Source.Type == "Point":
-			File_Name = "Node_%s.txt"%self.Simulation_Nodes[0]
-			Save_Object = self.Info_Network.Nodes[self.Simulation_Nodes[0]]
-			
-		Save_File = open(self.Save_Directory+File_Name,'a')
-		Save_File.write("%03d:"%(Simulation_Time-1))
-		time_ind = Simulation_Time-2
-		for key in Save_Object.Var_:
-			value = Save_Object.Var_[key][time_ind]
-			if value >= 0:
-				Save_File.write("+%0.3f|"%value)
-			else:
-				Save_File.write("%0.3f|"%value)
-		for key in Save_Object.Alpha_:
-			value = Save_Object.Alpha_[key][time_ind]
-			if value >= 0:
-				Save_File.write("+%0.3f|"%value)
-			else:
-				Save_File.write("%0.3f|"%value)
-		Save_File.write("\n")
-		Save_File.close()
-		
-		for add_var in self.Additional_InfoVar:
-			add_var.Save_the_Variable(self.Save_Directory, Simulation_Time)
-		
-			
-	def Read_for_(self, file_name):
-		Data_Flow = {}
-		Read_Length = self.Simulation_Time_Limit - 1
-		Save_File = open(file_name,'r')	
-		Keys = Save_File.readline().split("|")[:-1]
-		for k in Keys:
-			Data_Flow[k] = []
-		
-		for i in range(Read_Length):
-			Data = Save_File.readline()
-			if ":" in Data:
-				Data = Data.split(":")[1]
-				Data = Data.split("|")[:-1]
-				for j, k in enumerate(Keys):
-					Data_Flow[k].append(float(Data[j]))
-					
-		Save_File.close()
-		return Data_Flow
-		
-
-class Model_Basic(Custom_FIFO):
-	def __init__(self):
-		self.Q = 0
-		self.Total_Nodes = 0
-		
-		self.Simulation_Time_Limit = 0
-		self.Simulation_Cut_up = -1
-		self.Simulation_Cut_down = 0
-		self.Save_Interval = 1
-		
-		self.Properties = {}
-		
-		self.State_Space = {}
-		self.Update_Buffer = {}
-		self.Simulation_Nodes = ()		
-		
-		self.Estimator = ""
-			
-		self.Info_Network = Information_Network.A_Network()
-		self.Additional_InfoVar = [Several_Information_Variables.An_Additional_Information_Variable_BIN(0,4)] # Do nothing.
-
-		self.Save_Directory = ""
-		self.Ensemble_Directory = ""
-		
-		self.Selected_Nodes = []
-		self.Selected_Links = []
-		
-	def Initialize(self):
-		self.Set_Topology()	
-		self.Init_Space()
-		self.Set_Estimator()
-
-		self.Register_Properties()
-		self.Save_Properties()
-		
-		self.Create_File_Header()	
-		
-	def Init_Space(self):
-		for k in self.Info_Network.Nodes:
-			self.State_Space[k] = 0
-			self.Update_Buffer[k] = 0
-		
-		random.seed(time.time())	
-		
-		if len(self.Selected_Nodes)==0:
-			for ind_node in self.Info_Network.Nodes:
-				self.Selected_Nodes.append(ind_node)
-				
-		if len(self.Selected_Links)==0:
-			for ind_link in self.Info_Network.Links:
-				self.Selected_Links.append(ind_link)
-			
-	def Generate_Data(self):
-		if self.Simulation_Cut_up == -1 :
-			self.Simulation_Cut_up = self.Simulation_Time_Limit		
-			
-		if self.Estimator.Source.Analysis == "Realtime":
-			for ind_link in self.Selected_Links:
-				self.Simulation_Nodes = ind_link
-				self.Estimator.Source.Type = "Pairwise"
-				for t in range(self.Simulation_Time_Limit):
-					if t >= self.Simulation_Cut_down and t < self.Simulation_Cut_up:
-						self.Construct_Ensemble(t+1)
-				print("\tComplete simulations for the link %s ~ %s"%self.Simulation_Nodes)
-				
-			for ind_node in self.Selected_Nodes:
-				self.Simulation_Nodes = [ind_node] + self.Info_Network.Nodes[ind_node].Neighbors
-				self.Estimator.Source.Type = "Point"
-				for t in range(self.Simulation_Time_Limit):
-					if t >= self.Simulation_Cut_down and t < self.Simulation_Cut_up:
-						self.Construct_Ensemble(t+1)
-				print("\tComplete simulations for the node %s"%self.Simulation_Nodes[0])
-			self.Post_Estimation_for_E()
-		elif self.Estimator.Source.Analysis == "Post_Analysis":
-			self.Construct_Ensemble(self.Simulation_Time_Limit)
-			
-		
-				
-	def Construct_Ensemble(self, Simulation_Time):
-		self.Estimator.Source.Init_Source_Realtime(self.Simulation_Nodes)
-		for add_var in self.Additional_InfoVar:
-			add_var.Source.Init_Source_Realtime(self.Simulation_Nodes)
-			
-		for c in range(self.Size_of_Ensemble):
-			self.Init_State_Space()
-			self.Simulate_Model(Simulation_Time)
-			
-		if self.Estimator.Source.Analysis == "Realtime":		
-			self.Calculate_Info_Vars()
-			self.Save_Info_Vars(Simulation_Time)
-			
-	def Simulate_Model(self, Simulation_Time):
-		Previous_States = {}
-		for t in range(Simulation_Time):
-			self.Dynamics_of_States(t)
-			if t == Simulation_Time-1:
-				self.Estimator.Source.Update_Source_Realtime(self.State_Space,self.Update_Buffer)
-				for add_var in self.Additional_InfoVar:
-					add_var.Source.Update_Source_Realtime(self.State_Space,self.Update_Buffer)
-				
-			if self.Estimator.Source.Analysis == "Post_Analysis" and t%self.Save_Interval == 0:
-				if t != 0:
-					self.Save_States(t, Previous_States)
-				for k in self.Info_Network.Nodes:
-					Previous_States[k] = self.State_Space[k]
-				
-			self.Update_States()
-			
-	def Update_States(self):
-		for k in self.Info_Network.Nodes:
-			self.State_Space[k] = self.Update_Buffer[k]			
-			
-	def Calculate_Info_Vars(self):
-		if self.Estimator.Source.Type == "Pairwise":
-			self.Info_Network.Links[self.Simulation_Nodes].Calculate(self.Estimator)
-		elif self.Estimator.Source.Type == "Point":
-			self.Info_Network.Nodes[self.Simulation_Nodes[0]].Calculate(self.Estimator)
-			
-		for add_var in self.Additional_InfoVar:
-			add_var.Estimate_the_Variable()
-			
-	def Post_Estimation_for_E(self):
-		if len(self.Selected_Links) != len(self.Info_Network.Links):
-				print("Wanring : possible to be insufficient for estimating E")	
-		for ind_node in self.Selected_Nodes:
-			Save_File = open(self.Save_Directory+"Node_%s_E_values.txt"%ind_node,'w')
-			Save_File.write("E|\n")
-			for t in range(self.Simulation_Time_Limit-1):
-				value = self.Estimate_E(t, ind_node)
-				Save_File.write("%03d:"%(t+1))
-				if value >= 0:
-					Save_File.write("+%0.3f|\n"%value)
-				else:
-					Save_File.write("%0.3f|\n"%value)
-			Save_File.close()
-			
-	def Estimate_E(self, simulation_time, node_index):
-		# Delta_H0 = Flow_Sum - E + alpha_1
-		The_Node = self.Info_Network.Nodes[node_index]
-		Delta_H0 = The_Node.Var_["H0'"][simulation_time] - The_Node.Var_["H0"][simulation_time]
-		Alpha_1 = The_Node.Alpha_["1"][simulation_time]
-		Flow_Sum = 0
-		for neighbor in self.Info_Network.Nodes[node_index].Neighbors:
-			if (node_index, neighbor) in self.Info_Network.Links:
-				link_ind = (node_index, neighbor)
-				direction = "1"
-			else:
-				link_ind = (neighbor, node_index)
-				direction = "2"
-			T = self.Info_Network.Links[link_ind].Var_["TE"+direction][simulation_time]
-			rT = self.Info_Network.Links[link_ind].Var_["rTE"+direction][simulation_time]
-			Flow_Sum += T - rT
-		E = Flow_Sum - Delta_H0 + Alpha_1
-		return E
-		
-	def Save_States(self, Simulation_Time, Previous_States):
-		Data = ""
-		for k in self.Info_Network.Nodes:
-			Data = Data + "%0.4f|"%Previous_States[k]		
-			Data = Data + "%0.4f|"%self.State_Space[k]
-		Data = Data[:-1] + "\n"
-		
-		Save_File = open(self.Ensemble_Directory+"at_time%03d.txt"%Simulation_Time,'a')
-		Save_File.write(Data)
-		Save_File.close()
-		
-	def Post_Analysis(self):
-		for ind_tuple in self.Selected_Links:
-			self.Simulation_Nodes = ind_tuple
-			for t in range(int(self.Simulation_Time_Limit/self.Save_Interval)-1):
-				ensemble_data = self.Ensemble_Directory+"at_time%03d.txt"%((t+1)*self.Save_Interval)
-				self.Estimator.Source.Init_Source_Post_Analysis(self.Info_Network.Nodes, ensemble_data)
-				self.Calculate_Info_Vars()
-				self.Save_Info_Vars(t+1)
-				
-	def Set_Topology(self):
-		raise NotImplementedError("Need to override this function")
-		
-	def Init_State_Space(self):
-		raise NotImplementedError("Need to override this function")
-				
-	def Set_Estimator(self):
-		raise NotImplementedError("Need to override this function")
-				
-	def Dynamics_of_States(self,t):
-		raise NotImplementedError("Need to override this function")
-	
+
+import copy
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
+
+from Core import Checkpoint
+from Core import Exact_Propagation
+from Core import Information_Network
+from Core import Profiling
+from Core import Progress
+from Core import Result_Cache
+from Core import Temporal_Results
+from Core.Estimators import Gaussian
+from Core.Estimators import Several_Information_Variables
+from Core.Estimators import Simple_Binning
+
+class Custom_FIFO():
+	# Methods timed when the Profiling flag is on (extended by the subclasses).
+	Profiled_Phases = ["Save_Info_Vars"]
+	# The registered information variables do not depend on the link or node : only the first one estimates
+	# and saves them (Model_Basic.Generate_Unit); models without units save them with every one.
+	Observing_Unit = True
+	
+	def __init__(self):
+		self.Properties = {}
+		self.Simulation_Nodes = ""	
+		self.Info_Network = ""
+		self.Estimator = ""
+		self.Additional_InfoVar = ""
+		self.Save_Directory = ""
+		
+	def Register_Properties(self):
+		pass
+		
+	def Register_Topology(self):
+		self.Properties["Nodes"] = ""
+		self.Properties["Links"] = ""
+		for ind_node in self.Info_Network.Nodes:
+			self.Properties["Nodes"] = self.Properties["Nodes"] + ind_node + "|"
+		for ind_link in self.Info_Network.Links:
+			self.Properties["Links"] = self.Properties["Links"] + "%s,%s|"%(ind_link) + " "
+			
+	def Save_Properties(self):
+		Save_File = open(self.Save_Directory+"Simulation_Properties.txt",'w')
+		for key in self.Properties:
+			Save_File.write(key + " : " + self.Properties[key] + "\n")
+		Save_File.close()
+		
+	def Create_File_Header(self):
+		for ind_node in self.Info_Network.Nodes:
+			Save_File = open(self.Save_Directory+"Node_%s.txt"%ind_node,'w')
+			for key in self.Info_Network.Nodes[ind_node].Var_:
+				Save_File.write(key+"|")
+			for key in self.Info_Network.Nodes[ind_node].Alpha_:
+				Save_File.write(key+"|")
+			Save_File.write("\n")
+			Save_File.close()
+			
+		for ind_link in self.Info_Network.Links:
+			Save_File = open(self.Save_Directory+"Link_%s_%s.txt"%ind_link,'w')
+			for key in self.Info_Network.Links[ind_link].Var_:
+				Save_File.write(key+"|")
+			for key in self.Info_Network.Links[ind_link].Alpha_:
+				Save_File.write(key+"|")
+			Save_File.write("\n")
+			Save_File.close()
+		
+		for add_var in self.Additional_InfoVar:
+			add_var.Create_Header(self.Save_Directory)
+		
+	def Save_Info_Vars(self, Simulation_Time):
+		if Simulation_Time == 1:
+			return
+			
+		if self.Estimator.Source.Type == "Pairwise":
+			File_Name = "Link_%s_%s.txt"%self.Simulation_Nodes
+			Save_Object = self.Info_Network.Links[self.Simulation_Nodes]
+		elif self.Estimator.Source.Type == "Point":
+			File_Name = "Node_%s.txt"%self.Simulation_Nodes[0]
+			Save_Object = self.Info_Network.Nodes[self.Simulation_Nodes[0]]
+			
+		Save_File = open(self.Save_Directory+File_Name,'a')
+		Save_File.write("%03d:"%(Simulation_Time-1))
+		time_ind = Simulation_Time-2
+		for key in Save_Object.Var_:
+			value = Save_Object.Var_[key][time_ind]
+			if value >= 0:
+				Save_File.write("+%0.3f|"%value)
+			else:
+				Save_File.write("%0.3f|"%value)
+		for key in Save_Object.Alpha_:
+			value = Save_Object.Alpha_[key][time_ind]
+			if value >= 0:
+				Save_File.write("+%0.3f|"%value)
+			else:
+				Save_File.write("%0.3f|"%value)
+		Save_File.write("\n")
+		Save_File.close()
+		
+		if self.Observing_Unit:
+			for add_var in self.Additional_InfoVar:
+				add_var.Save_the_Variable(self.Save_Directory, Simulation_Time)
+		
+			
+	# Timers around Profiled_Phases and counts of the quantities requested from the estimator;
+	# the summary is saved in Profile.json next to the results.
+	def Start_Profiling(self):
+		self.Profiler = Profiling.A_Profiler()
+		self.Profiler.Instrument(self, self.Profiled_Phases)
+		self.Estimator = Profiling.Counted_Estimator(self.Estimator, self.Profiler)
+		self.Bytes_at_Start = self.Output_Bytes()
+		
+	def Save_Profile(self):
+		self.Profiler.Counters["bytes_written"] = self.Output_Bytes() - self.Bytes_at_Start
+		self.Profiler.Save(self.Save_Directory+"Profile.json")
+		
+	def Output_Bytes(self):
+		Total = Profiling.Directory_Bytes(self.Save_Directory)
+		if getattr(self, "Ensemble_Directory", ""):
+			Total += Profiling.Directory_Bytes(self.Ensemble_Directory)
+		return Total
+		
+	def Read_for_(self, file_name, Keys = None):
+		Read_Length = max(self.Simulation_Time_Limit - 1, 0)
+		Times, Data_Flow = Temporal_Results.Read_Results(file_name, Keys)
+		for k in Data_Flow:
+			Data_Flow[k] = Data_Flow[k][:Read_Length]
+		return Data_Flow
+		
+
+class Model_Basic(Custom_FIFO):
+	Profiled_Phases = ["Construct_Ensemble", "Init_State_Space", "Simulate_Model", "Dynamics_of_States", "Record_Transition", "Update_States", "Save_States",
+		"Vectorized_Ensemble", "Calculate_Info_Vars", "Save_Info_Vars", "Load_Snapshot", "Read_Snapshot", "_Estimate_Snapshot", "Post_Estimation_for_E"]
+	
+	def __init__(self):
+		self.Q = 0
+		self.Total_Nodes = 0
+		
+		self.Simulation_Time_Limit = 0
+		self.Simulation_Cut_up = -1
+		self.Simulation_Cut_down = 0
+		self.Save_Interval = 1
+		self.Post_Analysis_Workers = 1 # snapshots estimated concurrently; -1 uses all cores.
+		self.Generate_Data_Workers = 1 # realtime links and nodes simulated in concurrent processes; -1 uses all cores.
+		self.Worker_Entropy = None
+		self.Post_Analysis_Prefetch = False # sequential Post_Analysis : read the next snapshot on a thread meanwhile
+		
+		# Time pooling for stationary regimes : each estimate at time t also uses the transitions at
+		# t - Pooling_Stride, ..., t - (Pooling_Window-1)*Pooling_Stride (in snapshots for Post_Analysis).
+		self.Pooling_Window = 1
+		self.Pooling_Stride = 1
+		
+		# Realtime Simple_Binning runs : with Bootstrap_Replicates > 0, percentile intervals of the link
+		# variables (MI, TE, rTE) are saved per time step in Link_X_Y_Bootstrap.txt.
+		self.Bootstrap_Replicates = 0
+		self.Bootstrap_Confidence = 0.95
+		# With Surrogate_Replicates > 0, permutation p-values (and the 95% null quantile) of the link
+		# variables are saved per time step in Link_X_Y_Significance.txt.
+		self.Surrogate_Replicates = 0
+		
+		# Exact realtime estimates : with Exact_Propagation = True, the sources of Simple_Binning are filled with
+		# the exact distributions of the model (see Core/Exact_Propagation.py) instead of Size_of_Ensemble
+		# simulated members. The model defines Initial_Probabilities and Transition_Probabilities; with
+		# Deterministic_Dynamics = True, the transitions are read from Dynamics_of_States instead.
+		self.Exact_Propagation = False
+		self.Deterministic_Dynamics = False
+		self.Exact_Max_States = 4096
+		self.Exact_Engine = None
+		
+		# Vectorized ensembles : with Vectorized = True, all the members are simulated at once, State_Space and
+		# Update_Buffer holding one array (over the members) per node. The model defines
+		# Init_State_Space_Vectorized and Dynamics_of_States_Vectorized.
+		self.Vectorized = False
+		
+		self.Profiling = False # phase timers and estimator call counts, saved in Profile.json
+		
+		# Progress of Generate_Data and Post_Analysis : a line every Progress_Interval seconds (0 : none)
+		# and, with Progress_Log, each report appended to that file as a JSON line.
+		self.Progress_Interval = 30.0
+		self.Progress_Log = ""
+		self.Reporter = None
+		
+		# Checkpoints : with Checkpoint_Interval > 0 (seconds), the progress of Generate_Data and Post_Analysis
+		# is saved at most that often in Checkpoint_<stage>.pkl; with Resume = True, they continue from it.
+		self.Checkpoint_Interval = 0
+		self.Resume = False
+		self.Checkpoint_Stage = ""
+		self.Checkpoint_Unit = 0 # ensembles (Generate_Data) or rows (Post_Analysis) completed
+		self.Resume_Unit = 0
+		self.Resume_Member = 0
+		self.Resumed_Sources = None
+		self.Next_Checkpoint = 0
+		
+		# Result cache : with Result_Cache set to a store directory, a realtime Generate_Data or a Post_Analysis
+		# whose Cache_Key is already stored is copied from it instead of being computed. Replicate tells
+		# independent repetitions of the same run apart (e.g. the trials of a sweep).
+		self.Result_Cache = ""
+		self.Result_Cache_Bytes = 2**30
+		self.Replicate = 0
+		
+		self.Properties = {}
+		
+		self.State_Space = {}
+		self.Update_Buffer = {}
+		self.Simulation_Nodes = ()		
+		
+		self.Estimator = ""
+			
+		self.Info_Network = Information_Network.A_Network()
+		self.Additional_InfoVar = Several_Information_Variables.An_Observer_Registry() # information variables computed beside the links and nodes
+
+		self.Save_Directory = ""
+		self.Ensemble_Directory = ""
+		
+		self.Selected_Nodes = []
+		self.Selected_Links = []
+		
+	def Initialize(self):
+		self.Set_Topology()	
+		self.Init_Space()
+		self.Set_Estimator()
+		if not isinstance(self.Additional_InfoVar, Several_Information_Variables.An_Observer_Registry):
+			self.Additional_InfoVar = Several_Information_Variables.An_Observer_Registry(self.Additional_InfoVar)
+
+		self.Register_Properties()
+		if self.Pooling_Window != 1:
+			self.Properties["Pooling_Window"] = str(self.Pooling_Window)
+			self.Properties["Pooling_Stride"] = str(self.Pooling_Stride)
+		if self.Bootstrap_Replicates > 0:
+			if not isinstance(self.Estimator.Source, Simple_Binning.Source):
+				raise ValueError("Bootstrap_Replicates needs a Simple_Binning estimator")
+			self.Bootstrap = Simple_Binning.Bootstrap_Estimator(self.Estimator.Source.Q, self.Estimator.Source.Dimension, self.Bootstrap_Replicates)
+			self.Properties["Bootstrap_Replicates"] = str(self.Bootstrap_Replicates)
+			self.Properties["Bootstrap_Confidence"] = str(self.Bootstrap_Confidence)
+		if self.Surrogate_Replicates > 0:
+			if not isinstance(self.Estimator.Source, Simple_Binning.Source):
+				raise ValueError("Surrogate_Replicates needs a Simple_Binning estimator")
+			self.Surrogate = Simple_Binning.Surrogate_Estimator(self.Estimator.Source.Q, self.Estimator.Source.Dimension, self.Surrogate_Replicates)
+			self.Properties["Surrogate_Replicates"] = str(self.Surrogate_Replicates)
+		self.Save_Properties()
+		
+		self.Create_File_Header()	
+		if self.Bootstrap_Replicates > 0:
+			self.Create_Bootstrap_Header()
+		if self.Surrogate_Replicates > 0:
+			self.Create_Significance_Header()
+		if self.Profiling:
+			self.Start_Profiling()
+		
+	def Init_Space(self):
+		for k in self.Info_Network.Nodes:
+			self.State_Space[k] = 0
+			self.Update_Buffer[k] = 0
+		
+		random.seed(time.time())	
+		
+		if len(self.Selected_Nodes)==0:
+			for ind_node in self.Info_Network.Nodes:
+				self.Selected_Nodes.append(ind_node)
+				
+		if len(self.Selected_Links)==0:
+			for ind_link in self.Info_Network.Links:
+				self.Selected_Links.append(ind_link)
+			
+	def Generate_Data(self):
+		if self.Simulation_Cut_up == -1 :
+			self.Simulation_Cut_up = self.Simulation_Time_Limit		
+			
+		if self.Estimator.Source.Analysis == "Realtime":
+			if self.Exact_Propagation:
+				self.Start_Exact_Propagation()
+			if self.Load_Cached_Results("Generate_Data"):
+				return
+			Steps = [t+1 for t in range(self.Simulation_Time_Limit) if t >= self.Simulation_Cut_down and t < self.Simulation_Cut_up]
+			self.Start_Progress("Generate_Data", self.Size_of_Ensemble*sum(Steps)*(len(self.Selected_Links)+len(self.Selected_Nodes)), "member-steps")
+			self.Start_Checkpoints("Generate_Data")
+			if self.Generate_Data_Workers != 1:
+				self.Generate_Data_in_Parallel(Steps)
+			else:
+				for Unit in self.Generate_Data_Units():
+					self.Generate_Unit(*Unit)
+					self.Report_Unit(*Unit)
+			self.Post_Estimation_for_E()
+			self.Store_Cached_Results()
+		elif self.Estimator.Source.Analysis == "Post_Analysis":
+			self.Start_Progress("Generate_Data", self.Size_of_Ensemble*self.Simulation_Time_Limit, "member-steps")
+			self.Start_Checkpoints("Generate_Data")
+			self.Checkpointed_Ensemble(self.Simulation_Time_Limit)
+		self.Finish_Checkpoints()
+		if self.Reporter is not None:
+			self.Reporter.Finish()
+		if self.Profiling:
+			self.Save_Profile()
+			
+	# The links, then the nodes, of a realtime Generate_Data : each is simulated and estimated on its own.
+	def Generate_Data_Units(self):
+		return [("Link", ind_link) for ind_link in self.Selected_Links] + [("Node", ind_node) for ind_node in self.Selected_Nodes]
+		
+	def Generate_Unit(self, Kind, Index):
+		if Kind == "Link":
+			self.Simulation_Nodes = Index
+			self.Estimator.Source.Type = "Pairwise"
+		else:
+			self.Simulation_Nodes = [Index] + self.Info_Network.Nodes[Index].Neighbors
+			self.Estimator.Source.Type = "Point"
+		self.Observing_Unit = (Kind, Index) == self.Generate_Data_Units()[0]
+		for t in range(self.Simulation_Time_Limit):
+			if t >= self.Simulation_Cut_down and t < self.Simulation_Cut_up:
+				self.Checkpointed_Ensemble(t+1)
+				
+	def Report_Unit(self, Kind, Index):
+		if Kind == "Link":
+			print("\tComplete simulations for the link %s ~ %s"%Index)
+		else:
+			print("\tComplete simulations for the node %s"%Index)
+			
+	# Every link and node runs in a worker process with its own random streams (spawned from one seed
+	# drawn here, so a seeded run is reproducible for any number of workers). A worker writes its rows
+	# in a directory of its own; they are appended to the result files, and its values put in Info_Network,
+	# in the order of the sequential run. Checkpoints are saved between links and nodes.
+	def Generate_Data_in_Parallel(self, Steps):
+		Units = self.Generate_Data_Units()
+		First = 0
+		while First < len(Units) and (First+1)*len(Steps) <= self.Resume_Unit:
+			for Simulation_Time in Steps:
+				self.Is_Completed_Unit(self.Size_of_Ensemble*Simulation_Time)
+			First += 1
+		if First < len(Units) and First*len(Steps) < self.Resume_Unit:
+			raise ValueError("The checkpoint was saved inside a link or node : resume it with Generate_Data_Workers = 1")
+		self.Resume_Member = 0
+		self.Resumed_Sources = None
+		
+		if self.Worker_Entropy is None:
+			self.Worker_Entropy = random.getrandbits(128)
+		Seeds = numpy.random.SeedSequence(self.Worker_Entropy).spawn(len(Units))
+		Workers = self.Generate_Data_Workers
+		if Workers < 1:
+			Workers = os.cpu_count()
+		Workers = max(1, min(Workers, len(Units) - First))
+		
+		Scratch = tempfile.mkdtemp(prefix = "Workers_", dir = self.Save_Directory or ".")
+		try:
+			with ProcessPoolExecutor(max_workers = Workers) as Pool:
+				Futures = {}
+				for i in range(First, len(Units)):
+					Futures[i] = Pool.submit(self._Generate_Unit_in_Process, Units[i], Seeds[i], os.path.join(Scratch, "%04d"%i) + os.sep)
+				for i in range(First, len(Units)):
+					Kind, Index = Units[i]
+					Values = Futures.pop(i).result()
+					if Kind == "Link":
+						self.Info_Network.Links[Index] = Values
+					else:
+						self.Info_Network.Nodes[Index] = Values
+					self.Merge_Unit_Files(os.path.join(Scratch, "%04d"%i) + os.sep)
+					self.Reporter.Advance(Work = self.Size_of_Ensemble*sum(Steps), Members = 0 if self.Exact_Propagation else self.Size_of_Ensemble*len(Steps), Estimations = len(Steps))
+					for j in range(len(Steps)):
+						self.Complete_Unit(Checkpoint_Allowed = j == len(Steps)-1)
+					self.Report_Unit(Kind, Index)
+		finally:
+			shutil.rmtree(Scratch, ignore_errors = True)
+			
+	def _Generate_Unit_in_Process(self, Unit, Seed, Directory):
+		os.makedirs(Directory, exist_ok = True)
+		self.Save_Directory = Directory
+		self.Checkpoint_Interval = 0
+		self.Checkpoint_Unit = 0
+		self.Resume_Unit = 0
+		self.Seed_Streams(Seed)
+		self.Generate_Unit(*Unit)
+		if Unit[0] == "Link":
+			return self.Info_Network.Links[Unit[1]]
+		return self.Info_Network.Nodes[Unit[1]]
+		
+	# Independent random streams of a worker : the module generators and those of the estimators.
+	def Seed_Streams(self, Seed):
+		random.seed(int(Seed.generate_state(1, numpy.uint64)[0]))
+		numpy.random.seed(Seed.generate_state(4))
+		for Owner in [self.Estimator, getattr(self, "Bootstrap", None), getattr(self, "Surrogate", None)]:
+			if Owner is not None and hasattr(Owner, "RNG"):
+				Owner.RNG = numpy.random.default_rng(Seed.spawn(1)[0])
+				
+	def Merge_Unit_Files(self, Directory):
+		if not os.path.isdir(Directory):
+			return
+		for Name in sorted(os.listdir(Directory)):
+			with open(Directory+Name, 'r') as Unit_File, open(self.Save_Directory+Name, 'a') as Save_File:
+				Save_File.write(Unit_File.read())
+				
+	# Worker processes receive the model without its progress reporter and profiler.
+	def __getstate__(self):
+		State = dict(self.__dict__)
+		State["Reporter"] = None
+		if "Profiler" in State:
+			del State["Profiler"]
+			for Name in self.Profiled_Phases:
+				State.pop(Name, None)
+			State["Estimator"] = self.Estimator.Estimator
+		return State
+		
+	def Checkpointed_Ensemble(self, Simulation_Time):
+		if self.Is_Completed_Unit(self.Size_of_Ensemble*Simulation_Time):
+			return
+		self.Construct_Ensemble(Simulation_Time)
+		self.Complete_Unit()
+				
+	def Construct_Ensemble(self, Simulation_Time):
+		self.Estimator.Source.Init_Source_Realtime(self.Simulation_Nodes)
+		if self.Additional_InfoVar:
+			self.Additional_InfoVar.Init_Source_Realtime(self.Simulation_Nodes, Observed = self.Observing_Unit)
+			
+		if self.Exact_Propagation:
+			self.Exact_Ensemble(Simulation_Time)
+		elif self.Vectorized:
+			self.Vectorized_Ensemble(Simulation_Time)
+		else:
+			First_Member = self.Restore_Partial_Ensemble()
+			if First_Member > 0 and self.Reporter is not None:
+				self.Reporter.Total_Work -= First_Member*Simulation_Time
+			for c in range(First_Member, self.Size_of_Ensemble):
+				self.Init_State_Space()
+				self.Simulate_Model(Simulation_Time)
+				if self.Reporter is not None:
+					self.Reporter.Advance(Work = Simulation_Time, Members = 1)
+				if self.Is_Checkpoint_Due():
+					self.Save_Checkpoint(Member = c+1)
+			
+		if self.Estimator.Source.Analysis == "Realtime":		
+			self.Calculate_Info_Vars()
+			if self.Reporter is not None:
+				self.Reporter.Advance(Estimations = 1)
+			self.Save_Info_Vars(Simulation_Time)
+			if self.Bootstrap_Replicates > 0:
+				self.Save_Bootstrap_Intervals(Simulation_Time)
+			if self.Surrogate_Replicates > 0:
+				self.Save_Significance(Simulation_Time)
+			
+	def Start_Exact_Propagation(self):
+		if self.Bootstrap_Replicates > 0 or self.Surrogate_Replicates > 0:
+			raise ValueError("Exact_Propagation has no sampling error : set Bootstrap_Replicates and Surrogate_Replicates to 0")
+		if not isinstance(self.Estimator.Source, Simple_Binning.Source):
+			raise ValueError("Exact_Propagation needs a Simple_Binning estimator")
+		self.Exact_Engine = Exact_Propagation.An_Exact_Propagator(self, self.Exact_Max_States)
+		self.Exact_Engine.Propagate(self.Simulation_Time_Limit)
+		if self.Deterministic_Dynamics:
+			Attractors = self.Exact_Engine.Attractors(self.Simulation_Time_Limit-1)
+			self.Properties["Attractors"] = "%d cycles; largest basins :"%len(Attractors)
+			for Cycle, Weight in Attractors[:5]:
+				self.Properties["Attractors"] += " period %d (%0.3f) |"%(len(Cycle), Weight)
+		self.Properties["Exact_Propagation"] = "True"
+		self.Save_Properties()
+		
+	# The sources hold the exact probabilities of the ensemble that Size_of_Ensemble members would sample.
+	def Exact_Ensemble(self, Simulation_Time):
+		self.Exact_Engine.Fill_Source(self.Estimator.Source, Simulation_Time)
+		if self.Additional_InfoVar and self.Additional_InfoVar.Shared is not None:
+			self.Exact_Engine.Fill_Source(self.Additional_InfoVar.Shared, Simulation_Time)
+		if self.Reporter is not None:
+			self.Reporter.Advance(Work = self.Size_of_Ensemble*Simulation_Time)
+			
+	def Vectorized_Ensemble(self, Simulation_Time):
+		if self.Restore_Partial_Ensemble() > 0:
+			raise ValueError("The checkpoint was saved inside an ensemble : resume it with Vectorized = False")
+		self.Init_State_Space_Vectorized()
+		Previous_States = {}
+		for t in range(Simulation_Time):
+			self.Dynamics_of_States_Vectorized(t)
+			if self.Is_Pooled_Time(t, Simulation_Time):
+				self.Record_Transitions_Vectorized()
+				
+			if self.Estimator.Source.Analysis == "Post_Analysis" and t%self.Save_Interval == 0:
+				if t != 0:
+					self.Save_States_Vectorized(t, Previous_States)
+				for k in self.Info_Network.Nodes:
+					Previous_States[k] = self.State_Space[k]
+					
+			self.Update_States()
+		if self.Reporter is not None:
+			self.Reporter.Advance(Work = self.Size_of_Ensemble*Simulation_Time, Members = self.Size_of_Ensemble)
+			
+	def Simulate_Model(self, Simulation_Time):
+		Previous_States = {}
+		for t in range(Simulation_Time):
+			self.Dynamics_of_States(t)
+			if self.Is_Pooled_Time(t, Simulation_Time):
+				self.Record_Transition()
+				
+			if self.Estimator.Source.Analysis == "Post_Analysis" and t%self.Save_Interval == 0:
+				if t != 0:
+					self.Save_States(t, Previous_States)
+				for k in self.Info_Network.Nodes:
+					Previous_States[k] = self.State_Space[k]
+				
+			self.Update_States()
+			
+	def Record_Transition(self):
+		self.Estimator.Source.Update_Source_Realtime(self.State_Space,self.Update_Buffer)
+		if self.Additional_InfoVar:
+			self.Additional_InfoVar.Update_Source_Realtime(self.State_Space,self.Update_Buffer)
+			
+	def Record_Transitions_Vectorized(self):
+		self.Estimator.Source.Update_Source_Realtime_Batch(self.State_Space,self.Update_Buffer)
+		if self.Additional_InfoVar:
+			self.Additional_InfoVar.Update_Source_Realtime_Batch(self.State_Space,self.Update_Buffer)
+			
+	# True when the transition t -> t+1 belongs to the sample set of the estimate at Simulation_Time.
+	def Is_Pooled_Time(self, t, Simulation_Time):
+		Lag = Simulation_Time-1 - t
+		if Lag % self.Pooling_Stride != 0:
+			return False
+		return Lag//self.Pooling_Stride < self.Pooling_Window
+		
+	def Snapshot_File(self, Snapshot):
+		return self.Ensemble_Directory+"at_time%03d.txt"%((Snapshot+1)*self.Save_Interval)
+		
+	# The snapshot file(s) for the (t+1)-th post-analysis step; several files are pooled into one ensemble.
+	def Ensemble_Data_for_(self, t):
+		if self.Pooling_Window == 1:
+			return self.Snapshot_File(t)
+		Files = []
+		for j in range(self.Pooling_Window):
+			Snapshot = t - j*self.Pooling_Stride
+			if Snapshot >= 0:
+				Files.append(self.Snapshot_File(Snapshot))
+		return Files
+		
+	# What Source reads for the (t+1)-th step : sources embedding several snapshots (Snapshot_Window =
+	# (length, delay), e.g. Ordinal) get, for each pooled snapshot, the files of the window ending at it.
+	def Source_Data_for_(self, Source, t):
+		Window = getattr(Source, "Snapshot_Window", None)
+		if Window is None:
+			return self.Ensemble_Data_for_(t)
+		Length, Delay = Window
+		Windows = []
+		for j in range(self.Pooling_Window):
+			Snapshot = t - j*self.Pooling_Stride
+			First = Snapshot - (Length-1)*Delay
+			if First >= 0:
+				Windows.append([self.Snapshot_File(s) for s in range(First, Snapshot+1, Delay)])
+		return Windows
+			
+	def Create_Bootstrap_Header(self):
+		for ind_link in self.Info_Network.Links:
+			Save_File = open(self.Save_Directory+"Link_%s_%s_Bootstrap.txt"%ind_link,'w')
+			for key in self.Info_Network.Links[ind_link].Var_:
+				Save_File.write(key+"_lo|"+key+"_hi|")
+			Save_File.write("\n")
+			Save_File.close()
+			
+	# The bootstrap replicates resample the joint counts just used for the point estimates, saved on the row
+	# that holds these estimates in Link_X_Y.txt.
+	def Save_Bootstrap_Intervals(self, Simulation_Time):
+		if self.Estimator.Source.Type != "Pairwise":
+			return
+		self.Bootstrap.Resample(self.Estimator.Source)
+		The_Link = self.Info_Network.Links[self.Simulation_Nodes]
+		Values = The_Link.Evaluate(self.Bootstrap)
+		Tail = (1 - self.Bootstrap_Confidence)/2
+		
+		Save_File = open(self.Save_Directory+"Link_%s_%s_Bootstrap.txt"%self.Simulation_Nodes,'a')
+		Save_File.write("%03d:"%Simulation_Time)
+		for key in The_Link.Var_:
+			for value in numpy.quantile(Values[key], [Tail, 1-Tail]):
+				if value >= 0:
+					Save_File.write("+%0.3f|"%value)
+				else:
+					Save_File.write("%0.3f|"%value)
+		Save_File.write("\n")
+		Save_File.close()
+		
+	def Create_Significance_Header(self):
+		for ind_link in self.Info_Network.Links:
+			Save_File = open(self.Save_Directory+"Link_%s_%s_Significance.txt"%ind_link,'w')
+			for key in self.Info_Network.Links[ind_link].Var_:
+				Save_File.write(key+"_p|"+key+"_q95|")
+			Save_File.write("\n")
+			Save_File.close()
+			
+	# One batch of surrogate tables per shuffled variable, drawn from the joint counts just estimated : the
+	# estimates tested are those of the same table, saved on their row of Link_X_Y.txt.
+	def Save_Significance(self, Simulation_Time):
+		if self.Estimator.Source.Type != "Pairwise":
+			return
+		The_Link = self.Info_Network.Links[self.Simulation_Nodes]
+		Sources = The_Link.Surrogate_Sources()
+		Null = {}
+		for Variable in dict.fromkeys(Sources.values()):
+			self.Surrogate.Permute(Variable, self.Estimator.Source)
+			Values = The_Link.Evaluate(self.Surrogate)
+			for key in Sources:
+				if Sources[key] == Variable:
+					Null[key] = Values[key]
+					
+		Save_File = open(self.Save_Directory+"Link_%s_%s_Significance.txt"%self.Simulation_Nodes,'a')
+		Save_File.write("%03d:"%Simulation_Time)
+		for key in The_Link.Var_:
+			Observed = The_Link.Var_[key][-1]
+			P_Value = (numpy.sum(Null[key] >= Observed) + 1)/(self.Surrogate_Replicates + 1)
+			for value in [P_Value, numpy.quantile(Null[key], 0.95)]:
+				if value >= 0:
+					Save_File.write("+%0.3f|"%value)
+				else:
+					Save_File.write("%0.3f|"%value)
+		Save_File.write("\n")
+		Save_File.close()
+		
+	def Reports_Bias(self):
+		return getattr(self.Estimator, "Report_Bias", False)
+		
+	def Create_Bias_Header(self):
+		for ind_link in self.Info_Network.Links:
+			Save_File = open(self.Save_Directory+"Link_%s_%s_Bias.txt"%ind_link,'w')
+			for key in self.Info_Network.Links[ind_link].Var_:
+				Save_File.write(key+"_bias|")
+			Save_File.write("\n")
+			Save_File.close()
+			
+	# Estimated bias of the link variables just estimated (the same quantities evaluated by the estimator's
+	# Bias_Report), on the row that holds these values in Link_X_Y.txt.
+	def Save_Bias(self, Simulation_Time, Values):
+		Save_File = open(self.Save_Directory+"Link_%s_%s_Bias.txt"%self.Simulation_Nodes,'a')
+		Save_File.write("%03d:"%Simulation_Time)
+		for key in self.Info_Network.Links[self.Simulation_Nodes].Var_:
+			value = Values[key]
+			if value >= 0:
+				Save_File.write("+%0.3f|"%value)
+			else:
+				Save_File.write("%0.3f|"%value)
+		Save_File.write("\n")
+		Save_File.close()
+		
+	def Update_States(self):
+		for k in self.Info_Network.Nodes:
+			self.State_Space[k] = self.Update_Buffer[k]			
+			
+	def Calculate_Info_Vars(self):
+		if self.Estimator.Source.Type == "Pairwise":
+			self.Info_Network.Links[self.Simulation_Nodes].Calculate(self.Estimator)
+		elif self.Estimator.Source.Type == "Point":
+			self.Info_Network.Nodes[self.Simulation_Nodes[0]].Calculate(self.Estimator)
+			
+		if self.Additional_InfoVar and self.Observing_Unit:
+			self.Additional_InfoVar.Estimate_the_Variables()
+			
+	def Post_Estimation_for_E(self):
+		if len(self.Selected_Links) != len(self.Info_Network.Links):
+				print("Wanring : possible to be insufficient for estimating E")	
+		for ind_node in self.Selected_Nodes:
+			Save_File = open(self.Save_Directory+"Node_%s_E_values.txt"%ind_node,'w')
+			Save_File.write("E|\n")
+			for t in range(self.Simulation_Time_Limit-1):
+				value = self.Estimate_E(t, ind_node)
+				Save_File.write("%03d:"%(t+1))
+				if value >= 0:
+					Save_File.write("+%0.3f|\n"%value)
+				else:
+					Save_File.write("%0.3f|\n"%value)
+			Save_File.close()
+			
+	def Estimate_E(self, simulation_time, node_index):
+		# Delta_H0 = Flow_Sum - E + alpha_1
+		The_Node = self.Info_Network.Nodes[node_index]
+		Delta_H0 = The_Node.Var_["H0'"][simulation_time] - The_Node.Var_["H0"][simulation_time]
+		Alpha_1 = The_Node.Alpha_["1"][simulation_time]
+		Flow_Sum = 0
+		for neighbor in self.Info_Network.Nodes[node_index].Neighbors:
+			if (node_index, neighbor) in self.Info_Network.Links:
+				link_ind = (node_index, neighbor)
+				direction = "1"
+			else:
+				link_ind = (neighbor, node_index)
+				direction = "2"
+			T = self.Info_Network.Links[link_ind].Var_["TE"+direction][simulation_time]
+			rT = self.Info_Network.Links[link_ind].Var_["rTE"+direction][simulation_time]
+			Flow_Sum += T - rT
+		E = Flow_Sum - Delta_H0 + Alpha_1
+		return E
+		
+	def Save_States(self, Simulation_Time, Previous_States):
+		Data = ""
+		for k in self.Info_Network.Nodes:
+			Data = Data + "%0.4f|"%Previous_States[k]		
+			Data = Data + "%0.4f|"%self.State_Space[k]
+		Data = Data[:-1] + "\n"
+		
+		Save_File = open(self.Ensemble_Directory+"at_time%03d.txt"%Simulation_Time,'a')
+		Save_File.write(Data)
+		Save_File.close()
+		
+	# One row per member, as written by Save_States.
+	def Save_States_Vectorized(self, Simulation_Time, Previous_States):
+		Columns = []
+		for k in self.Info_Network.Nodes:
+			Columns.append(numpy.broadcast_to(Previous_States[k], (self.Size_of_Ensemble,)))
+			Columns.append(numpy.broadcast_to(self.State_Space[k], (self.Size_of_Ensemble,)))
+		Save_File = open(self.Ensemble_Directory+"at_time%03d.txt"%Simulation_Time,'a')
+		numpy.savetxt(Save_File, numpy.column_stack(Columns), fmt = "%0.4f", delimiter = "|")
+		Save_File.close()
+		
+	def Post_Analysis(self):
+		if self.Load_Cached_Results("Post_Analysis"):
+			return
+		Snapshots = int(self.Simulation_Time_Limit/self.Save_Interval)-1
+		self.Start_Progress("Post_Analysis", len(self.Selected_Links)*Snapshots, "estimations")
+		if self.Reports_Bias():
+			self.Create_Bias_Header()
+		self.Start_Checkpoints("Post_Analysis")
+		if self.Post_Analysis_Workers != 1:
+			self.Post_Analysis_in_Parallel()
+		else:
+			self.Post_Analysis_by_Snapshot()
+		self.Finish_Checkpoints()
+		self.Store_Cached_Results()
+		self.Reporter.Finish()
+		if self.Profiling:
+			self.Save_Profile()
+			
+	def Start_Progress(self, Label, Total_Work, Unit):
+		Stream = sys.stdout if self.Progress_Interval > 0 else None
+		Context = {"save_directory":self.Save_Directory}
+		self.Reporter = Progress.A_Progress_Reporter(Label, Total_Work, Unit, self.Progress_Interval, self.Progress_Log, Context, Stream)
+		
+	Cached_Settings = ["Q", "Total_Nodes", "Size_of_Ensemble", "Simulation_Time_Limit", "Simulation_Cut_up", "Simulation_Cut_down", "Save_Interval",
+		"Pooling_Window", "Pooling_Stride", "Bootstrap_Replicates", "Bootstrap_Confidence", "Surrogate_Replicates", "Exact_Propagation", "Vectorized"]
+		
+	# Everything the results of a stage depend on : the registered properties, the topology and selection,
+	# the run settings, the estimator settings, the code (Core and the model's package) and, for
+	# Post_Analysis, the contents of the ensemble snapshots.
+	def Cache_Description(self, Stage):
+		Estimator = self.Estimator
+		if isinstance(Estimator, Profiling.Counted_Estimator):
+			Estimator = Estimator.Estimator
+		Simple_Values = lambda Object : {Name:Value for Name, Value in vars(Object).items() if isinstance(Value, (bool, int, float, str))}
+		Model_File = sys.modules[type(self).__module__].__file__
+		
+		Description = {"stage":Stage, "replicate":self.Replicate, "model":type(self).__module__+"."+type(self).__qualname__}
+		Description["properties"] = self.Properties
+		Description["topology"] = {ind_node:self.Info_Network.Nodes[ind_node].Neighbors for ind_node in self.Info_Network.Nodes}
+		Description["selection"] = [self.Selected_Nodes, self.Selected_Links]
+		Description["settings"] = {Name:getattr(self, Name, None) for Name in self.Cached_Settings}
+		Description["estimator"] = [type(Estimator).__module__+"."+type(Estimator).__qualname__, Simple_Values(Estimator), Simple_Values(Estimator.Source)]
+		Description["additional"] = [type(add_var).__qualname__+":"+add_var.Name for add_var in self.Additional_InfoVar]
+		Description["code"] = Result_Cache.Source_Hash([os.path.dirname(os.path.abspath(__file__)), os.path.dirname(os.path.abspath(Model_File))])
+		if Stage == "Post_Analysis":
+			Snapshots = range(int(self.Simulation_Time_Limit/self.Save_Interval)-1)
+			Files = []
+			for t in Snapshots:
+				Data = self.Ensemble_Data_for_(t)
+				Files += Data if isinstance(Data, list) else [Data]
+			Description["ensemble"] = Result_Cache.Hash_Files(sorted(set(Files)))
+		return Description
+		
+	def Load_Cached_Results(self, Stage):
+		self.Cache_Key = ""
+		if self.Result_Cache == "":
+			return False
+		self.Cache_Store = Result_Cache.A_Result_Cache(self.Result_Cache, self.Result_Cache_Bytes)
+		self.Cache_Entry = self.Cache_Description(Stage)
+		self.Cache_Key = Result_Cache.Hash_Description(self.Cache_Entry)
+		Network = self.Cache_Store.Load(self.Cache_Key, self.Save_Directory)
+		if Network is None:
+			return False
+		self.Info_Network = Network
+		self.Start_Progress(Stage, 0, "cached")
+		print("\t%s served from the result cache (%s)"%(Stage, self.Cache_Key[:12]))
+		return True
+		
+	def Store_Cached_Results(self):
+		if self.Result_Cache == "":
+			return
+		Files = self.Result_Files() + [self.Save_Directory+"Node_%s_E_values.txt"%ind_node for ind_node in self.Selected_Nodes]
+		Files = [File_Name for File_Name in Files if os.path.exists(File_Name)]
+		self.Cache_Store.Store(self.Cache_Key, Files, self.Info_Network, self.Cache_Entry)
+		
+	# Work is split into units (an ensemble of Generate_Data, a (link, snapshot) row of Post_Analysis,
+	# snapshot by snapshot) counted in loop order; a checkpoint records the completed units together with
+	# everything needed to continue identically : the RNG states, the network values, the partial ensemble
+	# sources (when saved between members) and the result files (contents, or sizes for the appended
+	# ensemble snapshots).
+	def Checkpoint_File(self, Stage):
+		if Stage == "Generate_Data" and self.Estimator.Source.Analysis == "Post_Analysis":
+			return self.Ensemble_Directory+"Checkpoint_%s.pkl"%Stage
+		return self.Save_Directory+"Checkpoint_%s.pkl"%Stage
+		
+	def Start_Checkpoints(self, Stage):
+		self.Checkpoint_Stage = Stage
+		self.Checkpoint_Unit = 0
+		self.Resume_Unit = 0
+		self.Resume_Member = 0
+		self.Resumed_Sources = None
+		self.Worker_Entropy = None
+		self.Next_Checkpoint = time.perf_counter() + self.Checkpoint_Interval
+		if self.Resume and os.path.exists(self.Checkpoint_File(Stage)):
+			self.Load_Checkpoint(Stage)
+			
+	def Finish_Checkpoints(self):
+		if self.Checkpoint_Interval > 0:
+			self.Save_Checkpoint(Done = True)
+			
+	def Is_Checkpoint_Due(self):
+		return self.Checkpoint_Interval > 0 and time.perf_counter() >= self.Next_Checkpoint
+		
+	# True (and skipped) for the units completed before the checkpoint being resumed.
+	def Is_Completed_Unit(self, Work):
+		if self.Checkpoint_Unit >= self.Resume_Unit:
+			return False
+		self.Checkpoint_Unit += 1
+		self.Reporter.Total_Work -= Work
+		return True
+		
+	def Complete_Unit(self, Checkpoint_Allowed = True):
+		self.Checkpoint_Unit += 1
+		if Checkpoint_Allowed and self.Is_Checkpoint_Due():
+			self.Save_Checkpoint()
+			
+	def Save_Checkpoint(self, Member = 0, Done = False):
+		State = {"Stage":self.Checkpoint_Stage, "Unit":self.Checkpoint_Unit, "Member":Member, "Done":Done}
+		State["Random_State"] = random.getstate()
+		State["Numpy_State"] = numpy.random.get_state()
+		State["Estimator_RNG"] = getattr(self.Estimator, "RNG", None)
+		State["Info_Network"] = self.Info_Network
+		State["Additional_InfoVar"] = self.Additional_InfoVar
+		State["Resampling"] = (getattr(self, "Bootstrap", None), getattr(self, "Surrogate", None))
+		State["Worker_Entropy"] = self.Worker_Entropy
+		State["Sources"] = None
+		if Member > 0:
+			State["Sources"] = [self.Estimator.Source, getattr(self.Additional_InfoVar, "Shared", None)]
+		State["Result_Files"] = Checkpoint.Read_Files(self.Result_Files())
+		State["Ensemble_Files"] = Checkpoint.File_Sizes(self.Ensemble_Files())
+		Checkpoint.Save(self.Checkpoint_File(self.Checkpoint_Stage), State)
+		self.Next_Checkpoint = time.perf_counter() + self.Checkpoint_Interval
+		
+	def Load_Checkpoint(self, Stage):
+		State = Checkpoint.Load(self.Checkpoint_File(Stage))
+		Checkpoint.Write_Files(State["Result_Files"])
+		Checkpoint.Truncate_Files(State["Ensemble_Files"])
+		random.setstate(State["Random_State"])
+		numpy.random.set_state(State["Numpy_State"])
+		if State["Estimator_RNG"] is not None:
+			self.Estimator.RNG = State["Estimator_RNG"]
+		self.Info_Network = State["Info_Network"]
+		self.Additional_InfoVar = State["Additional_InfoVar"]
+		self.Bootstrap, self.Surrogate = State["Resampling"]
+		self.Worker_Entropy = State.get("Worker_Entropy", None)
+		
+		self.Resume_Unit = State["Unit"]
+		if State["Done"]:
+			self.Resume_Unit = float("inf")
+		self.Resume_Member = State["Member"]
+		self.Resumed_Sources = State["Sources"]
+		if State["Done"]:
+			print("\tResume %s from the checkpoint : already completed"%Stage)
+		else:
+			print("\tResume %s from the checkpoint : %d units and %d members completed"%(Stage, State["Unit"], State["Member"]))
+		
+	# Members already simulated when the checkpoint being resumed was saved inside this ensemble.
+	def Restore_Partial_Ensemble(self):
+		if self.Resume_Member == 0 or self.Checkpoint_Unit != self.Resume_Unit:
+			return 0
+		self.Estimator.Source = self.Resumed_Sources[0]
+		if self.Additional_InfoVar:
+			self.Additional_InfoVar.Shared = self.Resumed_Sources[1]
+		First_Member = self.Resume_Member
+		self.Resume_Member = 0
+		self.Resumed_Sources = None
+		return First_Member
+		
+	def Result_Files(self):
+		Names = ["Node_%s.txt"%ind_node for ind_node in self.Info_Network.Nodes]
+		for ind_link in self.Info_Network.Links:
+			Names += ["Link_%s_%s.txt"%ind_link, "Link_%s_%s_Bootstrap.txt"%ind_link, "Link_%s_%s_Significance.txt"%ind_link, "Link_%s_%s_Bias.txt"%ind_link]
+		Names += [add_var.Name+".txt" for add_var in self.Additional_InfoVar if add_var.Name != ""]
+		return [self.Save_Directory+Name for Name in Names if os.path.exists(self.Save_Directory+Name)]
+		
+	def Ensemble_Files(self):
+		if self.Checkpoint_Stage != "Generate_Data" or self.Estimator.Source.Analysis != "Post_Analysis":
+			return []
+		Names = [Name for Name in os.listdir(self.Ensemble_Directory or ".") if re.match(r"at_time\d+\.txt$", Name)]
+		return [self.Ensemble_Directory+Name for Name in Names]
+		
+	def Load_Snapshot(self, Estimator, Snapshot):
+		Estimator.Source.Init_Source_Post_Analysis(self.Info_Network.Nodes, self.Source_Data_for_(Estimator.Source, Snapshot))
+		
+	# Reads a snapshot into Source, a copy of the estimator's source, so that it can run beside the estimation.
+	def Read_Snapshot(self, Source, Snapshot):
+		Source.Init_Source_Post_Analysis(self.Info_Network.Nodes, self.Source_Data_for_(Source, Snapshot))
+		return Source
+		
+	# The snapshots whose (link, snapshot) rows were all completed before the checkpoint being resumed.
+	def Completed_Snapshots(self, Snapshots):
+		First = 0
+		while First < Snapshots and (First+1)*len(self.Selected_Links) <= self.Resume_Unit:
+			for ind_tuple in self.Selected_Links:
+				self.Is_Completed_Unit(1)
+			First += 1
+		return First
+		
+	# Snapshot-major : each snapshot is read once (it holds every node) and all selected links are
+	# estimated on it, so the rows are counted snapshot by snapshot, link by link. The links share the
+	# columns the estimator prepared for the snapshot, so checkpoints are saved only between snapshots.
+	def Post_Analysis_by_Snapshot(self):
+		Snapshots = int(self.Simulation_Time_Limit/self.Save_Interval)-1
+		First = self.Completed_Snapshots(Snapshots)
+		Reader = None
+		if self.Post_Analysis_Prefetch and First < Snapshots:
+			Reader = ThreadPoolExecutor(max_workers = 1)
+			Next = Reader.submit(self.Read_Snapshot, copy.copy(self.Estimator.Source), First)
+		try:
+			for t in range(First, Snapshots):
+				if Reader is None:
+					self.Load_Snapshot(self.Estimator, t)
+				else:
+					self.Estimator.Source = Next.result()
+					if t+1 < Snapshots:
+						Next = Reader.submit(self.Read_Snapshot, copy.copy(self.Estimator.Source), t+1)
+				for link_order, ind_tuple in enumerate(self.Selected_Links):
+					if self.Is_Completed_Unit(1):
+						continue
+					self.Simulation_Nodes = ind_tuple
+					self.Calculate_Info_Vars()
+					self.Save_Info_Vars(t+1)
+					if self.Reports_Bias():
+						self.Save_Bias(t+1, Information_Network.A_Link(ind_tuple).Evaluate(self.Estimator.Bias_Report()))
+					self.Reporter.Advance(Work = 1, Estimations = 1)
+					self.Complete_Unit(Checkpoint_Allowed = link_order == len(self.Selected_Links)-1)
+		finally:
+			if Reader is not None:
+				Reader.shutdown(cancel_futures = True)
+				
+	# Every snapshot is read and estimated for all links by its own clone of the estimator on a thread pool.
+	# The values are then appended and saved in the same order as the sequential Post_Analysis.
+	def Post_Analysis_in_Parallel(self):
+		Workers = self.Post_Analysis_Workers
+		if Workers < 1:
+			Workers = os.cpu_count()
+		Snapshots = int(self.Simulation_Time_Limit/self.Save_Interval)-1
+		First = self.Completed_Snapshots(Snapshots)
+		
+		with ThreadPoolExecutor(max_workers = Workers) as Pool:
+			Futures = {}
+			for t in range(First, Snapshots):
+				Futures[t] = Pool.submit(self._Estimate_Snapshot, t, t)
+				
+			for t in range(First, Snapshots):
+				Values = Futures.pop(t).result()
+				for link_order, ind_tuple in enumerate(self.Selected_Links):
+					if self.Is_Completed_Unit(1):
+						continue
+					self.Simulation_Nodes = ind_tuple
+					self.Info_Network.Links[ind_tuple].Append_Values(Values[link_order][0])
+					self.Save_Info_Vars(t+1)
+					if self.Reports_Bias():
+						self.Save_Bias(t+1, Values[link_order][1])
+					self.Reporter.Advance(Work = 1, Estimations = 1)
+					self.Complete_Unit()
+					
+	def _Estimate_Snapshot(self, Snapshot, Seed):
+		Estimator = self.Estimator.Clone(Seed)
+		Estimator.Workers = 1
+		self.Load_Snapshot(Estimator, Snapshot)
+		Values = []
+		for Link_Index in self.Selected_Links:
+			Bias = None
+			if self.Reports_Bias():
+				Bias = Information_Network.A_Link(Link_Index).Evaluate(Estimator.Bias_Report())
+			Values.append((Information_Network.A_Link(Link_Index).Evaluate(Estimator), Bias))
+		return Values
+
+	# Linear-Gaussian values of the links (all selected links by default) over every saved snapshot, from
+	# one covariance matrix per snapshot : {link : {variable : array over the snapshots}}. Nothing is saved;
+	# it is meant to pick the links worth a KSG Post_Analysis.
+	def Gaussian_Screening(self, Links = None):
+		if Links is None:
+			Links = self.Selected_Links
+		Snapshots = int(self.Simulation_Time_Limit/self.Save_Interval)-1
+		Estimator = Gaussian.Estimator(self.Size_of_Ensemble)
+		Estimator.Source.Init_Source_Snapshots(self.Info_Network.Nodes, [self.Ensemble_Data_for_(t) for t in range(Snapshots)])
+		return {Link_Index:Information_Network.A_Link(Link_Index).Evaluate(Estimator) for Link_Index in Links}
+
+	def Set_Topology(self):
+		raise NotImplementedError("Need to override this function")
+		
+	def Init_State_Space(self):
+		raise NotImplementedError("Need to override this function")
+				
+	def Set_Estimator(self):
+		raise NotImplementedError("Need to override this function")
+				
+	def Dynamics_of_States(self,t):
+		raise NotImplementedError("Need to override this function")
+		
+	# For Vectorized : the same, with one array of Size_of_Ensemble values per node.
+	def Init_State_Space_Vectorized(self):
+		raise NotImplementedError("Need to override this function for Vectorized")
+		
+	def Dynamics_of_States_Vectorized(self, t):
+		raise NotImplementedError("Need to override this function for Vectorized")
+		
+	# For Exact_Propagation : {node : [P(value = 0), ..., P(value = Q-1)]} of the initial states (drawn
+	# independently), and of the next values given State_Space at time t.
+	def Initial_Probabilities(self):
+		raise NotImplementedError("Need to override this function for Exact_Propagation")
+		
+	def Transition_Probabilities(self, t):
+		if not self.Deterministic_Dynamics:
+			raise NotImplementedError("Need to override this function for Exact_Propagation")
+		self.Dynamics_of_States(t)
+		return {k:numpy.eye(self.Q)[self.Update_Buffer[k]] for k in self.Info_Network.Nodes}
+		
+	# Times with the same epoch share their transition probabilities, which are then computed once.
+	def Transition_Epoch(self, t):
+		return t
+	
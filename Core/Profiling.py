@@ -0,0 +1,86 @@
+
+# Timers and counters for model runs, switched on by the `Profiling` flag of a model.
+# The phases of a model are timed by replacing its methods with timed wrappers on the
+# instance, so a model that is not profiled runs the original methods untouched.
+# Times are inclusive : a phase includes the phases called inside it.
+
+import json
+import os
+import threading
+import time
+
+class A_Profiler():
+	def __init__(self):
+		self.Timers = {} # name -> [calls, seconds]
+		self.Counters = {}
+		self.Lock = threading.Lock()
+		self.Start_Time = time.perf_counter()
+
+	def Timed(self, Name, Function):
+		Timer = self.Timers.setdefault(Name, [0, 0.0])
+		Lock = self.Lock
+		def Timed_Function(*args, **kwargs):
+			Start = time.perf_counter()
+			try:
+				return Function(*args, **kwargs)
+			finally:
+				Elapsed = time.perf_counter() - Start
+				with Lock:
+					Timer[0] += 1
+					Timer[1] += Elapsed
+		return Timed_Function
+
+	def Instrument(self, Object, Names, Prefix = ""):
+		for Name in Names:
+			setattr(Object, Name, self.Timed(Prefix+Name, getattr(Object, Name)))
+
+	def Count(self, Name, Amount = 1):
+		with self.Lock:
+			self.Counters[Name] = self.Counters.get(Name, 0) + Amount
+
+	def Summary(self):
+		Phases = {}
+		Estimator_Calls = {}
+		for Name in self.Timers:
+			Calls, Seconds = self.Timers[Name]
+			Entry = {"calls":Calls, "seconds":Seconds, "mean_us":(1e6*Seconds/Calls if Calls else 0.0)}
+			if Name.startswith("Estimator."):
+				Estimator_Calls[Name[len("Estimator."):]] = Entry
+			else:
+				Phases[Name] = Entry
+		return {"wall_seconds":time.perf_counter() - self.Start_Time, "phases":Phases, "estimator_calls":Estimator_Calls, "counters":dict(self.Counters)}
+
+	def Save(self, File_Name):
+		Temporary_Name = File_Name + ".tmp"
+		with open(Temporary_Name, 'w') as Save_File:
+			json.dump(self.Summary(), Save_File, indent = 2)
+		os.replace(Temporary_Name, File_Name)
+
+# Forwards everything to the wrapped estimator and times the quantities requested from it.
+# Calls made inside the estimator (e.g. Mutual_Information -> Conditional_Entropy) are not counted.
+class Counted_Estimator():
+	Quantities = ["Entropy", "Conditional_Entropy", "Mutual_Information", "Multiple_Mutual_Information"]
+
+	def __init__(self, Estimator, Profiler):
+		object.__setattr__(self, "Estimator", Estimator)
+		object.__setattr__(self, "Profiler", Profiler)
+		for Name in self.Quantities:
+			if hasattr(Estimator, Name):
+				object.__setattr__(self, Name, Profiler.Timed("Estimator."+Name, getattr(Estimator, Name)))
+
+	def __getattr__(self, Name):
+		return getattr(self.Estimator, Name)
+
+	def __setattr__(self, Name, Value):
+		setattr(self.Estimator, Name, Value)
+
+	def Clone(self, Seed = None):
+		return Counted_Estimator(self.Estimator.Clone(Seed), self.Profiler)
+
+def Directory_Bytes(Directory):
+	Total = 0
+	if Directory and os.path.isdir(Directory):
+		for Root, _, Files in os.walk(Directory):
+			for Name in Files:
+				Total += os.path.getsize(os.path.join(Root, Name))
+	return Total
@@ -0,0 +1,95 @@
+
+# Progress reports for long runs : completed work, ensemble members and estimations per second,
+# ETA and the memory high-water mark. Reports are printed on the terminal and, with a log file,
+# appended to it as one JSON object per line (e.g. for a batch scheduler).
+# Advance only adds the counts and reads the clock; a report is emitted at most every Interval
+# seconds (never with Interval <= 0, where Report is called explicitly, e.g. once per run of a sweep).
+
+import json
+import sys
+import time
+
+try:
+	import resource
+except ImportError: # not available on Windows
+	resource = None
+
+def Peak_Memory_MB():
+	if resource is None:
+		return None
+	Peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	if sys.platform == "darwin": # bytes on macOS, kilobytes elsewhere
+		return Peak/2**20
+	return Peak/2**10
+
+def Format_Seconds(Seconds):
+	if Seconds is None:
+		return "--:--:--"
+	Seconds = int(Seconds)
+	return "%02d:%02d:%02d"%(Seconds//3600, (Seconds//60)%60, Seconds%60)
+
+class A_Progress_Reporter():
+	def __init__(self, Label, Total_Work, Unit = "steps", Interval = 30.0, Log_File = "", Context = None, Stream = sys.stdout):
+		self.Label = Label
+		self.Total_Work = Total_Work
+		self.Unit = Unit
+		self.Interval = Interval
+		self.Log_File = Log_File
+		self.Context = Context if Context is not None else {}
+		self.Stream = Stream
+
+		self.Work = 0
+		self.Members = 0
+		self.Estimations = 0
+		self.Reports = 0
+
+		self.Start_Time = time.perf_counter()
+		self.Next_Report = self.Start_Time + Interval
+
+	def Advance(self, Work = 0, Members = 0, Estimations = 0):
+		self.Work += Work
+		self.Members += Members
+		self.Estimations += Estimations
+		if self.Interval > 0 and time.perf_counter() >= self.Next_Report:
+			self.Report()
+
+	def Status(self):
+		Elapsed = time.perf_counter() - self.Start_Time
+		Fraction = self.Work/self.Total_Work if self.Total_Work > 0 else 0.0
+		ETA = None
+		if 0 < self.Work < self.Total_Work:
+			ETA = Elapsed*(self.Total_Work - self.Work)/self.Work
+		elif self.Work >= self.Total_Work:
+			ETA = 0.0
+		Rate = lambda Count : Count/Elapsed if Elapsed > 0 else 0.0
+		return {"label":self.Label, "time":time.strftime("%Y-%m-%dT%H:%M:%S"), "elapsed_s":Elapsed,
+			"work":self.Work, "total_work":self.Total_Work, "unit":self.Unit, "fraction":Fraction,
+			"members":self.Members, "members_per_s":Rate(self.Members),
+			"estimations":self.Estimations, "estimations_per_s":Rate(self.Estimations),
+			"eta_s":ETA, "peak_memory_mb":Peak_Memory_MB()}
+
+	def Report(self, Final = False, Print = True):
+		Status = self.Status()
+		Status["final"] = Final
+		Status.update(self.Context)
+
+		if Print and self.Stream is not None:
+			Memory = Status["peak_memory_mb"]
+			self.Stream.write("\t[%s] %5.1f%% (%g/%g %s) | %.1f members/s | %.2f estimations/s | elapsed %s | ETA %s | peak memory %s\n"%(
+				self.Label, 100*Status["fraction"], self.Work, self.Total_Work, self.Unit,
+				Status["members_per_s"], Status["estimations_per_s"], Format_Seconds(Status["elapsed_s"]),
+				Format_Seconds(Status["eta_s"]), "%.1f MB"%Memory if Memory is not None else "n/a"))
+			self.Stream.flush()
+		if self.Log_File != "":
+			with open(self.Log_File, 'a') as Log:
+				Log.write(json.dumps(Status) + "\n")
+
+		self.Reports += 1
+		self.Next_Report = time.perf_counter() + self.Interval
+		return Status
+
+	# The final line is printed only for runs long enough to have shown a report; it is always logged.
+	def Finish(self):
+		if self.Reports == 0 and self.Log_File == "":
+			return self.Status()
+		return self.Report(Final = True, Print = self.Reports > 0)
@@ -0,0 +1,106 @@
+
+# Local store of finished runs, addressed by a hash of everything that determines their results
+# (see Model_Basic.Cache_Key) : a run whose key is already stored is served by copying its files
+# back instead of being recomputed. Each entry is a directory <store>/<key[:2]>/<key>/ holding the
+# result files, the pickled network values and Entry.json; the modification time of Entry.json is the
+# last use, and the least recently used entries are evicted when the store exceeds Max_Bytes.
+
+import glob
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import time
+
+Entry_File = "Entry.json"
+Network_File = "Network.pkl"
+
+_Source_Hashes = {}
+
+def Hash_Files(File_Names):
+	Hash = hashlib.sha256()
+	for File_Name in File_Names:
+		Hash.update(os.path.basename(File_Name).encode())
+		with open(File_Name, 'rb') as Hashed_File:
+			for Block in iter(lambda : Hashed_File.read(1 << 20), b""):
+				Hash.update(Block)
+	return Hash.hexdigest()
+
+# Code version : the contents of the Python sources under the given directories (computed once per process).
+def Source_Hash(Directories):
+	Key = tuple(Directories)
+	if Key not in _Source_Hashes:
+		File_Names = []
+		for Directory in Directories:
+			File_Names += sorted(glob.glob(os.path.join(Directory, "**", "*.py"), recursive = True))
+		_Source_Hashes[Key] = Hash_Files(File_Names)
+	return _Source_Hashes[Key]
+
+def Hash_Description(Description):
+	return hashlib.sha256(json.dumps(Description, sort_keys = True, default = str).encode()).hexdigest()
+
+class A_Result_Cache():
+	def __init__(self, Directory, Max_Bytes = 2**30):
+		self.Directory = Directory
+		self.Max_Bytes = Max_Bytes
+
+	def Entry_Directory(self, Key):
+		return os.path.join(self.Directory, Key[:2], Key)
+
+	def Entries(self):
+		return glob.glob(os.path.join(self.Directory, "??", "*", Entry_File))
+
+	def Has(self, Key):
+		return os.path.exists(os.path.join(self.Entry_Directory(Key), Entry_File))
+
+	# Copies the stored files into Target_Directory and returns the network values, or None for a miss.
+	def Load(self, Key, Target_Directory):
+		Entry = self.Entry_Directory(Key)
+		if not self.Has(Key):
+			return None
+		with open(os.path.join(Entry, Entry_File), 'r') as Meta_File:
+			Meta = json.load(Meta_File)
+		for Name in Meta["files"]:
+			shutil.copyfile(os.path.join(Entry, Name), Target_Directory+Name)
+		with open(os.path.join(Entry, Network_File), 'rb') as Saved_Network:
+			Network = pickle.load(Saved_Network)
+		os.utime(os.path.join(Entry, Entry_File))
+		return Network
+
+	# The entry is assembled aside and renamed, so that readers never see a partial entry.
+	def Store(self, Key, File_Names, Network, Description):
+		Entry = self.Entry_Directory(Key)
+		if self.Has(Key):
+			return
+		os.makedirs(os.path.dirname(Entry), exist_ok = True)
+		Temporary = Entry + ".%d.tmp"%os.getpid()
+		os.makedirs(Temporary, exist_ok = True)
+		Names = []
+		for File_Name in File_Names:
+			Names.append(os.path.basename(File_Name))
+			shutil.copyfile(File_Name, os.path.join(Temporary, Names[-1]))
+		with open(os.path.join(Temporary, Network_File), 'wb') as Saved_Network:
+			pickle.dump(Network, Saved_Network, protocol = pickle.HIGHEST_PROTOCOL)
+		Size = sum(os.path.getsize(os.path.join(Temporary, Name)) for Name in os.listdir(Temporary))
+		with open(os.path.join(Temporary, Entry_File), 'w') as Meta_File:
+			json.dump({"key":Key, "files":Names, "bytes":Size, "created":time.strftime("%Y-%m-%dT%H:%M:%S"), "description":Description},
+				Meta_File, indent = 1, default = str)
+		try:
+			os.rename(Temporary, Entry)
+		except OSError: # stored meanwhile by another process
+			shutil.rmtree(Temporary, ignore_errors = True)
+		self.Evict()
+
+	def Evict(self):
+		Entries = []
+		for Meta_Name in self.Entries():
+			with open(Meta_Name, 'r') as Meta_File:
+				Entries.append((os.path.getmtime(Meta_Name), json.load(Meta_File)["bytes"], os.path.dirname(Meta_Name)))
+		Entries.sort()
+		Total = sum(Entry[1] for Entry in Entries)
+		for Last_Use, Size, Entry in Entries:
+			if Total <= self.Max_Bytes:
+				break
+			shutil.rmtree(Entry, ignore_errors = True)
+			Total -= Size
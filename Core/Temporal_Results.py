@@ -0,0 +1,81 @@
+
+# Reader for the pipe-delimited result files ("Link_X_Y.txt", "Node_X.txt", ...) :
+#	KEY1|KEY2|...|
+#	001:+0.123|-0.045|...|
+# The first read of a file converts it once into a binary table next to it ("<file>.npy",
+# one row per key with the times in row 0), which later reads memory-map, so that only
+# the requested keys and time range are touched. The table is rebuilt whenever the text
+# file is newer (e.g. appended by a running simulation).
+
+import os
+import re
+
+import numpy
+
+Cache_Suffix = ".npy"
+
+_Time_Line = re.compile(r"^\s*(\d+)\s*:(.*)$")
+
+def Read_Results(File_Name, Keys = None, Time_Range = None):
+	# Returns (Times, {key : values}) as numpy arrays; Time_Range = (start, stop) selects start <= t < stop.
+	Header, Table = Load_Table(File_Name)
+	Times = Table[0]
+	if Time_Range is None:
+		Selected = slice(None)
+	else:
+		Start, Stop = Time_Range
+		Mask = numpy.ones(len(Times), dtype = bool)
+		if Start is not None:
+			Mask &= Times >= Start
+		if Stop is not None:
+			Mask &= Times < Stop
+		Selected = numpy.flatnonzero(Mask)
+
+	if Keys is None:
+		Keys = Header
+	Values = {}
+	for k in Keys:
+		Values[k] = numpy.array(Table[Header.index(k)+1, Selected])
+	return numpy.array(Times[Selected]).astype(int), Values
+
+def Load_Table(File_Name):
+	Header = Read_Header(File_Name)
+	Cache_Name = File_Name + Cache_Suffix
+	if not Is_Cache_Valid(File_Name, Cache_Name):
+		Convert_Text_File(File_Name, Cache_Name)
+	return Header, numpy.load(Cache_Name, mmap_mode = 'r')
+
+def Read_Header(File_Name):
+	with open(File_Name, 'r') as Save_File:
+		Line = Save_File.readline()
+	if _Time_Line.match(Line):
+		return []
+	return Line.strip().split("|")[:-1]
+
+def Is_Cache_Valid(File_Name, Cache_Name):
+	if not os.path.exists(Cache_Name):
+		return False
+	return os.stat(Cache_Name).st_mtime_ns >= os.stat(File_Name).st_mtime_ns
+
+def Convert_Text_File(File_Name, Cache_Name):
+	Times = []
+	Rows = []
+	with open(File_Name, 'r') as Save_File:
+		for Line in Save_File:
+			Matched = _Time_Line.match(Line)
+			if not Matched:
+				continue
+			Times.append(float(Matched.group(1)))
+			Rows.append([float(v) for v in Matched.group(2).split("|") if v.strip() != ""])
+
+	Width = max([len(Read_Header(File_Name))] + [len(Row) for Row in Rows])
+	Table = numpy.full((Width+1, len(Rows)), numpy.nan)
+	Table[0] = Times
+	for i, Row in enumerate(Rows):
+		Table[1:len(Row)+1, i] = Row
+
+	# Written aside and renamed, so that a concurrent reader never maps a partial table.
+	Temporary_Name = Cache_Name + ".%d.tmp"%os.getpid()
+	with open(Temporary_Name, 'wb') as Cache_File:
+		numpy.save(Cache_File, Table)
+	os.replace(Temporary_Name, Cache_Name)
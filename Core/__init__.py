@@ -1,13 +1,13 @@
-"""
-Core module for Information_dynamics.
-
-This package contains the fundamental components of the framework:
-- Network definitions
-- Information dynamic equations
-- Estimators
-- Base model classes
-
-All high-level simulations in `on_Equations` and `on_Model`
-depend on this module.
-"""
-
+"""
+Core module for Information_dynamics.
+
+This package contains the fundamental components of the framework:
+- Network definitions
+- Information dynamic equations
+- Estimators
+- Base model classes
+
+All high-level simulations in `on_Equations` and `on_Model`
+depend on this module.
+"""
+
@@ -0,0 +1,247 @@
+
+# Single entry point running any model (Model_Basic or Information_Dynamics subclass) from a configuration file :
+#	python -m Core.run config.toml [--job N] [--set section.key=value ...] [--backend NAME] [--dry-run]
+# (--set is applied to every job, after the jobs are merged.)
+#
+#	[model]
+#	class = "on_Model.015_Boolean_Probability_Update.main:Boolean_Probability_Update"
+#	args = { n = 4, beta_Int = 1.3, beta_Ext = 10 }	# constructor arguments (a list for positional ones)
+#
+#	[overrides]			# model attributes set right before Initialize
+#	Simulation_Time_Limit = 30
+#	Size_of_Ensemble = 500
+#	Save_Directory = "./runs/015/"
+#
+#	[estimator]			# optional : replaces the model's estimator, other keys are set on it
+#	name = "KSG"
+#	k = 4
+#
+#	[run]
+#	backend = "scalar"		# "vectorized" : all members simulated at once (Model_Basic.Vectorized; the model defines
+#				# Init_State_Space_Vectorized and Dynamics_of_States_Vectorized, as 015 does)
+#				# "exact" : exact distributions instead of sampled members (Model_Basic.Exact_Propagation)
+#	stages = ["Generate_Data"]	# and/or "Post_Analysis"
+#	seed = 1			# seeds random and numpy.random after Initialize
+#	workers = 4			# Post_Analysis_Workers and Generate_Data_Workers
+#	output = "text"		# "npy" : binary tables next to the text files, "npz" : one Results.npz
+#
+#	[[jobs]]			# optional : each job is merged over the tables above and run in turn
+#	overrides = { Save_Directory = "./runs/015/Case000/" }
+#
+# Models that run from their constructor are built only : `Run = False` is passed when the constructor
+# takes it (other flags, e.g. New_Ensemble of 005, are given in args).
+
+import argparse
+import copy
+import importlib
+import inspect
+import json
+import os
+import random
+
+import numpy
+
+try:
+	import tomllib
+except ImportError: # Python < 3.11
+	try:
+		import tomli as tomllib
+	except ImportError:
+		tomllib = None
+
+from Core import Temporal_Results
+from Core.Estimators import Adaptive_Binning
+from Core.Estimators import Gaussian
+from Core.Estimators import KSG
+from Core.Estimators import Mixed_KSG
+from Core.Estimators import Ordinal
+from Core.Estimators import Simple_Binning
+
+Estimators = {
+	"Simple_Binning" : lambda Model, Spec : Simple_Binning.Estimator(Spec.pop("Q", Model.Q), Spec.pop("Dimension", 4)),
+	"KSG" : lambda Model, Spec : KSG.Estimator(Model.Size_of_Ensemble),
+	"Mixed_KSG" : lambda Model, Spec : Mixed_KSG.Estimator(Model.Size_of_Ensemble),
+	"Gaussian" : lambda Model, Spec : Gaussian.Estimator(Model.Size_of_Ensemble),
+	"Adaptive_Binning" : lambda Model, Spec : Adaptive_Binning.Estimator(Model.Size_of_Ensemble, Spec.pop("Method", "Quantile"), Spec.pop("Bins", 4)),
+	"Ordinal" : lambda Model, Spec : Ordinal.Estimator(Model.Size_of_Ensemble, Spec.pop("Order", 3), Spec.pop("Delay", 1)),
+}
+
+def Run_Stages(Model, Run):
+	for Stage in Run.get("stages", ["Generate_Data"]):
+		getattr(Model, Stage)()
+
+def Run_Vectorized(Model, Run):
+	Model.Vectorized = True
+	Run_Stages(Model, Run)
+
+def Run_Exact(Model, Run):
+	Model.Exact_Propagation = True
+	Run_Stages(Model, Run)
+
+# Engines computing the stages of a configured model (selected by run.backend).
+Backends = {
+	"scalar" : Run_Stages,
+	"vectorized" : Run_Vectorized,
+	"exact" : Run_Exact,
+}
+
+def Load_Config(File_Name):
+	if File_Name.endswith(".json"):
+		with open(File_Name, 'r') as Config_File:
+			return json.load(Config_File)
+	if tomllib is None:
+		raise ImportError("Reading TOML needs Python >= 3.11 or the tomli package (or use a .json configuration)")
+	with open(File_Name, 'rb') as Config_File:
+		return tomllib.load(Config_File)
+
+def Parse_Value(Text):
+	try:
+		if tomllib is not None:
+			return tomllib.loads("Value = "+Text)["Value"]
+		return json.loads(Text)
+	except ValueError:
+		return Text
+
+def Set_Value(Config, Path, Value):
+	Keys = Path.split(".")
+	for Key in Keys[:-1]:
+		Config = Config.setdefault(Key, {})
+	Config[Keys[-1]] = Value
+
+def Merge(Base, Update):
+	Merged = copy.deepcopy(Base)
+	for Key in Update:
+		if isinstance(Update[Key], dict) and isinstance(Merged.get(Key), dict):
+			Merged[Key] = Merge(Merged[Key], Update[Key])
+		else:
+			Merged[Key] = copy.deepcopy(Update[Key])
+	return Merged
+
+def Jobs(Config):
+	Base = {Key:Config[Key] for Key in Config if Key != "jobs"}
+	if "jobs" not in Config:
+		return [Base]
+	return [Merge(Base, Job) for Job in Config["jobs"]]
+
+def Model_Class(Name):
+	Module_Name, _, Class_Name = Name.partition(":")
+	return getattr(importlib.import_module(Module_Name), Class_Name)
+
+# Subclass applying the configuration inside Initialize, so that it also holds for models initialized by their constructor.
+def Configured_Class(Base, Config):
+	Overrides = Config.get("overrides", {})
+	Estimator_Spec = Config.get("estimator", None)
+	Workers = Config.get("run", {}).get("workers", None)
+
+	class Configured_Model(Base):
+		def Initialize(self):
+			for Name in Overrides:
+				if not hasattr(self, Name):
+					raise AttributeError("%s has no attribute %s to override"%(Base.__name__, Name))
+				setattr(self, Name, Overrides[Name])
+			if Workers is not None:
+				self.Post_Analysis_Workers = Workers
+				self.Generate_Data_Workers = Workers
+			if self.Save_Directory != "":
+				os.makedirs(self.Save_Directory, exist_ok = True)
+			super().Initialize()
+			self.Is_Initialized = True
+
+		def Set_Estimator(self):
+			super().Set_Estimator()
+			if Estimator_Spec is not None:
+				self.Estimator = Build_Estimator(self, Estimator_Spec, self.Estimator.Source.Analysis)
+
+	Configured_Model.__name__ = Base.__name__
+	Configured_Model.__qualname__ = Base.__qualname__
+	Configured_Model.__module__ = Base.__module__
+	return Configured_Model
+
+def Build_Estimator(Model, Spec, Analysis):
+	Spec = dict(Spec)
+	Name = Spec.pop("name")
+	if Name not in Estimators:
+		raise ValueError("Unknown estimator %s (available : %s)"%(Name, ", ".join(Estimators)))
+	Estimator = Estimators[Name](Model, Spec)
+	Estimator.Source.Analysis = Analysis
+	for Key in Spec:
+		setattr(Estimator, Key, Spec[Key])
+	return Estimator
+
+def Build_Model(Config):
+	Base = Model_Class(Config["model"]["class"])
+	Arguments = Config["model"].get("args", {})
+	Positional = list(Arguments) if isinstance(Arguments, list) else []
+	Keywords = dict(Arguments) if isinstance(Arguments, dict) else {}
+	if "Run" in inspect.signature(Base.__init__).parameters:
+		Keywords.setdefault("Run", False)
+	Model = Configured_Class(Base, Config)(*Positional, **Keywords)
+	if not getattr(Model, "Is_Initialized", False):
+		Model.Initialize()
+	Seed = Config.get("run", {}).get("seed", None)
+	if Seed is not None:
+		random.seed(Seed)
+		numpy.random.seed(Seed)
+	return Model
+
+def Run_Job(Config):
+	Run = Config.get("run", {})
+	Backend = Run.get("backend", "scalar")
+	if Backend not in Backends:
+		raise ValueError("Unknown backend %s (available : %s)"%(Backend, ", ".join(Backends)))
+	Model = Build_Model(Config)
+	Backends[Backend](Model, Run)
+	Export_Results(Model.Save_Directory, Run.get("output", "text"))
+	return Model
+
+def Result_Files(Directory):
+	Names = sorted(os.listdir(Directory or "."))
+	return [Directory+Name for Name in Names if Name.endswith(".txt") and Name != "Simulation_Properties.txt"]
+
+def Export_Results(Directory, Format):
+	if Format == "text":
+		return
+	if Format == "npy":
+		for File_Name in Result_Files(Directory):
+			Temporal_Results.Load_Table(File_Name)
+	elif Format == "npz":
+		Arrays = {}
+		for File_Name in Result_Files(Directory):
+			Times, Values = Temporal_Results.Read_Results(File_Name)
+			Name = os.path.basename(File_Name)[:-len(".txt")]
+			Arrays[Name+"/time"] = Times
+			for Key in Values:
+				Arrays[Name+"/"+Key] = Values[Key]
+		numpy.savez(Directory+"Results.npz", **Arrays)
+	else:
+		raise ValueError("Unknown output format %s (text, npy or npz)"%Format)
+
+def main(Arguments = None):
+	Parser = argparse.ArgumentParser(prog = "python -m Core.run", description = "Run a model from a TOML (or JSON) configuration.")
+	Parser.add_argument("config")
+	Parser.add_argument("--job", type = int, action = "append", help = "run only this job index (repeatable; e.g. from a scheduler array)")
+	Parser.add_argument("--set", action = "append", default = [], metavar = "KEY=VALUE", help = "override a configuration entry, e.g. overrides.Size_of_Ensemble=100")
+	Parser.add_argument("--backend", choices = list(Backends), help = "override run.backend for every job (%s)"%", ".join(Backends))
+	Parser.add_argument("--dry-run", action = "store_true", help = "print the resolved jobs without running them")
+	Options = Parser.parse_args(Arguments)
+
+	All_Jobs = Jobs(Load_Config(Options.config))
+	for Entry in Options.set:
+		Path, _, Text = Entry.partition("=")
+		for Job in All_Jobs:
+			Set_Value(Job, Path.strip(), Parse_Value(Text.strip()))
+	if Options.backend is not None:
+		for Job in All_Jobs:
+			Set_Value(Job, "run.backend", Options.backend)
+	Selected = Options.job if Options.job else range(len(All_Jobs))
+
+	for Index in Selected:
+		Job = All_Jobs[Index]
+		if Options.dry_run:
+			print(json.dumps({"job":Index, "config":Job}, indent = 2))
+			continue
+		print("Job %d/%d : %s"%(Index+1, len(All_Jobs), Job["model"]["class"]))
+		Run_Job(Job)
+
+if __name__ == "__main__":
+	main()
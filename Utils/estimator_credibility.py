@@ -19,10 +19,15 @@ python -m Utils.estimator_credibility --synthetic gaussian_mi --rho 0.6 --N 5000
 # Example 2: run on saved ensemble file (CSV-like / txt) with named columns
 python -m Utils.estimator_credibility --data path/to/ensemble.npy --vars X Y --estimator ksg --k 10
 
+# Example 3: limit the replicate pool to 4 threads (default: all cores)
+python -m Utils.estimator_credibility --synthetic gaussian_mi --N 20000 --workers 4
+
 Design notes
 ------------
 - "Credibility" here means numerical stability + uncertainty, not philosophical truth.
 - High-dimensional conditioning can have huge variance; the script reveals that via instability.
+- Replicates (bootstrap, permutation, stability) run on a thread pool. Each replicate draws
+  from its own seed spawned from --seed, so results do not depend on the number of workers.
 """
 
 from __future__ import annotations
@@ -30,6 +35,8 @@ import argparse
 import math
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
@@ -135,17 +142,42 @@ class DiagnosticResult:
     sensitivity: Optional[List[Tuple[str, float]]]
 
 
+def _replicate_rngs(seed: int, n: int) -> List[np.random.Generator]:
+    """Independent, reproducible generators for n replicates."""
+    return [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(n)]
+
+
+def _evaluate(estimator_fn: Callable[..., float], arr: np.ndarray, rng: np.random.Generator) -> float:
+    """Calls estimator_fn(arr), passing a replicate seed if it accepts one (e.g. KSG jitter)."""
+    if getattr(estimator_fn, "takes_seed", False):
+        return estimator_fn(arr, seed=int(rng.integers(2**32)))
+    return estimator_fn(arr)
+
+
+def _run_replicates(task: Callable[[np.random.Generator], float],
+                    rngs: Sequence[np.random.Generator],
+                    workers: int = 1) -> np.ndarray:
+    """Runs task(rng) for each replicate, on a thread pool when workers != 1 (-1: all cores)."""
+    if workers == 1:
+        return np.array([task(rng) for rng in rngs], dtype=float)
+    max_workers = os.cpu_count() if workers == -1 else workers
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return np.fromiter(pool.map(task, rngs), dtype=float, count=len(rngs))
+
+
 def bootstrap_ci(estimator_fn: Callable[[np.ndarray], float],
                  data: np.ndarray,
                  B: int = 200,
                  seed: int = 0,
-                 alpha: float = 0.05) -> Tuple[float, float]:
-    rng = np.random.default_rng(seed)
+                 alpha: float = 0.05,
+                 workers: int = 1) -> Tuple[float, float]:
     N = data.shape[0]
-    vals = np.empty(B, dtype=float)
-    for b in range(B):
+
+    def replicate(rng: np.random.Generator) -> float:
         idx = rng.integers(0, N, size=N)
-        vals[b] = estimator_fn(data[idx])
+        return _evaluate(estimator_fn, data[idx], rng)
+
+    vals = _run_replicates(replicate, _replicate_rngs(seed, B), workers)
     lo = np.quantile(vals, alpha / 2)
     hi = np.quantile(vals, 1 - alpha / 2)
     return float(lo), float(hi)
@@ -155,20 +187,24 @@ def permutation_test(estimator_fn: Callable[[np.ndarray], float],
                      data: np.ndarray,
                      y_col: int,
                      P: int = 200,
-                     seed: int = 0) -> Tuple[float, float]:
+                     seed: int = 0,
+                     workers: int = 1) -> Tuple[float, float]:
     """
     Permute one column (usually Y) to destroy dependence.
+    Each worker thread keeps one copy of the data and rewrites only column y_col per replicate.
     Returns (p_value, null_mean).
     """
-    rng = np.random.default_rng(seed)
-    obs = estimator_fn(data)
+    obs = _evaluate(estimator_fn, data, np.random.default_rng(seed))
     N = data.shape[0]
-    null = np.empty(P, dtype=float)
-    for p in range(P):
-        perm = rng.permutation(N)
-        d = data.copy()
-        d[:, y_col] = d[perm, y_col]
-        null[p] = estimator_fn(d)
+    local = threading.local()
+
+    def replicate(rng: np.random.Generator) -> float:
+        if not hasattr(local, "buffer"):
+            local.buffer = data.copy()
+        local.buffer[:, y_col] = data[rng.permutation(N), y_col]
+        return _evaluate(estimator_fn, local.buffer, rng)
+
+    null = _run_replicates(replicate, _replicate_rngs(seed, P), workers)
     # two-sided p-value
     pval = (np.sum(np.abs(null) >= abs(obs)) + 1) / (P + 1)
     return float(pval), float(null.mean())
@@ -178,22 +214,25 @@ def stability_curve(estimator_fn: Callable[[np.ndarray], float],
                     data: np.ndarray,
                     sizes: Sequence[int],
                     R: int = 30,
-                    seed: int = 0) -> List[Tuple[int, float, float]]:
+                    seed: int = 0,
+                    workers: int = 1) -> List[Tuple[int, float, float]]:
     """
     For each subsample size n, compute R estimates and report mean/std.
     """
-    rng = np.random.default_rng(seed)
     N = data.shape[0]
+    sizes = [min(int(n), N) for n in sizes]
+    rngs = _replicate_rngs(seed, len(sizes) * R)
+    tasks = list(zip(np.repeat(sizes, R), rngs))
+
+    def replicate(task: Tuple[int, np.random.Generator]) -> float:
+        n, rng = task
+        idx = rng.choice(N, size=int(n), replace=False)
+        return _evaluate(estimator_fn, data[idx], rng)
+
+    vals = _run_replicates(replicate, tasks, workers).reshape(len(sizes), R)
     out: List[Tuple[int, float, float]] = []
-    for n in sizes:
-        n = int(n)
-        if n >= N:
-            n = N
-        vals = np.empty(R, dtype=float)
-        for r in range(R):
-            idx = rng.choice(N, size=n, replace=False)
-            vals[r] = estimator_fn(data[idx])
-        out.append((n, float(vals.mean()), float(vals.std(ddof=1))))
+    for n, v in zip(sizes, vals):
+        out.append((n, float(v.mean()), float(v.std(ddof=1))))
     return out
 
 
@@ -202,11 +241,12 @@ def stability_curve(estimator_fn: Callable[[np.ndarray], float],
 # ----------------------------
 def make_ksg_estimator(k: int):
     """
-    Minimal wrapper: expects your Core.Estimators.KSG.Estimator
-    to accept parameter k (adjust if your signature differs).
+    Minimal wrapper around Core.Estimators.KSG.Estimator; k is an attribute
+    (the constructor argument is the ensemble size).
     """
     from Core.Estimators import KSG
-    est = KSG.Estimator(k=k) if "k" in KSG.Estimator.__init__.__code__.co_varnames else KSG.Estimator(k)
+    est = KSG.Estimator(0)
+    est.k = k
     return est
 
 
@@ -215,6 +255,57 @@ def make_binning_estimator(Q: int, dimension: int):
     return Simple_Binning.Estimator(Q, dimension)
 
 
+def joint_statistics(arr: np.ndarray) -> Dict[Tuple[int, ...], int]:
+    """Joint histogram {state tuple: count} of integer-valued samples, as in Simple_Binning.Source.Statistics."""
+    states, counts = np.unique(arr.astype(int), axis=0, return_counts=True)
+    return {tuple(int(v) for v in state): int(c) for state, c in zip(states, counts)}
+
+
+def binning_measure(est, measure: str, var_names: List[str], known_names: List[str]):
+    """
+    Evaluates the measure on a Simple_Binning estimator; with the Bootstrap_Estimator
+    the result is an array with one value per replicate.
+    """
+    measure = measure.lower()
+    if measure == "h":
+        return est.Entropy(For=[var_names[0]])
+    if measure == "mi":
+        return est.Mutual_Information(For=[var_names[0], var_names[1]])
+    if measure == "cmi":
+        # I(X;Y|Z) = H(X,Z)+H(Y,Z)-H(Z)-H(X,Y,Z)
+        X, Y = var_names[0], var_names[1]
+        Z = known_names
+        Hxz = est.Entropy(For=[X] + Z)
+        Hyz = est.Entropy(For=[Y] + Z)
+        Hz  = est.Entropy(For=Z)
+        Hxyz = est.Entropy(For=[X, Y] + Z)
+        return Hxz + Hyz - Hz - Hxyz
+    raise ValueError(f"Unknown measure: {measure}")
+
+
+def binning_bootstrap_ci(data: np.ndarray,
+                         measure: str,
+                         var_names: List[str],
+                         known_names: List[str],
+                         Q: int,
+                         B: int = 200,
+                         seed: int = 0,
+                         alpha: float = 0.05) -> Tuple[float, float]:
+    """
+    Bootstrap CI for discrete data: the B replicates are multinomial resamples of the
+    joint count table, drawn and evaluated at once (Simple_Binning.Bootstrap_Estimator).
+    """
+    from Core.Estimators import Simple_Binning
+    est = Simple_Binning.Bootstrap_Estimator(Q, len(var_names), Replicates=B, Seed=seed)
+    est.Source.Statistics = joint_statistics(data)
+    est.Source.Variable_Names = var_names
+    est.Resample()
+    vals = binning_measure(est, measure, var_names, known_names)
+    lo = np.quantile(vals, alpha / 2)
+    hi = np.quantile(vals, 1 - alpha / 2)
+    return float(lo), float(hi)
+
+
 def estimator_fn_from_spec(spec: str,
                            measure: str,
                            var_names: List[str],
@@ -225,14 +316,18 @@ def estimator_fn_from_spec(spec: str,
     Returns a function f(data_array)-> estimate (float).
 
     Assumes `data_array` columns correspond to var_names in the same order.
+    The function is thread-safe: each calling thread gets its own estimator.
     """
     measure = measure.lower()
+    local = threading.local()
 
     if spec == "ksg":
-        est = make_ksg_estimator(k)
-
-        def f(arr: np.ndarray) -> float:
-            # Build a temporary Source-like structure expected by your KSG estimator
+        def f(arr: np.ndarray, seed: Optional[int] = None) -> float:
+            if not hasattr(local, "est"):
+                local.est = make_ksg_estimator(k)
+            est = local.est
+            if seed is not None:
+                est.RNG = np.random.default_rng(seed)
             # Your KSG expects est.Source.Ensemble and est.Source.Variable_Names.
             est.Source.Ensemble = arr
             est.Source.Variable_Names = var_names
@@ -241,37 +336,25 @@ def estimator_fn_from_spec(spec: str,
             if measure == "mi":
                 return float(est.Mutual_Information(For=[var_names[0], var_names[1]]))
             if measure == "cmi":
-                return float(est.Conditional_Mutual_Information(For=[var_names[0], var_names[1]], Known=known_names))
+                # KSG.Mutual_Information with Known is the conditional (Frenzel-Pompe) estimate
+                return float(est.Mutual_Information(For=[var_names[0], var_names[1]], Known=known_names))
             raise ValueError(f"Unknown measure: {measure}")
+        f.takes_seed = True
         return f
 
     if spec == "binning":
         # For binning, Q and dimension must match the joint dimension you will feed.
         # Here we assume all variables are discrete scalars and dimension = number of columns in arr.
         dim = len(var_names)
-        est = make_binning_estimator(Q=Q, dimension=dim)
 
         def f(arr: np.ndarray) -> float:
-            est.Source.Ensemble = arr.astype(int)
+            if not hasattr(local, "est"):
+                local.est = make_binning_estimator(Q=Q, dimension=dim)
+            est = local.est
+            # Simple_Binning works from the joint histogram, not from the samples.
+            est.Source.Statistics = joint_statistics(arr)
             est.Source.Variable_Names = var_names
-            if measure == "h":
-                return float(est.Entropy(For=[var_names[0]]))
-            if measure == "mi":
-                return float(est.Mutual_Information(For=[var_names[0], var_names[1]]))
-            if measure == "cmi":
-                # if your binning estimator supports CMI; otherwise compute from entropies:
-                # I(X;Y|Z) = H(X,Z)+H(Y,Z)-H(Z)-H(X,Y,Z)
-                if hasattr(est, "Conditional_Mutual_Information"):
-                    return float(est.Conditional_Mutual_Information(For=[var_names[0], var_names[1]], Known=known_names))
-                # entropy-based fallback:
-                X, Y = var_names[0], var_names[1]
-                Z = known_names
-                Hxz = float(est.Entropy(For=[X] + Z))
-                Hyz = float(est.Entropy(For=[Y] + Z))
-                Hz  = float(est.Entropy(For=Z))
-                Hxyz = float(est.Entropy(For=[X, Y] + Z))
-                return Hxz + Hyz - Hz - Hxyz
-            raise ValueError(f"Unknown measure: {measure}")
+            return float(binning_measure(est, measure, var_names, known_names))
         return f
 
     raise ValueError(f"Unknown estimator spec: {spec}")
@@ -299,6 +382,7 @@ def main():
     ap.add_argument("--perm", type=int, default=200)
     ap.add_argument("--stability_R", type=int, default=30)
     ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--workers", type=int, default=-1, help="replicate threads (-1: all cores)")
 
     # Synthetic
     ap.add_argument("--synthetic", choices=["", "gaussian_mi", "gaussian_cmi", "binary_channel"], default="")
@@ -348,17 +432,21 @@ def main():
     f = estimator_fn_from_spec(args.estimator, args.measure, var_names, known_names, args.k, args.Q)
 
     # Point estimate
-    point = f(data)
+    point = _evaluate(f, data, np.random.default_rng(args.seed))
 
     # Bootstrap CI
-    ci = bootstrap_ci(f, data, B=args.bootstrap, seed=args.seed) if args.bootstrap > 0 else None
+    ci = None
+    if args.bootstrap > 0 and args.estimator == "binning":
+        ci = binning_bootstrap_ci(data, args.measure, var_names, known_names, args.Q, B=args.bootstrap, seed=args.seed)
+    elif args.bootstrap > 0:
+        ci = bootstrap_ci(f, data, B=args.bootstrap, seed=args.seed, workers=args.workers)
 
     # Permutation test (permute Y column for MI/CMI)
     pval = None
     null_mean = None
     if args.perm > 0 and args.measure in ("mi", "cmi"):
         y_col = 1  # assume second column corresponds to Y in vars
-        pval, null_mean = permutation_test(f, data, y_col=y_col, P=args.perm, seed=args.seed)
+        pval, null_mean = permutation_test(f, data, y_col=y_col, P=args.perm, seed=args.seed, workers=args.workers)
 
     # Stability curve
     sizes = []
@@ -367,7 +455,7 @@ def main():
         if n < N:
             sizes.append(n)
     sizes.append(N)
-    curve = stability_curve(f, data, sizes=sizes, R=args.stability_R, seed=args.seed) if args.stability_R > 0 else None
+    curve = stability_curve(f, data, sizes=sizes, R=args.stability_R, seed=args.seed, workers=args.workers) if args.stability_R > 0 else None
 
     # Sensitivity sweep (KSG only)
     sens = None
@@ -375,7 +463,7 @@ def main():
         sens = []
         for kk in args.k_sweep:
             ff = estimator_fn_from_spec("ksg", args.measure, var_names, known_names, kk, args.Q)
-            sens.append((f"k={kk}", float(ff(data))))
+            sens.append((f"k={kk}", _evaluate(ff, data, np.random.default_rng(args.seed))))
 
     # Print report
     print("\n=== Estimator Credibility Report ===")
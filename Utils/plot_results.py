@@ -18,54 +18,29 @@ Usage examples:
 
 import argparse
 import os
-import re
 
 import matplotlib.pyplot as plt
+import numpy as np
 
+from Core import Temporal_Results
 
-_TIME_RE = re.compile(r"^\s*(\d+)\s*:\s*(.*)\s*$")
 
-
-def _parse_pipe_values(payload):
-    """
-    Parse "v|v|v|" or "+v|-v|..." into floats.
-    Empty segments are ignored.
-    """
-    parts = [p.strip() for p in payload.split("|")]
-    vals = []
-    for p in parts:
-        if not p:
-            continue
-        vals.append(float(p))  # float() accepts leading '+'
-    return vals
-
-
-def read_timeseries_generic(path):
+def read_timeseries_generic(path, time_range=None):
     """
     Reads a file with lines like:
       "003: +0.123| -0.045| ..."
+    through the cached binary table of Core.Temporal_Results.
     Returns:
-      times: [3, ...]
-      rows:  [[0.123, -0.045, ...], ...]
+      times: array([3, ...])
+      rows:  2-D array, one row per time (NaN where a line is short)
     """
-    times = []
-    rows = []
-
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            m = _TIME_RE.match(line)
-            if not m:
-                continue
-            t = int(m.group(1))
-            payload = m.group(2)
-            vals = _parse_pipe_values(payload)
-            times.append(t)
-            rows.append(vals)
-
-    return times, rows
+    _, table = Temporal_Results.Load_Table(path)
+    times = table[0]
+    selected = slice(None)
+    if time_range is not None:
+        start, stop = time_range
+        selected = np.flatnonzero((times >= start) & (times < stop))
+    return np.array(times[selected]).astype(int), np.array(table[1:, selected]).T
 
 
 def read_properties(path):
@@ -103,6 +78,13 @@ def node_keys_for_paper(node):
     alpha_keys = [r'$\alpha_{1}^{'+node+'}$',"1_p1","1_p2","partial1"]
     return var_keys + alpha_keys
 
+def _columns_as_series(rows, keys):
+    series = {}
+    for i, k in enumerate(keys):
+        series[k] = rows[:, i] if i < rows.shape[1] else np.full(rows.shape[0], np.nan)
+    return series
+
+
 def load_link_series(directory, u, v, paper, keys=None):
     fname = f"Link_{u}_{v}.txt"
     path = os.path.join(directory, fname)
@@ -113,10 +95,7 @@ def load_link_series(directory, u, v, paper, keys=None):
     if paper:
         keys = link_keys_for_paper(u, v)
 
-    series = {k: [] for k in keys}
-    for vals in rows:
-        for i, k in enumerate(keys):
-            series[k].append(vals[i] if i < len(vals) else float("nan"))
+    series = _columns_as_series(rows, keys)
 
     return t, series
 
@@ -129,10 +108,7 @@ def load_node_series(directory, node, paper, keys=None):
         keys = default_node_keys()
     if paper:
         keys = node_keys_for_paper(node)    
-    series = {k: [] for k in keys}
-    for vals in rows:
-        for i, k in enumerate(keys):
-            series[k].append(vals[i] if i < len(vals) else float("nan"))
+    series = _columns_as_series(rows, keys)
 
     fname = f"Node_{node}_E_values.txt"
     
@@ -143,9 +119,7 @@ def load_node_series(directory, node, paper, keys=None):
     if E_key in keys:
         path = os.path.join(directory, fname)
         t, rows = read_timeseries_generic(path)
-        series[E_key] = []
-        for vals in rows:
-            series[E_key].append(vals[0])
+        series[E_key] = rows[:, 0]
     return t, series
 
 def plot_multi_series(t, ys, title, ylabel, save=None, show=False):
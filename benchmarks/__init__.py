@@ -0,0 +1,6 @@
+"""
+benchmarks
+
+Timing suite for the simulation, estimation, equation and I/O paths.
+Run from the repository root: python -m benchmarks.run
+"""
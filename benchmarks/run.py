@@ -0,0 +1,369 @@
+"""
+run.py
+------
+
+Performance baselines for the key paths of the framework.
+
+Cases (fixed seeds and sizes):
+  - construct_ensemble/<model>   Model_Basic.Construct_Ensemble over t = 1..T for one link
+                                 of the 015, 004 and 001 models
+  - simple_binning/<link|node>   A_Link / A_Node.Calculate on a filled Simple_Binning source
+  - ksg/<mi|cmi>/N=<N>           KSG MI and CMI on Gaussian data, N in {1k, 10k, 100k}
+  - equations/ring/N=<N>         Information_Dynamics.Generate_Data on rings of 8 ... 10^4 nodes
+  - io/<...>                     Save_Info_Vars and Read_for_ (first read and cached)
+  - import/<module>              start of a fresh interpreter importing the module (a short
+                                 sweep job); heavy dependencies must not be loaded by it
+
+Each case is timed `--repeat` times after its setup; the best time is reported.
+Results are written as JSON (default: benchmarks/latest.json) and compared with a
+stored baseline (default: benchmarks/baseline.json). A case is flagged as a
+regression when it is slower than the baseline by more than `--threshold`.
+
+Usage examples:
+  python -m benchmarks.run
+  python -m benchmarks.run --filter ksg --repeat 5
+  python -m benchmarks.run --check                 # exit code 1 on regressions
+  python -m benchmarks.run --update-baseline       # store this run as the baseline
+
+Timings depend on the machine; refresh the baseline when the hardware changes.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from Core import Information_Network
+from Core.Estimators import KSG
+from Core.Estimators import Simple_Binning
+
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+SEED = 12345
+
+KSG_SIZES = [1000, 10000, 100000]
+RING_SIZES = [8, 100, 1000, 10000]
+
+IMPORT_MODULES = [
+    "Core.Model_Basics",
+    "Core.Estimators.KSG",
+    "Core.run",
+    "on_Model.015_Boolean_Probability_Update.main",
+    "on_Model.005_Three_Nodes_GRN.main",
+]
+# Imported on first use only (Core/Lazy_Import.py).
+HEAVY_MODULES = ["scipy", "matplotlib", "sklearn"]
+
+
+def _seed_all(seed=SEED):
+    random.seed(seed)
+    np.random.seed(seed)
+
+
+def _model_class(module, name):
+    return getattr(importlib.import_module(module), name)
+
+
+# ----------------------------
+# Cases : setup(work_dir) -> (function to time, parameters)
+# ----------------------------
+def _construct_ensemble_case(build, link, ensemble, simulation_time):
+    def setup(work_dir):
+        model = build()
+        model.Save_Directory = work_dir + "/"
+        model.Size_of_Ensemble = ensemble
+        model.Initialize()
+        model.Simulation_Nodes = link
+        model.Estimator.Source.Type = "Pairwise"
+
+        # One link as in Generate_Data : ensembles for t = 1, ..., simulation_time.
+        def run():
+            _seed_all()
+            model.Info_Network.Links[link] = Information_Network.A_Link(link)
+            for t in range(simulation_time):
+                model.Construct_Ensemble(t + 1)
+        return run, {"ensemble": ensemble, "simulation_time": simulation_time, "link": "%s,%s" % link}
+    return setup
+
+
+def _build_015():
+    model = _model_class("on_Model.015_Boolean_Probability_Update.main", "Boolean_Probability_Update")(n=4, beta_Int=1.3, beta_Ext=10)
+    model.Simulation_Time_Limit = 30
+    return model
+
+
+def _build_004():
+    model = _model_class("on_Model.004_ABN_for_GRN.main", "ABN_Model")(8, 5, Run=False)
+    model.Simulation_Time_Limit = 30
+    return model
+
+
+def _build_001():
+    model = _model_class("on_Model.001_Toy_Model_A.main", "Toy_Model_A")(5, 0.7, 0.5, 0.4, Run=False)
+    model.Simulation_Time_Limit = 30
+    return model
+
+
+def _binning_source(names, samples=10000, Q=2):
+    rng = np.random.default_rng(SEED)
+    estimator = Simple_Binning.Estimator(Q, len(names))
+    estimator.Source.Variable_Names = names
+    states, counts = np.unique(rng.integers(0, Q, size=(samples, len(names))), axis=0, return_counts=True)
+    estimator.Source.Statistics = {tuple(int(v) for v in s): int(c) for s, c in zip(states, counts)}
+    return estimator
+
+
+def _binning_link_case(work_dir):
+    estimator = _binning_source(["X", "Y", "X'", "Y'"])
+    network = Information_Network.A_Network()
+    network.Set_Nodes(["X", "Y"])
+    network.Add_a_Link(("X", "Y"))
+
+    def run():
+        estimator.Source.Meshed_Cache = {}
+        network.Links[("X", "Y")].Calculate(estimator)
+    return run, {"Q": 2, "samples": 10000}
+
+
+def _binning_node_case(work_dir):
+    estimator = _binning_source(["X", "X'", "L", "L'", "R", "R'"])
+    network = Information_Network.A_Network()
+    network.Set_Nodes(["X", "L", "R"])
+    network.Add_a_Link(("L", "X"))
+    network.Add_a_Link(("X", "R"))
+
+    def run():
+        estimator.Source.Meshed_Cache = {}
+        network.Nodes["X"].Calculate(estimator)
+    return run, {"Q": 2, "samples": 10000, "neighbors": 2}
+
+
+def _ksg_case(measure, N):
+    def setup(work_dir):
+        rng = np.random.default_rng(SEED)
+        cov = np.array([[1.0, 0.5, 0.4], [0.5, 1.0, 0.3], [0.4, 0.3, 1.0]])
+        data = rng.multivariate_normal(np.zeros(3), cov, size=N)
+        estimator = KSG.Estimator(N)
+        estimator.Source.Ensemble = data
+        estimator.Source.Variable_Names = ["X", "Y", "Z"]
+        known = ["Z"] if measure == "cmi" else []
+
+        def run():
+            estimator.Source.Clear_Cache()
+            estimator.RNG = np.random.default_rng(SEED)
+            estimator.Mutual_Information(For=["X", "Y"], Known=known)
+        return run, {"N": N, "k": estimator.k}
+    return setup
+
+
+def _ring_case(N, simulation_time=10):
+    def setup(work_dir):
+        model = _model_class("on_Equations.001_A_Single_Cycle.main", "ID_of_Single_Ring")(N, Run=False)
+        model.Simulation_Time_Limit = simulation_time
+        model.Save_Directory = work_dir + "/"
+        model.Initialize()
+        return model.Generate_Data, {"nodes": N, "simulation_time": simulation_time}
+    return setup
+
+
+def _io_model(work_dir, rows):
+    model = _build_015()
+    model.Save_Directory = work_dir + "/"
+    model.Initialize()
+    model.Additional_InfoVar = []
+    model.Simulation_Nodes = ("A4", "p")
+    model.Estimator.Source.Type = "Pairwise"
+    rng = np.random.default_rng(SEED)
+    the_link = model.Info_Network.Links[model.Simulation_Nodes]
+    for key in the_link.Var_:
+        the_link.Var_[key] = list(rng.normal(size=rows))
+    for key in the_link.Alpha_:
+        the_link.Alpha_[key] = list(rng.normal(size=rows))
+    model.Simulation_Time_Limit = rows + 1
+    return model
+
+
+def _save_info_vars_case(work_dir, rows=2000):
+    model = _io_model(work_dir, rows)
+
+    def run():
+        model.Create_File_Header()
+        for t in range(rows):
+            model.Save_Info_Vars(t + 2)
+    return run, {"rows": rows}
+
+
+def _read_for_case(cached, rows=2000):
+    def setup(work_dir):
+        model = _io_model(work_dir, rows)
+        for t in range(rows):
+            model.Save_Info_Vars(t + 2)
+        file_name = work_dir + "/Link_A4_p.txt"
+
+        def run():
+            if not cached and os.path.exists(file_name + ".npy"):
+                os.remove(file_name + ".npy")
+            model.Read_for_(file_name, Keys=["TE2"])
+        if cached:
+            run()
+        return run, {"rows": rows, "cached": cached}
+    return setup
+
+
+def _import_case(module):
+    code = ("import importlib, sys; importlib.import_module(%r); "
+            "print(','.join(m for m in %r if m in sys.modules))" % (module, HEAVY_MODULES))
+    root = os.path.dirname(BENCHMARK_DIR)
+
+    def setup(work_dir):
+        def run():
+            out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=root, check=True)
+            heavy = out.stdout.strip()
+            if heavy:
+                raise RuntimeError("importing %s loads %s" % (module, heavy))
+        return run, {"module": module}
+    return setup
+
+
+def all_cases():
+    cases = [
+        ("construct_ensemble/015", _construct_ensemble_case(_build_015, ("A4", "p"), 500, 20)),
+        ("construct_ensemble/004", _construct_ensemble_case(_build_004, ("B1", "A"), 500, 20)),
+        ("construct_ensemble/001", _construct_ensemble_case(_build_001, ("A1", "A2"), 500, 20)),
+        ("simple_binning/link", _binning_link_case),
+        ("simple_binning/node", _binning_node_case),
+    ]
+    for N in KSG_SIZES:
+        cases.append(("ksg/mi/N=%d" % N, _ksg_case("mi", N)))
+        cases.append(("ksg/cmi/N=%d" % N, _ksg_case("cmi", N)))
+    for N in RING_SIZES:
+        cases.append(("equations/ring/N=%d" % N, _ring_case(N)))
+    cases.append(("io/save_info_vars", _save_info_vars_case))
+    cases.append(("io/read_for/first", _read_for_case(False)))
+    cases.append(("io/read_for/cached", _read_for_case(True)))
+    cases.append(("import/python", _import_case("os")))
+    for module in IMPORT_MODULES:
+        cases.append(("import/%s" % module, _import_case(module)))
+    return cases
+
+
+# The largest cases take seconds to minutes per call and are timed once.
+SINGLE_RUN_CASES = ["ksg/cmi/N=100000", "equations/ring/N=10000"]
+
+
+# ----------------------------
+# Running and comparing
+# ----------------------------
+def run_case(setup, repeat):
+    work_dir = tempfile.mkdtemp(prefix="bench_")
+    try:
+        _seed_all()
+        fn, params = setup(work_dir)
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return {"best_s": min(times), "median_s": float(np.median(times)), "repeat": repeat, "params": params}
+
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=BENCHMARK_DIR).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": SEED,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Returns [(name, best_s, baseline_s, ratio, status)]."""
+    rows = []
+    for name, result in results.items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            rows.append((name, result["best_s"], None, None, "new"))
+            continue
+        ratio = result["best_s"] / base["best_s"] if base["best_s"] > 0 else float("inf")
+        if ratio > threshold:
+            status = "REGRESSION"
+        elif ratio < 1.0 / threshold:
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append((name, result["best_s"], base["best_s"], ratio, status))
+    return rows
+
+
+def print_report(rows):
+    width = max([28] + [len(row[0]) for row in rows])
+    print("\n%-*s %12s %12s %8s  %s" % (width, "case", "best (s)", "baseline (s)", "ratio", "status"))
+    for name, best, base, ratio, status in rows:
+        base_txt = "%12.5f" % base if base is not None else "%12s" % "-"
+        ratio_txt = "%8.2f" % ratio if ratio is not None else "%8s" % "-"
+        print("%-*s %12.5f %s %s  %s" % (width, name, best, base_txt, ratio_txt, status))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--filter", default="", help="only run cases whose name contains this text")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--output", default=os.path.join(BENCHMARK_DIR, "latest.json"))
+    ap.add_argument("--baseline", default=os.path.join(BENCHMARK_DIR, "baseline.json"))
+    ap.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio reported as a regression")
+    ap.add_argument("--update-baseline", action="store_true", help="write this run to the baseline file")
+    ap.add_argument("--check", action="store_true", help="exit with status 1 if a regression is found")
+    args = ap.parse_args()
+
+    results = {}
+    for name, setup in all_cases():
+        if args.filter not in name:
+            continue
+        print("running %s ..." % name, flush=True)
+        results[name] = run_case(setup, 1 if name in SINGLE_RUN_CASES else args.repeat)
+
+    report = {"environment": environment(), "results": results}
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print("results written to %s" % args.output)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    rows = compare(results, baseline, args.threshold)
+    print_report(rows)
+
+    if args.update_baseline:
+        merged = baseline if baseline else {"results": {}}
+        merged["environment"] = report["environment"]
+        merged["results"].update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(merged, f, indent=2)
+        print("baseline updated: %s" % args.baseline)
+
+    if args.check and any(row[4] == "REGRESSION" for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 
-import matplotlib.pyplot as plt
-
 from Core import Information_Dynamic_Equation
+from Core import Lazy_Import
+
+plt = Lazy_Import.Lazy_Module("matplotlib.pyplot")
 
 
 class ID_of_Two_Cycles(Information_Dynamic_Equation.Information_Dynamics):
@@ -1,13 +1,13 @@
-"""
-on_Equations
-
-This package contains examples where information-theoretic variables
-(e.g., entropy, mutual information, transfer entropy) evolve directly
-according to dynamical equations.
-
-These modules are intended for:
-- studying intrinsic information dynamics
-- analyzing control parameters (alpha terms)
-- investigating stationary and constrained solutions
-"""
-
+"""
+on_Equations
+
+This package contains examples where information-theoretic variables
+(e.g., entropy, mutual information, transfer entropy) evolve directly
+according to dynamical equations.
+
+These modules are intended for:
+- studying intrinsic information dynamics
+- analyzing control parameters (alpha terms)
+- investigating stationary and constrained solutions
+"""
+
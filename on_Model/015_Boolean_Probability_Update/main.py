@@ -1,135 +1,176 @@
-
-import time
-import random
-import numpy
-
-import os
-import matplotlib.pyplot as plt
-
-from Core import Model_Basics
-from Core.Estimators import Simple_Binning
-
-class Boolean_Probability_Update(Model_Basics.Model_Basic):
-	def __init__(self, n=4, beta_Int = 1, beta_Ext = 1):
-		super().__init__()
-		
-		self.Q = 2
-		self.N = n
-		
-		self.beta_Int = beta_Int
-		self.beta_Ext = beta_Ext
-		numpy.random.seed(int(time.time()))
-		
-		self.Simulation_Time_Limit = 40
-		self.Start_of_Interaction = 25
-		self.Size_of_Ensemble = 10000
-		
-		
-		self.Save_Directory = "./on_Model/015_Boolean_Probability_Update/Temporal_Results/"
-		
-		self.Selected_Nodes = ["p"]
-		self.Selected_Links = [("A%d"%self.N,"p"), ("Ext","p"),("p","A1")]
-		
-		
-	def Register_Properties(self):
-		self.Properties["Model_Name"] = "Boolean_Probability_Update"
-		self.Properties["Estimator"] = "Simple Binning"
-		self.Properties["Q"] = str(self.Q)
-		self.Properties["N"] = str(self.N)
-		self.Properties["beta_Int"] = str(self.beta_Int)
-		self.Properties["beta_Ext"] = str(self.beta_Ext)
-		self.Properties["Simulation_Time_Limit"] = str(self.Simulation_Time_Limit)
-		self.Properties["Start_of_Interaction"] = str(self.Start_of_Interaction)
-		self.Properties["Size_of_Ensemble"] = str(self.Size_of_Ensemble)
-		
-		self.Register_Topology()
-			
-	def Set_Topology(self):
-		index_list = ["Ext","p"]
-		for i in range(self.N):
-			index_list.append("A%d"%(i+1))
-		self.Info_Network.Set_Nodes(index_list)
-		
-		for i in range(self.N-1):
-			self.Info_Network.Add_a_Link(("A%d"%(i+1),"A%d"%(i+2)))
-			
-		self.Info_Network.Add_a_Link(("A%d"%(self.N),"p"))
-		self.Info_Network.Add_a_Link(("p","A1"))	
-		self.Info_Network.Add_a_Link(("Ext","p"))
-		
-	def Init_State_Space(self):
-		for k in self.Info_Network.Nodes:
-			initial_value = numpy.random.binomial(1,0.5)
-			self.State_Space[k] = initial_value	
-			
-	def Set_Estimator(self):
-		self.Estimator = Simple_Binning.Estimator(self.Q, 4)
-		self.Estimator.Source.Analysis = "Realtime"
-		
-	def Dynamics_of_States(self, t):
-		for i in range(self.N-1):
-			self.Update_Buffer["A%d"%(i+2)] = self.State_Space["A%d"%(i+1)]
-			
-		self.Update_Buffer["A1"] = self.State_Space["p"]
-		self.Update_Buffer["Ext"] = numpy.random.binomial(1,0.5)
-				
-		if t < self.Start_of_Interaction:
-			w = numpy.exp(- self.beta_Int * self.State_Space["A%d"%self.N]+1)			
-		else:
-			w = numpy.exp(- self.beta_Int * self.State_Space["A%d"%self.N] - self.beta_Ext * self.State_Space["Ext"]+1)
-		update_probability = 1/(1+w)	
-		self.Update_Buffer["p"] = numpy.random.binomial(1,update_probability)
-		
-	def Plot_Data(self):
-		Total_X = []
-		Total_Y = []
-		X_Data = []
-		Y_Data = []
-		for i in range(10):
-			X_Data.append([])
-			Y_Data.append([])
-		for j in range(10): #the number of trials
-			for i in range(10):
-				Directory = "./on_Model/015_Boolean_Probability_Update/Temporal_Results/Paper_%03d/Case%03d/Link_Ext_p.txt"%(j+1,i)
-				Data_Flow = self.Read_for_(Directory)
-				Y_Data[i].append(Data_Flow["TE2"][25])
-				Total_Y.append(Data_Flow["TE2"][25])
-				
-				Directory = "./on_Model/015_Boolean_Probability_Update/Temporal_Results/Paper_%03d/Case%03d/Link_A%d_p.txt"%(j+1,i,self.N)
-				Data_Flow = self.Read_for_(Directory)
-				X_Data[i].append(Data_Flow["TE2"][24])
-				Total_X.append(Data_Flow["TE2"][24])
-		X_Mean_data = []
-		X_Std_data = []
-		Y_Mean_data = []
-		Y_Std_data = []
-		for i in range(10):
-			X_Mean_data.append(numpy.mean(X_Data[i]))
-			X_Std_data.append(numpy.std(X_Data[i]))
-			Y_Mean_data.append(numpy.mean(Y_Data[i]))
-			Y_Std_data.append(numpy.std(Y_Data[i]))
-		
-		plt.figure(figsize=(9,4))
-		plt.plot(Total_X, Total_Y, label="Estimations",marker='o', markersize = 4, markerfacecolor = 'none', linewidth = 0)
-		plt.plot(X_Mean_data, Y_Mean_data, label="Mean Curve",marker='o', markersize = 4, markerfacecolor = 'none', linewidth = 1)
-		plt.xlabel(r'$T_{A4 \to p} (t_{0})$')
-		plt.ylabel(r'$T_{Ext \to p} (t_{1})$')
-		plt.title("Competing Information Flows : "+r'$T_{A4 \to p} (t_{0})$ vs $T_{Ext \to p} (t_{1})$')
-		plt.legend()
-		plt.tight_layout()
-		plt.savefig("./on_Model/015_Boolean_Probability_Update/Temporal_Results/Figure3.png")
-		plt.close()
-	
-if __name__ == "__main__":
-	for j in range(10): #the number of trials
-		os.mkdir("./on_Model/015_Boolean_Probability_Update/Temporal_Results/Paper_%03d/"%(j+1))
-		for i in range(10):
-			print("\n Trial %03d , Case %03d"%(j+1,i))
-			TEST = Boolean_Probability_Update(n = 4, beta_Int = 1+ 0.3 * i, beta_Ext = 10)
-			TEST.Save_Directory = "./on_Model/015_Boolean_Probability_Update/Temporal_Results/Paper_%03d/Case%03d/"%(j+1,i)
-			os.mkdir(TEST.Save_Directory)
-			TEST.Initialize()		
-			TEST.Generate_Data()
-	TEST = Boolean_Probability_Update()
-	TEST.Plot_Data()
-		
+
+import time
+import random
+import numpy
+
+import os
+
+from Core import Lazy_Import
+from Core import Model_Basics
+from Core import Progress
+from Core.Estimators import Simple_Binning
+
+plt = Lazy_Import.Lazy_Module("matplotlib.pyplot")
+
+class Boolean_Probability_Update(Model_Basics.Model_Basic):
+	def __init__(self, n=4, beta_Int = 1, beta_Ext = 1):
+		super().__init__()
+		
+		self.Q = 2
+		self.N = n
+		
+		self.beta_Int = beta_Int
+		self.beta_Ext = beta_Ext
+		numpy.random.seed(int(time.time()))
+		
+		self.Simulation_Time_Limit = 40
+		self.Start_of_Interaction = 25
+		self.Size_of_Ensemble = 10000
+		
+		
+		self.Save_Directory = "./on_Model/015_Boolean_Probability_Update/Temporal_Results/"
+		
+		self.Selected_Nodes = ["p"]
+		self.Selected_Links = [("A%d"%self.N,"p"), ("Ext","p"),("p","A1")]
+		
+		
+	def Register_Properties(self):
+		self.Properties["Model_Name"] = "Boolean_Probability_Update"
+		self.Properties["Estimator"] = "Simple Binning"
+		self.Properties["Q"] = str(self.Q)
+		self.Properties["N"] = str(self.N)
+		self.Properties["beta_Int"] = str(self.beta_Int)
+		self.Properties["beta_Ext"] = str(self.beta_Ext)
+		self.Properties["Simulation_Time_Limit"] = str(self.Simulation_Time_Limit)
+		self.Properties["Start_of_Interaction"] = str(self.Start_of_Interaction)
+		self.Properties["Size_of_Ensemble"] = str(self.Size_of_Ensemble)
+		
+		self.Register_Topology()
+			
+	def Set_Topology(self):
+		index_list = ["Ext","p"]
+		for i in range(self.N):
+			index_list.append("A%d"%(i+1))
+		self.Info_Network.Set_Nodes(index_list)
+		
+		for i in range(self.N-1):
+			self.Info_Network.Add_a_Link(("A%d"%(i+1),"A%d"%(i+2)))
+			
+		self.Info_Network.Add_a_Link(("A%d"%(self.N),"p"))
+		self.Info_Network.Add_a_Link(("p","A1"))	
+		self.Info_Network.Add_a_Link(("Ext","p"))
+		
+	# Size = None draws one member, Size = n an array of n members (Vectorized).
+	def Init_State_Space(self, Size = None):
+		for k in self.Info_Network.Nodes:
+			initial_value = numpy.random.binomial(1,0.5,Size)
+			self.State_Space[k] = initial_value	
+			
+	def Init_State_Space_Vectorized(self):
+		self.Init_State_Space(self.Size_of_Ensemble)
+			
+	def Set_Estimator(self):
+		self.Estimator = Simple_Binning.Estimator(self.Q, 4)
+		self.Estimator.Source.Analysis = "Realtime"
+		
+	def Dynamics_of_States(self, t, Size = None):
+		for i in range(self.N-1):
+			self.Update_Buffer["A%d"%(i+2)] = self.State_Space["A%d"%(i+1)]
+			
+		self.Update_Buffer["A1"] = self.State_Space["p"]
+		self.Update_Buffer["Ext"] = numpy.random.binomial(1,0.5,Size)
+				
+		if t < self.Start_of_Interaction:
+			w = numpy.exp(- self.beta_Int * self.State_Space["A%d"%self.N]+1)			
+		else:
+			w = numpy.exp(- self.beta_Int * self.State_Space["A%d"%self.N] - self.beta_Ext * self.State_Space["Ext"]+1)
+		update_probability = 1/(1+w)	
+		self.Update_Buffer["p"] = numpy.random.binomial(1,update_probability)
+		
+	def Dynamics_of_States_Vectorized(self, t):
+		self.Dynamics_of_States(t, self.Size_of_Ensemble)
+		
+	def Initial_Probabilities(self):
+		return {k:[0.5, 0.5] for k in self.Info_Network.Nodes}
+		
+	def Transition_Probabilities(self, t):
+		Probabilities = {}
+		for i in range(self.N-1):
+			Probabilities["A%d"%(i+2)] = numpy.eye(2)[self.State_Space["A%d"%(i+1)]]
+		Probabilities["A1"] = numpy.eye(2)[self.State_Space["p"]]
+		Probabilities["Ext"] = [0.5, 0.5]
+		
+		if t < self.Start_of_Interaction:
+			w = numpy.exp(- self.beta_Int * self.State_Space["A%d"%self.N]+1)			
+		else:
+			w = numpy.exp(- self.beta_Int * self.State_Space["A%d"%self.N] - self.beta_Ext * self.State_Space["Ext"]+1)
+		update_probability = 1/(1+w)
+		Probabilities["p"] = [1-update_probability, update_probability]
+		return Probabilities
+		
+	def Transition_Epoch(self, t):
+		return t < self.Start_of_Interaction
+		
+	def Plot_Data(self):
+		Total_X = []
+		Total_Y = []
+		X_Data = []
+		Y_Data = []
+		for i in range(10):
+			X_Data.append([])
+			Y_Data.append([])
+		for j in range(10): #the number of trials
+			for i in range(10):
+				Directory = "./on_Model/015_Boolean_Probability_Update/Temporal_Results/Paper_%03d/Case%03d/Link_Ext_p.txt"%(j+1,i)
+				Data_Flow = self.Read_for_(Directory, Keys = ["TE2"])
+				Y_Data[i].append(Data_Flow["TE2"][25])
+				Total_Y.append(Data_Flow["TE2"][25])
+				
+				Directory = "./on_Model/015_Boolean_Probability_Update/Temporal_Results/Paper_%03d/Case%03d/Link_A%d_p.txt"%(j+1,i,self.N)
+				Data_Flow = self.Read_for_(Directory, Keys = ["TE2"])
+				X_Data[i].append(Data_Flow["TE2"][24])
+				Total_X.append(Data_Flow["TE2"][24])
+		X_Mean_data = []
+		X_Std_data = []
+		Y_Mean_data = []
+		Y_Std_data = []
+		for i in range(10):
+			X_Mean_data.append(numpy.mean(X_Data[i]))
+			X_Std_data.append(numpy.std(X_Data[i]))
+			Y_Mean_data.append(numpy.mean(Y_Data[i]))
+			Y_Std_data.append(numpy.std(Y_Data[i]))
+		
+		plt.figure(figsize=(9,4))
+		plt.plot(Total_X, Total_Y, label="Estimations",marker='o', markersize = 4, markerfacecolor = 'none', linewidth = 0)
+		plt.plot(X_Mean_data, Y_Mean_data, label="Mean Curve",marker='o', markersize = 4, markerfacecolor = 'none', linewidth = 1)
+		plt.xlabel(r'$T_{A4 \to p} (t_{0})$')
+		plt.ylabel(r'$T_{Ext \to p} (t_{1})$')
+		plt.title("Competing Information Flows : "+r'$T_{A4 \to p} (t_{0})$ vs $T_{Ext \to p} (t_{1})$')
+		plt.legend()
+		plt.tight_layout()
+		plt.savefig("./on_Model/015_Boolean_Probability_Update/Temporal_Results/Figure3.png")
+		plt.close()
+	
+if __name__ == "__main__":
+	Progress_Log = "./on_Model/015_Boolean_Probability_Update/Temporal_Results/Progress.jsonl"
+	Sweep = Progress.A_Progress_Reporter("Sweep", 10*10, "runs", Interval = 0, Log_File = Progress_Log)
+	for j in range(10): #the number of trials
+		for i in range(10):
+			print("\n Trial %03d , Case %03d"%(j+1,i))
+			TEST = Boolean_Probability_Update(n = 4, beta_Int = 1+ 0.3 * i, beta_Ext = 10)
+			TEST.Save_Directory = "./on_Model/015_Boolean_Probability_Update/Temporal_Results/Paper_%03d/Case%03d/"%(j+1,i)
+			os.makedirs(TEST.Save_Directory, exist_ok = True)
+			TEST.Progress_Log = Progress_Log
+			# A rerun continues the interrupted case and skips the completed ones (delete Checkpoint_*.pkl to start over).
+			TEST.Checkpoint_Interval = 300
+			TEST.Resume = True
+			# Runs with unchanged parameters (e.g. when cases are added to the grid) are served from the result cache.
+			TEST.Result_Cache = "./on_Model/015_Boolean_Probability_Update/Temporal_Results/Result_Cache/"
+			TEST.Replicate = j
+			TEST.Initialize()		
+			TEST.Generate_Data()
+			Sweep.Advance(Work = 1, Members = TEST.Reporter.Members, Estimations = TEST.Reporter.Estimations)
+			Sweep.Report(Final = Sweep.Work == Sweep.Total_Work)
+	TEST = Boolean_Probability_Update()
+	TEST.Plot_Data()
+		
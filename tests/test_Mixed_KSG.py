@@ -0,0 +1,29 @@
+import numpy
+
+from Core.Estimators import Mixed_KSG
+
+def Estimator_for_(Columns, Discrete_Variables):
+	Estimator = Mixed_KSG.Estimator(len(Columns[0]))
+	Estimator.Source.Variable_Names = ["X", "Y", "Z"][:len(Columns)]
+	Estimator.Source.Ensemble = numpy.column_stack(Columns).astype(float)
+	Estimator.Source.Discrete_Variables = Discrete_Variables
+	return Estimator
+
+def test_tied_samples_exclude_themselves_from_k_tilde():
+	Atoms = numpy.repeat([[0.0], [1.0]], 20, axis = 0)
+	Estimator = Estimator_for_([Atoms[:, 0]], [])
+	k_tilde, radius = Estimator._Tied_kNN_Radius([Atoms])
+	assert numpy.all(k_tilde == 19)
+	assert numpy.all(radius == 0)
+
+def test_discrete_data_matches_the_plugin_estimate():
+	RNG = numpy.random.default_rng(0)
+	N = 4000
+	X = RNG.integers(0, 3, N)
+	Y = (X + RNG.integers(0, 2, N)) % 3
+	Z = RNG.integers(0, 2, N)
+
+	Plugin = Estimator_for_([X, Y, Z], ["X", "Y", "Z"])
+	Neighbours = Estimator_for_([X, Y, Z], []) # every column through the tied kNN path
+	assert abs(Neighbours.Mutual_Information(["X", "Y"]) - Plugin.Mutual_Information(["X", "Y"])) < 0.005
+	assert abs(Neighbours.Mutual_Information(["X", "Y"], ["Z"]) - Plugin.Mutual_Information(["X", "Y"], ["Z"])) < 0.005
@@ -0,0 +1,14 @@
+import importlib
+
+Single_Cycle = importlib.import_module("on_Equations.001_A_Single_Cycle.main")
+
+def test_single_cycle_runs_end_to_end(tmp_path):
+	Model = Single_Cycle.ID_of_Single_Ring(4, Run = False)
+	Model.Simulation_Time_Limit = 5
+	Model.Save_Directory = str(tmp_path) + "/"
+	Model.Initialize()
+	Model.Generate_Data()
+
+	Rows = (tmp_path / "Link_A1_A2.txt").read_text().splitlines()
+	assert [Row[:4] for Row in Rows[1:]] == ["001:", "002:", "003:", "004:"]
+	assert (tmp_path / "Node_A1.txt").exists()
@@ -0,0 +1,20 @@
+from Core import Temporal_Results
+from Core import run
+
+def Config_for_(Backend, Directory):
+	return {
+		"model" : {"class" : "on_Model.015_Boolean_Probability_Update.main:Boolean_Probability_Update", "args" : {"n" : 2, "beta_Int" : 1.3, "beta_Ext" : 10}},
+		"overrides" : {"Simulation_Time_Limit" : 5, "Start_of_Interaction" : 2, "Size_of_Ensemble" : 20000, "Save_Directory" : Directory, "Progress_Interval" : 0},
+		"run" : {"backend" : Backend, "seed" : 1},
+	}
+
+def test_vectorized_backend_agrees_with_the_exact_one(tmp_path):
+	Values = {}
+	for Backend in ["vectorized", "exact"]:
+		Directory = str(tmp_path / Backend) + "/"
+		Model = run.Run_Job(Config_for_(Backend, Directory))
+		Times, Values[Backend] = Temporal_Results.Read_Results(Directory + "Link_Ext_p.txt")
+	assert Model.Exact_Propagation
+	assert len(Values["vectorized"]["TE2"]) == len(Values["exact"]["TE2"]) == 4
+	assert abs(Values["vectorized"]["TE2"][3] - Values["exact"]["TE2"][3]) < 0.02
+	assert Values["exact"]["TE2"][3] > 0.1